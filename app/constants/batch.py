@@ -0,0 +1,4 @@
+import os
+
+# Batch 요청 하나에 포함할 수 있는 최대 시나리오 수
+BATCH_MAX_SCENARIOS: int = int(os.environ.get("BATCH_MAX_SCENARIOS", 100))
@@ -0,0 +1,12 @@
+import os
+
+# 기본 권역 Set ID (`BOUNDARY_LOCATION`으로 초기화)
+DEFAULT_BOUNDARY_SET_ID: str = "default"
+
+# 추가 권역 Set 파일 목록 (쉼표 구분, 파일명이 Set ID)
+BOUNDARY_FILES: list[str] = [
+    path for path in os.environ.get("BOUNDARY_FILES", "").split(",") if path
+]
+
+# 요청에 포함된 권역 목록을 Content Hash 기준으로 캐싱할 최대 개수
+BOUNDARY_CACHE_SIZE: int = int(os.environ.get("BOUNDARY_CACHE_SIZE", 64))
@@ -0,0 +1,61 @@
+import os
+
+# VRoouty 서버 주소
+VROOUTY_URL: str = os.environ["VROOUTY_URL"]
+
+# Connection Pool 설정 (전체 / Host 당 최대 연결 수, Keep-Alive 유지 시간)
+VROOUTY_CONNECTION_LIMIT: int = int(os.environ.get("VROOUTY_CONNECTION_LIMIT", 100))
+VROOUTY_CONNECTION_LIMIT_PER_HOST: int = int(
+    os.environ.get("VROOUTY_CONNECTION_LIMIT_PER_HOST", 30)
+)
+VROOUTY_KEEPALIVE_TIMEOUT: float = float(
+    os.environ.get("VROOUTY_KEEPALIVE_TIMEOUT", 30)
+)
+
+# DNS Cache 유지 시간 (초)
+VROOUTY_DNS_CACHE_TTL: int = int(os.environ.get("VROOUTY_DNS_CACHE_TTL", 300))
+
+# Timeout 설정 (초)
+VROOUTY_TOTAL_TIMEOUT: float = float(os.environ.get("VROOUTY_TOTAL_TIMEOUT", 300))
+VROOUTY_CONNECT_TIMEOUT: float = float(os.environ.get("VROOUTY_CONNECT_TIMEOUT", 10))
+
+# 요청 하나에서 동시에 보내는 VRoouty 호출 수
+VROOUTY_CONCURRENCY: int = int(os.environ.get("VROOUTY_CONCURRENCY", 8))
+
+# App 전체에서 동시에 보내는 VRoouty 호출 수 (여러 요청, Batch 시나리오 공유)
+VROOUTY_GLOBAL_CONCURRENCY: int = int(os.environ.get("VROOUTY_GLOBAL_CONCURRENCY", 32))
+
+# VRoouty 결과 Cache (최대 항목 수가 0이면 미사용, 유지 시간(초), 디스크 Cache 경로)
+VROOUTY_CACHE_SIZE: int = int(os.environ.get("VROOUTY_CACHE_SIZE", 256))
+VROOUTY_CACHE_TTL: float = float(os.environ.get("VROOUTY_CACHE_TTL", 300))
+VROOUTY_CACHE_PATH: str | None = os.environ.get("VROOUTY_CACHE_PATH") or None
+
+# 동일한 VRoouty 요청이 동시에 진행 중이면 하나의 호출 결과를 공유
+VROOUTY_SINGLEFLIGHT: bool = os.environ.get("VROOUTY_SINGLEFLIGHT", "1") == "1"
+
+# 호출 1건의 전체 제한 시간 (재시도 및 Hedging 포함, 초)
+VROOUTY_DEADLINE: float = float(os.environ.get("VROOUTY_DEADLINE", 120))
+
+# 재시도 (최대 횟수, 요청 대비 재시도 비율 예산, 지수 Backoff 기준/최대 시간(초))
+VROOUTY_MAX_RETRIES: int = int(os.environ.get("VROOUTY_MAX_RETRIES", 2))
+VROOUTY_RETRY_BUDGET_RATIO: float = float(
+    os.environ.get("VROOUTY_RETRY_BUDGET_RATIO", 0.1)
+)
+VROOUTY_RETRY_BACKOFF_BASE: float = float(
+    os.environ.get("VROOUTY_RETRY_BACKOFF_BASE", 0.1)
+)
+VROOUTY_RETRY_BACKOFF_MAX: float = float(
+    os.environ.get("VROOUTY_RETRY_BACKOFF_MAX", 2)
+)
+
+# Hedging (응답이 최근 지연 시간의 백분위수를 넘기면 같은 요청을 한 번 더 보냄)
+VROOUTY_HEDGE: bool = os.environ.get("VROOUTY_HEDGE", "0") == "1"
+VROOUTY_HEDGE_PERCENTILE: float = float(
+    os.environ.get("VROOUTY_HEDGE_PERCENTILE", 95)
+)
+
+# Circuit Breaker (연속 실패 횟수, 차단 유지 시간(초))
+VROOUTY_BREAKER_THRESHOLD: int = int(os.environ.get("VROOUTY_BREAKER_THRESHOLD", 5))
+VROOUTY_BREAKER_RECOVERY: float = float(
+    os.environ.get("VROOUTY_BREAKER_RECOVERY", 30)
+)
@@ -0,0 +1,12 @@
+import os
+
+# 거리/시간 Matrix를 직접 계산하여 VRoouty 요청에 포함할지 여부
+MATRIX_ENABLED: bool = os.environ.get("MATRIX_ENABLED", "0") == "1"
+
+# 시간 계산용 평균 이동 속도 (m/s), 직선 거리 대비 도로 거리 보정 계수
+MATRIX_SPEED: float = float(os.environ.get("MATRIX_SPEED", 8.33))
+MATRIX_DETOUR_FACTOR: float = float(os.environ.get("MATRIX_DETOUR_FACTOR", 1.0))
+
+# Matrix Cache 최대 항목 수, Matrix를 만들 최대 지점 수 (초과 시 VRoouty가 직접 계산)
+MATRIX_CACHE_SIZE: int = int(os.environ.get("MATRIX_CACHE_SIZE", 32))
+MATRIX_MAX_LOCATIONS: int = int(os.environ.get("MATRIX_MAX_LOCATIONS", 1000))
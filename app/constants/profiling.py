@@ -0,0 +1,13 @@
+import os
+
+# 요청 단위 CPU Profiling 사용 여부 (미사용 시 Middleware를 등록하지 않음)
+PROFILE_ENABLED: bool = os.environ.get("PROFILE_ENABLED", "0") == "1"
+
+# Header 없이도 Profiling할 요청 비율 (0 ~ 1)
+PROFILE_SAMPLE_RATE: float = float(os.environ.get("PROFILE_SAMPLE_RATE", 0))
+
+# 최근 Profiling 결과 보관 개수
+PROFILE_BUFFER_SIZE: int = int(os.environ.get("PROFILE_BUFFER_SIZE", 50))
+
+# Profiling 요청 Header (`X-Profile: 1`)
+PROFILE_HEADER: str = "X-Profile"
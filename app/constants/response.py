@@ -0,0 +1,4 @@
+import os
+
+# 응답 Model을 response_model 재검증 없이 바로 JSON으로 직렬화
+RESPONSE_FAST_PATH: bool = os.environ.get("RESPONSE_FAST_PATH", "1") == "1"
@@ -0,0 +1,10 @@
+import os
+
+# Plan Session 최대 보관 개수, 유지 시간 (초)
+PLAN_SESSION_SIZE: int = int(os.environ.get("PLAN_SESSION_SIZE", 1000))
+PLAN_SESSION_TTL: float = float(os.environ.get("PLAN_SESSION_TTL", 43200))
+
+# 영향받은 차량 비율이 이 값을 넘으면 전체 경로를 다시 요청
+PLAN_SESSION_MAX_AFFECTED_RATIO: float = float(
+    os.environ.get("PLAN_SESSION_MAX_AFFECTED_RATIO", 0.5)
+)
@@ -0,0 +1,17 @@
+import os
+
+# Cut Off 이후 수거/배송 경로를 동시에 요청할지 여부
+AFTER_WAVE_PIPELINED: bool = os.environ.get("AFTER_WAVE_PIPELINED", "1") == "1"
+
+# Cut Off 이후 경로를 구역별로 나누어 동시에 요청 (Job 수가 기준 이상일 때)
+AFTER_WAVE_DECOMPOSE: bool = os.environ.get("AFTER_WAVE_DECOMPOSE", "0") == "1"
+AFTER_WAVE_DECOMPOSE_MIN_JOBS: int = int(
+    os.environ.get("AFTER_WAVE_DECOMPOSE_MIN_JOBS", 500)
+)
+
+# 구역 분할 기준 ("cluster" : 좌표 군집화, "group" : 권역 group_id), 최대 구역 수
+AFTER_WAVE_DECOMPOSE_BY: str = os.environ.get("AFTER_WAVE_DECOMPOSE_BY", "cluster")
+AFTER_WAVE_PARTITIONS: int = int(os.environ.get("AFTER_WAVE_PARTITIONS", 4))
+
+# 구역 경계 보정 반복 횟수 (0이면 미사용)
+AFTER_WAVE_REPAIR_ROUNDS: int = int(os.environ.get("AFTER_WAVE_REPAIR_ROUNDS", 1))
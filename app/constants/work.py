@@ -1,3 +1,4 @@
+import os
 from enum import StrEnum
 
 
@@ -48,4 +49,15 @@ class RoutingProfile(StrEnum):
 class StepType(StrEnum):
     START = "start"
     JOB = "job"
+    PICKUP = "pickup"
+    DELIVERY = "delivery"
     END = "end"
+
+
+# 수거/배송지 작업 시간 (초)
+SETUP_TIME: int = 180
+DUPLICATED_LOCATION_SETUP_TIME: int = 300
+SERVICE_TIME: int = 10
+
+# 같은 위치의 Job을 하나의 VRoouty Job으로 묶어서 요청 (준비 시간 1회 + 작업 시간 합계)
+AGGREGATE_COLOCATED_JOBS: bool = os.environ.get("AGGREGATE_COLOCATED_JOBS", "0") == "1"
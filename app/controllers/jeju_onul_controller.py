@@ -1,79 +1,169 @@
 import asyncio
 from collections import defaultdict
 from datetime import timedelta
-from typing import Literal
+from typing import AsyncIterator, Literal
+import numpy as np
 from fastapi import HTTPException
-from shapely.geometry import Polygon
+from app.constants.client import VROOUTY_CONCURRENCY
 from app.constants.vehicles import RELAY_VEHICLE_TIME
-from app.constants.work import StepType, TaskType, WorkStatus
+from app.constants.wave import (
+    AFTER_WAVE_DECOMPOSE,
+    AFTER_WAVE_DECOMPOSE_BY,
+    AFTER_WAVE_DECOMPOSE_MIN_JOBS,
+    AFTER_WAVE_PARTITIONS,
+    AFTER_WAVE_PIPELINED,
+    AFTER_WAVE_REPAIR_ROUNDS,
+)
+from app.constants.work import (
+    AGGREGATE_COLOCATED_JOBS,
+    DUPLICATED_LOCATION_SETUP_TIME,
+    SERVICE_TIME,
+    SETUP_TIME,
+    StepType,
+    TaskType,
+    WorkStatus,
+)
 from app.models.task import Task, VehicleSwaps, VehicleTasks
 from app.models.vroouty import (
     Job,
     RequestParam,
     Routes,
     Shipment,
+    Steps,
     VRooutyResponse,
     VRooutyResponses,
     Vehicle,
 )
-from app.schemas.request import JejuRequest, Work
+from app.schemas.request import JejuRequest
+from app.schemas.request import Vehicle as JejuVehicle
 from app.schemas.response import AfterResponse, BeforeResponse
 from app.utils.identity import IdHandler
-from app.utils.polygon import assign_group_id
-from app.utils.aiohttp import VRooutyRequest
+from app.utils.boundary import boundary_registry
+from app.utils.location import duplicated_location_mask
+from app.utils.polygon import BoundaryIndex
+from app.utils.aiohttp import VRooutyClient
+from app.utils.concurrency import gather_with_limit
+from app.utils.decomposition import solve_decomposed
+from app.utils.pydantic import assign_fields
+from app.utils.work_table import STATUS_CODES, WorkTable
 
 
 class JejuOnulController:
 
-    def __init__(self, request: JejuRequest) -> None:
+    def __init__(
+        self,
+        request: JejuRequest,
+        client: VRooutyClient,
+        aggregate: bool = AGGREGATE_COLOCATED_JOBS,
+    ) -> None:
         self.id_handler = IdHandler()
         self.request: JejuRequest = request
+        self.client: VRooutyClient = client
 
-        # 권역에 대한 Dict
-        group_polygons = {p.id: Polygon(p.polygon) for p in request.boundaries}
+        # 같은 위치 Job 묶음 (묶음 Job id -> 원래 Job 목록)
+        self.aggregate: bool = aggregate
+        self.aggregated_jobs: dict[int, list[Job]] = {}
 
-        pickup_location_cnt = defaultdict(int)
-        delivery_location_cnt = defaultdict(int)
+        # 주문별 수거/배송 Job ((역할, 주문 위치, 우선순위) -> Job)
+        self.work_jobs: dict[tuple[str, int, int | None], Job] = {}
 
-        # 수거 및 배송지에 대한 권역 지정
-        for work in request.works:
-            if group_id := assign_group_id(
-                location=work.pickup.location, polygons=group_polygons
-            ):
-                work.pickup.group_id = group_id
-            if group_id := assign_group_id(
-                location=work.delivery.location, polygons=group_polygons
-            ):
-                work.delivery.group_id = group_id
+        # 차량 조회용 Index
+        self.vehicles_by_id: dict[str, JejuVehicle] = {
+            vehicle.id: vehicle for vehicle in request.vehicles
+        }
+
+        # 권역에 대한 공간 Index (등록된 권역 Set 또는 요청 권역의 컴파일 캐시)
+        try:
+            boundary_index = boundary_registry.resolve(
+                boundary_set_id=request.boundary_set_id,
+                boundaries=request.boundaries,
+            )
+        except KeyError:
+            raise HTTPException(
+                400, detail=f"Unknown boundary_set_id: {request.boundary_set_id}"
+            )
 
-            pickup_location_cnt[
-                (work.pickup.location.longitude, work.pickup.location.latitude)
-            ] += 1
-            delivery_location_cnt[
-                (work.delivery.location.longitude, work.delivery.location.latitude)
-            ] += 1
+        # 주문 열(Column) 배열 (상태/권역/차량 선택용, 권역 및 작업 시간은 전처리에서 할당)
+        self.work_table = WorkTable(works=request.works, vehicles=request.vehicles)
 
-        pickup_duplicated_locations = [
-            location for location, count in pickup_location_cnt.items() if count >= 2
-        ]
-        delivery_duplicated_locations = [
-            location for location, count in delivery_location_cnt.items() if count >= 2
-        ]
+        self.preprocess_works(boundary_index=boundary_index)
 
-        # 중복 수거 및 배송지에 대한 시간 할당
-        for work in request.works:
-            work.pickup.setup_time = (
-                timedelta(seconds=300)
-                if tuple(work.pickup.location) in pickup_duplicated_locations
-                else timedelta(seconds=180)
-            )
-            work.pickup.service_time = timedelta(seconds=10)
-            work.delivery.setup_time = (
-                timedelta(seconds=300)
-                if tuple(work.delivery.location) in delivery_duplicated_locations
-                else timedelta(seconds=180)
+    # Preprocessing
+    def preprocess_works(self, boundary_index: BoundaryIndex) -> None:
+        """
+        Works의 권역 지정 및 작업 시간 할당
+        """
+        works = self.request.works
+        if not works:
+            return
+
+        table = self.work_table
+        pickup_coords = table.pickup_coords
+        delivery_coords = table.delivery_coords
+
+        # 수거 및 배송지에 대한 권역 일괄 지정
+        pickup_group_ids = boundary_index.assign(
+            longitudes=pickup_coords[:, 0], latitudes=pickup_coords[:, 1]
+        )
+        delivery_group_ids = boundary_index.assign(
+            longitudes=delivery_coords[:, 0], latitudes=delivery_coords[:, 1]
+        )
+
+        # 중복 수거 및 배송지 판별
+        pickup_duplicated = duplicated_location_mask(coords=pickup_coords)
+        delivery_duplicated = duplicated_location_mask(coords=delivery_coords)
+
+        # 주문 열 배열에 권역 및 작업 시간(초) 할당 (권역 밖이면 요청 권역 유지)
+        for role, group_ids, duplicated in (
+            ("pickup", pickup_group_ids, pickup_duplicated),
+            ("delivery", delivery_group_ids, delivery_duplicated),
+        ):
+            group_ids = group_ids.copy()
+            for index in np.flatnonzero(np.equal(group_ids, None)).tolist():
+                group_ids[index] = getattr(works[index], role).group_id
+            table.set_points(
+                role=role,
+                group_ids=group_ids,
+                setup=np.where(duplicated, DUPLICATED_LOCATION_SETUP_TIME, SETUP_TIME),
+                service=np.full(len(works), SERVICE_TIME, dtype=np.int64),
             )
-            work.delivery.service_time = timedelta(seconds=10)
+
+        # 권역 및 중복 수거/배송지에 대한 시간 할당
+        setup_time = timedelta(seconds=SETUP_TIME)
+        duplicated_setup_time = timedelta(seconds=DUPLICATED_LOCATION_SETUP_TIME)
+        service_time = timedelta(seconds=SERVICE_TIME)
+        for (
+            work,
+            pickup_group_id,
+            delivery_group_id,
+            is_pickup_duplicated,
+            is_delivery_duplicated,
+        ) in zip(
+            works,
+            pickup_group_ids,
+            delivery_group_ids,
+            pickup_duplicated,
+            delivery_duplicated,
+        ):
+            pickup_fields = {
+                "setup_time": (
+                    duplicated_setup_time if is_pickup_duplicated else setup_time
+                ),
+                "service_time": service_time,
+            }
+            if pickup_group_id:
+                pickup_fields["group_id"] = pickup_group_id
+            delivery_fields = {
+                "setup_time": (
+                    duplicated_setup_time if is_delivery_duplicated else setup_time
+                ),
+                "service_time": service_time,
+            }
+            if delivery_group_id:
+                delivery_fields["group_id"] = delivery_group_id
+
+            assign_fields(model=work.pickup, fields=pickup_fields)
+            assign_fields(model=work.delivery, fields=delivery_fields)
 
     # Support
     def mapped_task_type(self, _type: str) -> TaskType:
@@ -91,61 +181,172 @@ class JejuOnulController:
                 if task.type == TaskType.DELIVERY:
                     doned_list.append(task.work_id)
 
-        for work in self.request.works:
-            if work.id in doned_list:
-                work.status.type = WorkStatus.DONE
+        self.work_table.set_status(work_ids=doned_list, status=WorkStatus.DONE)
+
+    def work_job(
+        self,
+        role: Literal["pickup", "delivery"],
+        index: int,
+        priority: int | None = None,
+    ) -> Job:
+        """
+        주문(`WorkTable` 위치)의 수거/배송 Job
+        요청 내에서 한 번만 생성하여 모든 Wave에서 재사용
+        """
+        job = self.work_jobs.get((role, index, priority))
+        if job is None:
+            [job] = self.work_jobs_for(role=role, indices=[index], priority=priority)
+        return job
+
+    def work_jobs_for(
+        self,
+        role: Literal["pickup", "delivery"],
+        indices: list[int],
+        priority: int | None = None,
+    ) -> list[Job]:
+        """
+        주문 위치 목록의 수거/배송 Job (`work_job`의 일괄 처리 버전)
+        새로 만드는 Job의 id는 `IdHandler.set_many`로 입력 순서대로 한 번에 부여
+        """
+        table = self.work_table
+        missing = [
+            index
+            for index in dict.fromkeys(indices)
+            if (role, index, priority) not in self.work_jobs
+        ]
+        if missing:
+            if role == "pickup":
+                setup, service = table.pickup_setup, table.pickup_service
+            else:
+                setup, service = table.delivery_setup, table.delivery_service
+            job_ids = self.id_handler.set_many(
+                role, [table.works[index].id for index in missing]
+            )
+            for index, job_id in zip(missing, job_ids):
+                self.work_jobs[(role, index, priority)] = Job(
+                    id=job_id,
+                    location=getattr(table.works[index], role).location,
+                    setup=int(setup[index]),
+                    service=int(service[index]),
+                    priority=priority,
+                )
+        return [self.work_jobs[(role, index, priority)] for index in indices]
+
+    def aggregate_jobs(self, jobs: list[Job]) -> list[Job]:
+        """
+        같은 위치(및 우선순위)의 Job을 하나로 묶음 (`aggregate` 사용 시)
+        준비 시간은 한 번만, 작업 시간은 합산 (VRoouty 응답은 `expand_step`으로 복원)
+        """
+        if not self.aggregate:
+            return jobs
+
+        groups: dict[tuple, list[Job]] = {}
+        for job in jobs:
+            groups.setdefault((tuple(job.location), job.priority), []).append(job)
+        if len(groups) == len(jobs):
+            return jobs
+
+        aggregated: list[Job] = []
+        for members in groups.values():
+            if len(members) == 1:
+                aggregated.append(members[0])
+                continue
+            job_id = self.id_handler.set(
+                "aggregate", ",".join(str(member.id) for member in members)
+            )
+            self.aggregated_jobs[job_id] = members
+            aggregated.append(
+                Job(
+                    id=job_id,
+                    location=members[0].location,
+                    setup=max(member.setup for member in members),
+                    service=sum(member.service for member in members),
+                    priority=members[0].priority,
+                )
+            )
+        return aggregated
+
+    def expand_step(self, step: Steps) -> list[tuple[int, int, int, int]]:
+        """
+        Step을 원래 Job 단위의 (id, 도착 시간, 준비 시간, 작업 시간) 목록으로 복원
+        묶음 Job은 같은 위치에서 순서대로 작업 (준비 시간은 첫 Job에만)
+        """
+        members = self.aggregated_jobs.get(step.id)
+        if members is None:
+            return [(step.id, step.arrival, step.setup, step.service)]
+
+        expanded = []
+        eta, setup = step.arrival, step.setup
+        for member in members:
+            expanded.append((member.id, eta, setup, member.service))
+            eta += setup + member.service
+            setup = 0
+        return expanded
+
+    def expand_job_ids(self, job_ids: list[int]) -> list[int]:
+        """
+        묶음 Job id를 원래 Job id 목록으로 복원
+        """
+        if not self.aggregated_jobs:
+            return job_ids
+
+        expanded = []
+        for job_id in job_ids:
+            if members := self.aggregated_jobs.get(job_id):
+                expanded.extend(member.id for member in members)
+            else:
+                expanded.append(job_id)
+        return expanded
 
     async def process_reallocation(
-        self, routes: Routes, step_list: list[int], max_assemble_time: int
+        self,
+        routes: Routes,
+        step_list: list[int],
+        max_assemble_time: int,
+        shipped_works: dict[str, np.ndarray] | None = None,
     ):
-        _jobs = []
-        _vehicles = []
+        if shipped_works is None:
+            shipped_works = self.work_table.shipped_by_vehicle()
+        _, vehicle_id = self.id_handler.get_index(id=routes.vehicle)
 
-        # 재배치를 위한 작업 목록 생성
-        for work in self.request.works:
+        # 재배치 대상 주문 : 차량에 적재된 주문 + 경로상의 대기 주문 (요청 순서 유지)
+        _works: dict[int, str] = {
+            int(index): "delivery" for index in shipped_works.get(vehicle_id, ())
+        }
+        waiting = STATUS_CODES[WorkStatus.WAITING]
+        for step_id in self.expand_job_ids(job_ids=step_list):
+            _type, work_id = self.id_handler.get_index(id=step_id)
+            index = self.work_table.index.get(work_id)
             if (
-                work.status.type == WorkStatus.SHIPPED
-                and self.id_handler.get_index(id=routes.vehicle)[1]
-                == work.status.vehicle_id
+                _type == "pickup"
+                and index is not None
+                and self.work_table.status[index] == waiting
             ):
-                _jobs.append(
-                    Job(
-                        id=self.id_handler.set("delivery", work.id),
-                        location=work.delivery.location,
-                        setup=work.delivery.get_setup_time,
-                        service=work.delivery.get_service_time,
-                    )
-                )
-            elif (
-                work.status.type == WorkStatus.WAITING
-                and self.id_handler.set("pickup", work.id) in step_list
-            ):
-                _jobs.append(
-                    Job(
-                        id=self.id_handler.set("pickup", work.id),
-                        location=work.pickup.location,
-                        setup=work.pickup.get_setup_time,
-                        service=work.pickup.get_service_time,
-                        priority=1,
-                    )
-                )
+                _works.setdefault(index, "pickup")
+
+        # 재배치를 위한 작업 목록 생성
+        _jobs = []
+        for index, _type in sorted(_works.items()):
+            if _type == "delivery":
+                _jobs.append(self.work_job(role="delivery", index=index))
+            else:
+                _jobs.append(self.work_job(role="pickup", index=index, priority=1))
 
         # 재배치를 위한 차량 목록 생성
-        for vehicle in self.request.vehicles:
-            if vehicle.id == self.id_handler.get_index(id=routes.vehicle)[1]:
-                _vehicles.append(
-                    Vehicle(
-                        id=self.id_handler.set("vehicle", vehicle.id),
-                        profile=vehicle.profile,
-                        start=vehicle.current_location,
-                        end=next(iter(self.request.assemblies)).location,
-                    )
+        _vehicles = []
+        if vehicle := self.vehicles_by_id.get(vehicle_id):
+            _vehicles.append(
+                Vehicle(
+                    id=self.id_handler.set("vehicle", vehicle.id),
+                    profile=vehicle.profile,
+                    start=vehicle.current_location,
+                    end=next(iter(self.request.assemblies)).location,
                 )
-                break
+            )
 
         # VRoouty 요청 파라미터 생성 및 요청
         vroouty_request_param = RequestParam(
-            jobs=_jobs,
+            jobs=self.aggregate_jobs(jobs=_jobs),
             shipments=[],
             vehicles=_vehicles,
             distribute_options={
@@ -153,7 +354,7 @@ class JejuOnulController:
                 "custom_matrix": {"enabled": True},
             },
         )
-        response = await VRooutyRequest(param=vroouty_request_param)
+        response = await self.client.request(param=vroouty_request_param)
 
         if not response:
             raise HTTPException(500)
@@ -161,31 +362,33 @@ class JejuOnulController:
         return response
 
     def create_vehicle_tasks(self, route: Routes):
+        # 검증된 VRoouty 결과로 만드는 값이므로 응답 Model은 재검증 없이 생성
         tasks = []
 
         # 경로의 각 단계를 처리하여 작업 목록 생성
         for step in route.steps:
             if step.type in [TaskType.JOB, TaskType.PICKUP, TaskType.DELIVERY]:
-                _type, work_id = self.id_handler.get_index(id=step.id)
-                if _type in [
-                    TaskType.PICKUP,
-                    TaskType.SHIPMENT_PICKUP,
-                    TaskType.DELIVERY,
-                    TaskType.SHIPMENT_DELIVERY,
-                ]:
-                    tasks.append(
-                        Task(
-                            work_id=work_id,
-                            type=TaskType(_type),
-                            eta=step.arrival,
-                            duration=step.duration,
-                            distance=step.distance,
-                            setup_time=step.setup,
-                            service_time=step.service,
-                            assembly_id=None,
-                            location=step.location,
+                for job_id, eta, setup, service in self.expand_step(step=step):
+                    _type, work_id = self.id_handler.get_index(id=job_id)
+                    if _type in [
+                        TaskType.PICKUP,
+                        TaskType.SHIPMENT_PICKUP,
+                        TaskType.DELIVERY,
+                        TaskType.SHIPMENT_DELIVERY,
+                    ]:
+                        tasks.append(
+                            Task(
+                                work_id=work_id,
+                                type=TaskType(_type),
+                                eta=eta,
+                                duration=step.duration,
+                                distance=step.distance,
+                                setup_time=setup,
+                                service_time=service,
+                                assembly_id=None,
+                                location=step.location,
+                            )
                         )
-                    )
             elif step.type == TaskType.END:
                 tasks.append(
                     Task(
@@ -201,175 +404,241 @@ class JejuOnulController:
                 )
         # 작업 목록을 VehicleTasks 객체에 추가
         _, vehicle_id = self.id_handler.get_index(id=route.vehicle)
-        return [VehicleTasks(vehicle_id=vehicle_id, tasks=tasks)]
-
-    # Waves
-    async def process_wave_before_cut_off(self) -> VRooutyResponse:
-        responses = {}
-
-        # 배송 기사에 대한 주문건 Mapping 변수 초기화
-        vehicle_to_works: dict[str, list[Work]] = {
-            vehicle.id: [] for vehicle in self.request.vehicles
-        }
-
-        # 권역에 대한 배송기사 Mapping 변수 초기화
-        group_to_vehicles: dict[str, str] = {
-            group_id: vehicle.id
-            for vehicle in self.request.vehicles
-            for group_id in vehicle.include
-        }
-
-        # 배송 기사의 권역에 따라 주문건 배정
-        for work in self.request.works:
-            if work.exception:
-                vehicle_to_works[work.fix_vehicle_id].append(work)
-            else:
-                _vehicle_id = group_to_vehicles[work.pickup.group_id]
-                vehicle_to_works[_vehicle_id].append(work)
-
-        # Async 처리 요청을 위한 리스트
-        tasks = []
-
-        # VRoouty Call을 위한 Request 생성
-        for vehicle in self.request.vehicles:
-            _jobs: list[Job] = []
-            _shipments: list[Shipment] = []
-            _vehicles: list[Vehicle] = []
-
-            # Job 데이터 생성
-            _jobs.extend(
-                [
-                    Job(
-                        id=self.id_handler.set("pickup", work.id),
-                        location=work.pickup.location,
-                        setup=work.pickup.get_setup_time,
-                        service=work.pickup.get_service_time,
-                    )
-                    for work in vehicle_to_works[vehicle.id]
-                    if work.status.type == TaskType.WAITING
-                ]
+        return [VehicleTasks.model_construct(vehicle_id=vehicle_id, tasks=tasks)]
+
+    def build_relay_request_param(
+        self, vehicle: JejuVehicle, work_indices: np.ndarray
+    ) -> RequestParam:
+        """
+        이어받기(Relay) 재배차용 파라미터 생성 (work_indices : 차량 담당 주문 위치)
+        - 대기 주문 : 수거/배송지가 모두 담당 권역이면 Shipment, 아니면 수거 Job
+        - 적재 주문 : 배송지가 담당 권역이면 배송 Job
+        """
+        table = self.work_table
+        status = table.status[work_indices]
+        waiting = status == STATUS_CODES[WorkStatus.WAITING]
+        delivery_included = table.in_groups(
+            role="delivery", group_ids=vehicle.include, indices=work_indices
+        )
+        shipment = (
+            waiting
+            & ~table.in_groups(
+                role="pickup", group_ids=vehicle.exclude, indices=work_indices
+            )
+            & table.in_groups(
+                role="pickup", group_ids=vehicle.include, indices=work_indices
             )
+            & delivery_included
+        )
+        delivery = (status == STATUS_CODES[WorkStatus.SHIPPED]) & delivery_included
+
+        _jobs: list[Job] = []
+        _shipments: list[Shipment] = []
+        for position in np.flatnonzero(waiting | delivery).tolist():
+            index = int(work_indices[position])
+            if shipment[position]:
+                _shipments.append(
+                    Shipment(
+                        pickup=self.work_job(role="pickup", index=index),
+                        delivery=self.work_job(role="delivery", index=index),
+                    )
+                )
+            elif waiting[position]:
+                _jobs.append(self.work_job(role="pickup", index=index))
+            else:
+                _jobs.append(self.work_job(role="delivery", index=index))
 
-            # Vehicle 데이터 생성
-            _vehicles.append(
+        return RequestParam(
+            jobs=self.aggregate_jobs(jobs=_jobs),
+            shipments=_shipments,
+            vehicles=[
                 Vehicle(
                     id=self.id_handler.set("vehicle", vehicle.id),
                     profile=vehicle.profile,
                     start=vehicle.current_location,
                 )
+            ],
+            distribute_options={"custom_matrix": {"enabled": True}},
+        )
+
+    def assign_vehicle_works(self) -> dict[str, np.ndarray]:
+        """
+        배송 기사의 권역(또는 지정 차량)에 따라 주문건 배정 (차량별 주문 위치)
+        """
+        table = self.work_table
+        owners = table.owners(vehicles=self.request.vehicles)
+
+        # 담당 차량이 없는 주문 (등록되지 않은 지정 차량 또는 담당 차량이 없는 권역)
+        if (unassigned := np.flatnonzero(owners < 0)).size:
+            work = table.works[unassigned[0]]
+            raise KeyError(
+                work.fix_vehicle_id if work.exception else work.pickup.group_id
             )
 
-            # Job이 없다면 Process 중지
-            if not _jobs:
-                continue
+        return table.split_by_vehicle(indices=np.arange(len(table)), vehicles=owners)
 
-            # VRoouty Call을 위한 Request Parameter 생성
-            vroouty_request_param = RequestParam(
-                jobs=_jobs,
-                shipments=_shipments,
-                vehicles=_vehicles,
-                distribute_options={"custom_matrix": {"enabled": True}},
+    def build_wave_before_cut_off_params(
+        self, vehicle_to_works: dict[str, np.ndarray]
+    ) -> list[tuple[JejuVehicle, RequestParam]]:
+        """
+        차량별 수거 경로 요청 생성 (대기 주문이 없는 차량 제외)
+        """
+        params: list[tuple[JejuVehicle, RequestParam]] = []
+        for vehicle in self.request.vehicles:
+            # Job 데이터 생성
+            _works = self.work_table.with_status(
+                condition=[WorkStatus.WAITING], indices=vehicle_to_works[vehicle.id]
             )
-            tasks.append((vehicle.id, VRooutyRequest(param=vroouty_request_param)))
 
-        results = await asyncio.gather(*[task[1] for task in tasks])
-
-        # 요청 결과에 대한 처리
-        for vehicle_id, result in zip([task[0] for task in tasks], results):
-            if not result:
+            # Job이 없다면 Process 중지
+            if not len(_works):
                 continue
 
-            # 각 차량의 배차 결과가 30분 이내에 완료될 시 부권역과 Delivery 추가 후 재배차
-            if RELAY_VEHICLE_TIME > next(
+            params.append(
+                (
+                    vehicle,
+                    RequestParam(
+                        jobs=self.aggregate_jobs(
+                            jobs=self.work_jobs_for(
+                                role="pickup", indices=_works.tolist()
+                            )
+                        ),
+                        shipments=[],
+                        vehicles=[
+                            Vehicle(
+                                id=self.id_handler.set("vehicle", vehicle.id),
+                                profile=vehicle.profile,
+                                start=vehicle.current_location,
+                            )
+                        ],
+                        distribute_options={"custom_matrix": {"enabled": True}},
+                    ),
+                )
+            )
+        return params
+
+    # Waves
+    async def solve_vehicle_before_cut_off(
+        self, vehicle: JejuVehicle, param: RequestParam, work_indices: np.ndarray
+    ) -> VRooutyResponse | None:
+        """
+        차량 하나의 수거 경로 요청
+        30분 이내에 완료되면 부권역과 Delivery 추가 후 재배차 (결과 대체)
+        """
+        result = await self.client.request(param=param)
+        if not result:
+            return None
+
+        end_time = next(
+            (
                 step.arrival
                 for route in result.routes
                 for step in route.steps
                 if step.type == StepType.END
-            ):
-                _jobs.clear()
-                for work in vehicle_to_works[vehicle_id]:
-                    if work.status.type == WorkStatus.WAITING:
-                        if work.pickup.group_id in vehicle.exclude:
-                            _jobs.append(
-                                Job(
-                                    id=self.id_handler.set("pickup", work.id),
-                                    location=work.pickup.location,
-                                    setup=work.pickup.get_setup_time,
-                                    service=work.pickup.get_service_time,
-                                )
-                            )
-                        if (
-                            work.pickup.group_id in vehicle.include
-                            and work.delivery.group_id in vehicle.include
-                        ):
-                            _shipments.append(
-                                Shipment(
-                                    pickup=Job(
-                                        id=self.id_handler.set("pickup", work.id),
-                                        location=work.pickup.location,
-                                        setup=work.pickup.get_setup_time,
-                                        service=work.pickup.get_service_time,
-                                    ),
-                                    delivery=Job(
-                                        id=self.id_handler.set("delivery", work.id),
-                                        location=work.delivery.location,
-                                        setup=work.delivery.get_setup_time,
-                                        service=work.delivery.get_service_time,
-                                    ),
-                                )
-                            )
-                            continue
-                        _jobs.append(
-                            Job(
-                                id=self.id_handler.set("pickup", work.id),
-                                location=work.pickup.location,
-                                setup=work.pickup.get_setup_time,
-                                service=work.pickup.get_service_time,
-                            )
-                        )
-                    elif (
-                        work.status.type == WorkStatus.SHIPPED
-                        and work.delivery.group_id in vehicle.include
-                    ):
-                        _jobs.append(
-                            Job(
-                                id=self.id_handler.set("delivery", work.id),
-                                location=work.delivery.location,
-                                setup=work.delivery.get_setup_time,
-                                service=work.delivery.get_service_time,
-                            )
-                        )
-                    vroouty_request_param = RequestParam(
-                        jobs=_jobs,
-                        shipments=_shipments,
-                        vehicles=_vehicles,
-                        distribute_options={"custom_matrix": {"enabled": True}},
-                    )
-                    response = await VRooutyRequest(param=vroouty_request_param)
+            ),
+            RELAY_VEHICLE_TIME,
+        )
+        if end_time >= RELAY_VEHICLE_TIME:
+            return result
+
+        relay_result = await self.client.request(
+            param=self.build_relay_request_param(
+                vehicle=vehicle, work_indices=work_indices
+            )
+        )
+        if not relay_result:
+            raise HTTPException(500)
+        return relay_result
+
+    async def process_wave_before_cut_off(self) -> VRooutyResponse:
+        vehicle_to_works = self.assign_vehicle_works()
+        params = self.build_wave_before_cut_off_params(
+            vehicle_to_works=vehicle_to_works
+        )
+
+        # 차량별 수거 경로 요청 (재배차 포함)
+        results = await gather_with_limit(
+            [
+                self.solve_vehicle_before_cut_off(
+                    vehicle=vehicle,
+                    param=param,
+                    work_indices=vehicle_to_works[vehicle.id],
+                )
+                for vehicle, param in params
+            ],
+            limit=VROOUTY_CONCURRENCY,
+        )
+        return VRooutyResponses(
+            root={
+                vehicle.id: result
+                for (vehicle, _), result in zip(params, results)
+                if result
+            }
+        )
 
-                if not response:
-                    raise HTTPException(500)
+    async def stream_wave_before_cut_off(
+        self, concurrency: int = VROOUTY_CONCURRENCY
+    ) -> AsyncIterator[VehicleTasks]:
+        """
+        차량별 수거 경로를 요청이 끝나는 순서대로 반환
+        (수거 대상이 없는 차량은 빈 작업 목록으로 먼저 반환)
+        """
+        vehicle_to_works = self.assign_vehicle_works()
+        params = self.build_wave_before_cut_off_params(
+            vehicle_to_works=vehicle_to_works
+        )
 
-            responses[vehicle_id] = result
-        return VRooutyResponses(root=responses)
+        requested = {vehicle.id for vehicle, _ in params}
+        for vehicle in self.request.vehicles:
+            if vehicle.id not in requested:
+                yield VehicleTasks.model_construct(vehicle_id=vehicle.id, tasks=[])
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def solve(
+            vehicle: JejuVehicle, param: RequestParam
+        ) -> tuple[JejuVehicle, VRooutyResponse | None]:
+            async with semaphore:
+                return vehicle, await self.solve_vehicle_before_cut_off(
+                    vehicle=vehicle,
+                    param=param,
+                    work_indices=vehicle_to_works[vehicle.id],
+                )
 
-    async def process_wave_after_cut_off(
+        pending = [
+            asyncio.ensure_future(solve(vehicle=vehicle, param=param))
+            for vehicle, param in params
+        ]
+        try:
+            for future in asyncio.as_completed(pending):
+                vehicle, response = await future
+                yield self.make_vehicle_before_tasks(
+                    vehicle=vehicle, response=response
+                )
+        finally:
+            # 연결이 끊기거나 오류가 나면 남은 요청 취소
+            for future in pending:
+                future.cancel()
+
+    def build_wave_after_cut_off_param(
         self,
         job_status_condition: callable,
         vehicle_start_location: callable,
         prefix: Literal["pickup", "delivery"],
-    ) -> VRooutyResponse:
+        work_indices: np.ndarray | None = None,
+        vehicles: list[JejuVehicle] | None = None,
+    ) -> RequestParam:
+        """
+        work_indices, vehicles : 일부 주문(위치)/차량만 요청할 때 지정 (기본값은 요청 전체)
+        """
+        if vehicles is None:
+            vehicles = self.request.vehicles
+
         # Job 데이터 생성
-        _jobs = [
-            Job(
-                id=self.id_handler.set(prefix, work.id),
-                location=getattr(work, prefix).location,
-                setup=getattr(work, prefix).get_setup_time,
-                service=getattr(work, prefix).get_service_time,
-            )
-            for work in self.request.works
-            if job_status_condition(work.status.type)
-        ]
+        _works = self.work_table.with_status(
+            condition=job_status_condition, indices=work_indices
+        )
+        _jobs = self.work_jobs_for(role=prefix, indices=_works.tolist())
 
         # Vehicle 데이터 생성
         if prefix == "pickup":
@@ -380,7 +649,7 @@ class JejuOnulController:
                     start=vehicle_start_location(vehicle),
                     end=next(iter(self.request.assemblies)).location,
                 )
-                for vehicle in self.request.vehicles
+                for vehicle in vehicles
             ]
         elif prefix == "delivery":
             _vehicles = [
@@ -389,14 +658,14 @@ class JejuOnulController:
                     profile=vehicle.profile,
                     start=next(iter(self.request.assemblies)).location,
                 )
-                for vehicle in self.request.vehicles
+                for vehicle in vehicles
             ]
         else:
             _vehicles = []
 
         # VRoouty 요청 파라미터 생성
-        vroouty_request_param = RequestParam(
-            jobs=_jobs,
+        return RequestParam(
+            jobs=self.aggregate_jobs(jobs=_jobs),
             shipments=[],
             vehicles=_vehicles,
             distribute_options={
@@ -404,78 +673,236 @@ class JejuOnulController:
                 "custom_matrix": {"enabled": True},
             },
         )
-        response = await VRooutyRequest(param=vroouty_request_param)
+
+    def job_group_labels(self, param: RequestParam) -> np.ndarray:
+        """
+        Job별 권역(group_id) 번호 (묶음 Job은 첫 Job 기준)
+        """
+        group_ids = []
+        for job in param.jobs:
+            role, work_id = self.id_handler.get_index(
+                id=self.expand_job_ids(job_ids=[job.id])[0]
+            )
+            work = self.work_table.works[self.work_table.index[work_id]]
+            group_ids.append(str(getattr(work, role).group_id))
+        _, labels = np.unique(np.array(group_ids), return_inverse=True)
+        return labels
+
+    async def request_wave(
+        self, param: RequestParam, decompose: bool = AFTER_WAVE_DECOMPOSE
+    ) -> VRooutyResponse:
+        """
+        Cut Off 이후 경로 요청
+        decompose : Job 수가 기준 이상이면 구역별로 나누어 동시에 요청한 뒤 결과를 합침
+        """
+        if decompose and len(param.jobs) >= AFTER_WAVE_DECOMPOSE_MIN_JOBS:
+            response = await solve_decomposed(
+                param=param,
+                solve=self.client.request,
+                n_partitions=AFTER_WAVE_PARTITIONS,
+                labels=(
+                    self.job_group_labels(param=param)
+                    if AFTER_WAVE_DECOMPOSE_BY == "group"
+                    else None
+                ),
+                repair_rounds=AFTER_WAVE_REPAIR_ROUNDS,
+                concurrency=VROOUTY_CONCURRENCY,
+            )
+        else:
+            response = await self.client.request(param=param)
 
         if not response:
             raise HTTPException(500)
 
         return response
 
-        # Job 데이터 생성
-        _jobs = [
-            Job(
-                id=self.id_handler.set("delivery", work.id),
-                location=work.pickup.location,
-                setup=work.pickup.get_setup_time,
-                service=work.pickup.get_service_time,
+    async def process_wave_after_cut_off(
+        self,
+        job_status_condition: callable,
+        vehicle_start_location: callable,
+        prefix: Literal["pickup", "delivery"],
+    ) -> VRooutyResponse:
+        return await self.request_wave(
+            param=self.build_wave_after_cut_off_param(
+                job_status_condition=job_status_condition,
+                vehicle_start_location=vehicle_start_location,
+                prefix=prefix,
             )
-            for work in self.request.works
-            if work.status.type != WorkStatus.DONE
-        ]
+        )
 
-        # Vehicle 데이터 생성
+    async def process_waves_after_cut_off(
+        self, pipelined: bool = AFTER_WAVE_PIPELINED
+    ) -> tuple[VRooutyResponse, VRooutyResponse]:
+        """
+        Cut Off 이후 수거 및 배송 경로 요청
+        pipelined : 두 요청을 동시에 보냄 (배송 요청은 수거 결과를 사용하지 않음)
+        """
         assembly_location = next(iter(self.request.assemblies)).location
-        _vehicles = [
-            Vehicle(
-                id=self.id_handler.set("vehicle", vehicle.id),
-                profile=vehicle.profile,
-                start=assembly_location,
+        pickup_options = {
+            "job_status_condition": lambda status: status == WorkStatus.WAITING.value,
+            "vehicle_start_location": lambda vehicle: vehicle.current_location,
+            "prefix": "pickup",
+        }
+        delivery_options = {
+            "job_status_condition": lambda status: status != WorkStatus.DONE.value,
+            "vehicle_start_location": lambda vehicle: assembly_location,
+            "prefix": "delivery",
+        }
+
+        if not pipelined:
+            to_pickup_result = await self.process_wave_after_cut_off(**pickup_options)
+            to_delivery_result = await self.process_wave_after_cut_off(
+                **delivery_options
             )
-            for vehicle in self.request.vehicles
-        ]
+            return to_pickup_result, to_delivery_result
+
+        # 배송 요청은 수거 결과 반영 전의 주문 상태/적재 차량으로 미리 생성
+        # 수거 요청 중 해당 열이 바뀌면 (데이터 의존성 발생) 배송 경로는 순차 방식으로 재요청
+        # (순차 방식과 같은 결과인지는 `benchmarks.bench_waves`에서 확인)
+        table = self.work_table
+        status, vehicle = table.status.copy(), table.vehicle.copy()
+        pickup_param = self.build_wave_after_cut_off_param(**pickup_options)
+        delivery_param = self.build_wave_after_cut_off_param(**delivery_options)
+        to_pickup_result, to_delivery_result = await asyncio.gather(
+            self.request_wave(param=pickup_param),
+            self.request_wave(param=delivery_param),
+        )
+        if not (
+            np.array_equal(table.status, status)
+            and np.array_equal(table.vehicle, vehicle)
+        ):
+            to_delivery_result = await self.process_wave_after_cut_off(
+                **delivery_options
+            )
+        return to_pickup_result, to_delivery_result
 
-        # VRoouty 요청 파라미터 생성
-        vroouty_request_param = RequestParam(
-            jobs=_jobs,
-            vehicles=_vehicles,
-            distribute_options={
-                "equalize_work_time": {"enabled": True},
-                "custom_matrix": {"enabled": True},
-            },
+    async def reoptimize_after_cut_off(
+        self,
+        previous: AfterResponse,
+        pickup_assignment: dict[str, str],
+        delivery_assignment: dict[str, str],
+        pickup_vehicle_ids: set[str],
+        delivery_vehicle_ids: set[str],
+    ) -> AfterResponse:
+        """
+        이전 Cut Off 이후 경로에서 영향을 받은 차량만 다시 요청하여 결과 갱신
+        pickup/delivery_assignment : 주문별 담당 차량 (수거 / 배송)
+        pickup/delivery_vehicle_ids : 다시 요청할 차량 (수거 / 배송)
+        """
+        assembly_location = next(iter(self.request.assemblies)).location
+        vehicle_order = {
+            vehicle.id: index for index, vehicle in enumerate(self.request.vehicles)
+        }
+
+        def restricted(assignment: dict[str, str], vehicle_ids: set[str]):
+            index = self.work_table.index
+            return (
+                np.array(
+                    sorted(
+                        index[work_id]
+                        for work_id, vehicle_id in assignment.items()
+                        if vehicle_id in vehicle_ids and work_id in index
+                    ),
+                    dtype=np.intp,
+                ),
+                [
+                    vehicle
+                    for vehicle in self.request.vehicles
+                    if vehicle.id in vehicle_ids
+                ],
+            )
+
+        async def solve(param: RequestParam, vehicles: list) -> VRooutyResponse | None:
+            if not vehicles or not param.jobs:
+                return None
+            return await self.request_wave(param=param)
+
+        # 영향받은 차량의 주문으로만 수거/배송 경로 요청 (요청 시점의 상태 기준)
+        pickup_works, pickup_vehicles = restricted(
+            assignment=pickup_assignment, vehicle_ids=pickup_vehicle_ids
+        )
+        delivery_works, delivery_vehicles = restricted(
+            assignment=delivery_assignment, vehicle_ids=delivery_vehicle_ids
+        )
+        pickup_param = self.build_wave_after_cut_off_param(
+            job_status_condition=lambda status: status == WorkStatus.WAITING.value,
+            vehicle_start_location=lambda vehicle: vehicle.current_location,
+            prefix="pickup",
+            work_indices=pickup_works,
+            vehicles=pickup_vehicles,
+        )
+        delivery_param = self.build_wave_after_cut_off_param(
+            job_status_condition=lambda status: status != WorkStatus.DONE.value,
+            vehicle_start_location=lambda vehicle: assembly_location,
+            prefix="delivery",
+            work_indices=delivery_works,
+            vehicles=delivery_vehicles,
+        )
+        to_pickup_result, to_delivery_result = await asyncio.gather(
+            solve(param=pickup_param, vehicles=pickup_vehicles),
+            solve(param=delivery_param, vehicles=delivery_vehicles),
         )
-        response = await VRooutyRequest(param=vroouty_request_param)
 
-        if not response:
-            raise HTTPException(500)
+        # 다시 요청하지 않은 차량은 기존 수거 경로 유지 (집결 시간은 재할당 기준에 반영)
+        before_tasks = [
+            vehicle_tasks
+            for vehicle_tasks in previous.before_tasks
+            if vehicle_tasks.vehicle_id not in pickup_vehicle_ids
+        ]
+        await self.before_task_delivery_done(vehicle_tasks=before_tasks)
+        if to_pickup_result:
+            before_tasks += await self.make_pickup_response(
+                response=to_pickup_result,
+                min_assemble_time=max(
+                    (
+                        task.eta
+                        for vehicle_tasks in before_tasks
+                        for task in vehicle_tasks.tasks
+                        if task.type == TaskType.ARRIVAL
+                    ),
+                    default=0,
+                ),
+            )
 
-        return response
+        after_tasks = [
+            vehicle_tasks
+            for vehicle_tasks in previous.after_tasks
+            if vehicle_tasks.vehicle_id not in delivery_vehicle_ids
+        ]
+        if to_delivery_result:
+            after_tasks += await self.make_delivery_response(
+                response=to_delivery_result
+            )
 
-    # Response Processing
-    async def make_before_wave_response(
-        self, responses: VRooutyResponse
-    ) -> BeforeResponse:
-        tasks: list[VehicleTasks] = []
-        unassigned: list = []
+        # 기존 차량 순서대로 정렬 후 Swap 재계산
+        before_tasks.sort(key=lambda tasks: vehicle_order.get(tasks.vehicle_id, 0))
+        after_tasks.sort(key=lambda tasks: vehicle_order.get(tasks.vehicle_id, 0))
+        return await self.make_combine_after_response(
+            before_tasks=before_tasks, after_tasks=after_tasks
+        )
 
-        vehicle_dict = {str(vehicle.id): vehicle for vehicle in self.request.vehicles}
+    # Response Processing
+    def make_vehicle_before_tasks(
+        self, vehicle: JejuVehicle, response: VRooutyResponse | None
+    ) -> VehicleTasks:
+        """
+        차량 하나의 Cut Off 이전 작업 목록
+        """
         assemblies_dict = {
             tuple(assembly.location): assembly for assembly in self.request.assemblies
         }
-
-        for vehicle_id, vehicle in vehicle_dict.items():
-            _tasks: list[Task] = []
-
-            response: Routes = responses.root.get(vehicle_id, None)
-
-            if response:
-                for route in response.routes:
-                    for step in route.steps:
-                        if step.type in [
-                            TaskType.JOB,
-                            TaskType.PICKUP,
-                            TaskType.DELIVERY,
-                        ]:
-                            _type, work_id = self.id_handler.get_index(id=step.id)
+        _tasks: list[Task] = []
+
+        if response:
+            for route in response.routes:
+                for step in route.steps:
+                    if step.type in [
+                        TaskType.JOB,
+                        TaskType.PICKUP,
+                        TaskType.DELIVERY,
+                    ]:
+                        for job_id, eta, setup, service in self.expand_step(step=step):
+                            _type, work_id = self.id_handler.get_index(id=job_id)
                             if _type in [
                                 TaskType.PICKUP,
                                 TaskType.SHIPMENT_PICKUP,
@@ -486,61 +913,92 @@ class JejuOnulController:
                                     Task(
                                         work_id=work_id,
                                         type=TaskType(_type),
-                                        eta=step.arrival,
+                                        eta=eta,
                                         duration=step.duration,
                                         distance=step.distance,
-                                        setup_time=step.setup,
-                                        service_time=step.service,
+                                        setup_time=setup,
+                                        service_time=service,
                                         assembly_id=None,
                                         location=step.location,
                                     )
                                 )
-                        elif step.type == TaskType.END:
-                            if assemblies_dict.get(tuple(step.location), None):
-                                _tasks.append(
-                                    Task(
-                                        work_id=None,
-                                        type=TaskType.ARRIVAL,
-                                        eta=step.arrival,
-                                        duration=step.duration,
-                                        setup_time=step.setup,
-                                        service_time=step.service,
-                                        assembly_id=None,
-                                        location=step.location,
-                                    )
+                    elif step.type == TaskType.END:
+                        if assemblies_dict.get(tuple(step.location), None):
+                            _tasks.append(
+                                Task(
+                                    work_id=None,
+                                    type=TaskType.ARRIVAL,
+                                    eta=step.arrival,
+                                    duration=step.duration,
+                                    setup_time=step.setup,
+                                    service_time=step.service,
+                                    assembly_id=None,
+                                    location=step.location,
                                 )
-            tasks.append(
-                VehicleTasks(
-                    vehicle_id=vehicle.id,
-                    tasks=_tasks,
-                )
+                            )
+
+        return VehicleTasks.model_construct(vehicle_id=vehicle.id, tasks=_tasks)
+
+    async def make_before_wave_response(
+        self, responses: VRooutyResponse
+    ) -> BeforeResponse:
+        tasks: list[VehicleTasks] = [
+            self.make_vehicle_before_tasks(
+                vehicle=vehicle, response=responses.root.get(str(vehicle.id), None)
             )
+            for vehicle in self.request.vehicles
+        ]
+        unassigned: list = []
 
-        return BeforeResponse(
+        return BeforeResponse.model_construct(
             vehicle_tasks=tasks,
             unassigned=unassigned,
         )
 
     async def make_pickup_response(
-        self, response: VRooutyResponse
+        self,
+        response: VRooutyResponse,
+        concurrency: int = VROOUTY_CONCURRENCY,
+        min_assemble_time: int = 0,
     ) -> list[VehicleTasks]:
+        """
+        min_assemble_time : 요청하지 않은 차량의 집결 시간 (일부 차량만 다시 요청할 때)
+        """
         vehicle_tasks: list[VehicleTasks] = []
 
         # 각 경로의 마지막 단계 도착 시간을 수집
         assemble_times = [route.steps[-1].arrival for route in response.routes]
-        max_assemble_time = max(assemble_times)
-
-        for route in response.routes:
-            # Job의 step ID를 수집
-            step_list = [step.id for step in route.steps if step.type == StepType.JOB]
-
-            # 마지막 step 도착 시간이 최대 집결 시간보다 작으면 재배차
-            if route.steps[-1].arrival < max_assemble_time:
-                reallocated_response = await self.process_reallocation(
-                    routes=route,
-                    step_list=step_list,
+        max_assemble_time = max([*assemble_times, min_assemble_time])
+
+        # 마지막 step 도착 시간이 최대 집결 시간보다 작은 경로는 재배차 (동시 요청)
+        shipped_works = self.work_table.shipped_by_vehicle()
+        reallocation_indexes = [
+            index
+            for index, route in enumerate(response.routes)
+            if route.steps[-1].arrival < max_assemble_time
+        ]
+        reallocated_responses = await gather_with_limit(
+            [
+                self.process_reallocation(
+                    routes=response.routes[index],
+                    # Job의 step ID를 수집
+                    step_list=[
+                        step.id
+                        for step in response.routes[index].steps
+                        if step.type == StepType.JOB
+                    ],
                     max_assemble_time=max_assemble_time,
+                    shipped_works=shipped_works,
                 )
+                for index in reallocation_indexes
+            ],
+            limit=concurrency,
+        )
+        reallocated = dict(zip(reallocation_indexes, reallocated_responses))
+
+        # 기존 경로 순서대로 결과 조합
+        for index, route in enumerate(response.routes):
+            if reallocated_response := reallocated.get(index):
                 _vehicle_tasks = []
                 for reallocated_route in reallocated_response.routes:
                     _vehicle_tasks.extend(
@@ -573,34 +1031,41 @@ class JejuOnulController:
         swaps: list[VehicleSwaps] = []
         end_time = []
 
+        # 차량별 수거/배송 작업 목록 및 적재 주문
+        before_by_vehicle: dict[str, list[VehicleTasks]] = defaultdict(list)
+        for vehicle_tasks in before_tasks:
+            before_by_vehicle[vehicle_tasks.vehicle_id].append(vehicle_tasks)
+        after_by_vehicle: dict[str, list[VehicleTasks]] = defaultdict(list)
+        for deliver_tasks in after_tasks:
+            after_by_vehicle[deliver_tasks.vehicle_id].append(deliver_tasks)
+        shipped_works = self.work_table.shipped_by_vehicle()
+        works = self.work_table.works
+
         for vehicle in self.request.vehicles:
             shipped_tasks = []
             need_tasks = []
 
-            for vehicle_tasks in before_tasks:
-                if vehicle_tasks.vehicle_id == vehicle.id:
-                    for task in vehicle_tasks.tasks:
-                        if task.work_id:
-                            shipped_tasks.append(task.work_id)
-                        if task.type == TaskType.ARRIVAL:
-                            end_time.append(task.eta)
-
-            for work in self.request.works:
-                if work.status.type == WorkStatus.SHIPPED:
-                    if work.status.vehicle_id == vehicle.id:
-                        shipped_tasks.append(work.id)
-
-            for deliver_tasks in after_tasks:
-                if deliver_tasks.vehicle_id == vehicle.id:
-                    for task in deliver_tasks.tasks:
-                        if task.work_id:
-                            need_tasks.append(task.work_id)
+            for vehicle_tasks in before_by_vehicle.get(vehicle.id, []):
+                for task in vehicle_tasks.tasks:
+                    if task.work_id:
+                        shipped_tasks.append(task.work_id)
+                    if task.type == TaskType.ARRIVAL:
+                        end_time.append(task.eta)
+
+            shipped_tasks.extend(
+                works[index].id for index in shipped_works[vehicle.id].tolist()
+            )
+
+            for deliver_tasks in after_by_vehicle.get(vehicle.id, []):
+                for task in deliver_tasks.tasks:
+                    if task.work_id:
+                        need_tasks.append(task.work_id)
 
             up = list(set(need_tasks) - set(shipped_tasks))
             down = list(set(shipped_tasks) - set(need_tasks))
 
             swaps.append(
-                VehicleSwaps(
+                VehicleSwaps.model_construct(
                     vehicle_id=vehicle.id,
                     assembly_id=next(iter(self.request.assemblies)).id,
                     stop_over_time=0,
@@ -612,6 +1077,6 @@ class JejuOnulController:
         for swap in swaps:
             swap.stop_over_time = max(end_time)
 
-        return AfterResponse(
+        return AfterResponse.model_construct(
             before_tasks=before_tasks, after_tasks=after_tasks, swaps=swaps
         )
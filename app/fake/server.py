@@ -0,0 +1,98 @@
+"""
+로컬 테스트용 VRoouty 대체 서버
+
+    uvicorn app.fake.server:app --port 8000
+
+- 경로 : Nearest Neighbour 순서, Haversine 거리 기반 ETA
+- 지연 시간 분포, 오류율, computing_times 비율은 환경 변수 또는 `PUT /config`로 설정
+"""
+
+import asyncio
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, field
+
+import orjson
+from fastapi import FastAPI, Request, Response
+
+from app.fake.solver import DEFAULT_SPEED, solve
+from app.models.vroouty import RequestParam
+
+
+@dataclass
+class FakeSolverConfig:
+    # 지연 시간 분포 (초) : "fixed:<s>", "uniform:<min>,<max>",
+    # "exponential:<mean>", "lognormal:<mu>,<sigma>"
+    latency: str = os.environ.get("FAKE_VROOUTY_LATENCY", "fixed:0")
+    # 500 응답 비율
+    error_rate: float = float(os.environ.get("FAKE_VROOUTY_ERROR_RATE", 0))
+    # 지연 시간을 computing_times(loading, solving, routing)로 나누는 비율
+    computing_split: list[float] = field(
+        default_factory=lambda: [
+            float(ratio)
+            for ratio in os.environ.get(
+                "FAKE_VROOUTY_COMPUTING_SPLIT", "0.1,0.8,0.1"
+            ).split(",")
+        ]
+    )
+    # 주행 속도 (m/s)
+    speed: float = float(os.environ.get("FAKE_VROOUTY_SPEED", DEFAULT_SPEED))
+
+    def sample_latency(self) -> float:
+        distribution, _, values = self.latency.partition(":")
+        args = [float(value) for value in values.split(",") if value]
+        if distribution == "fixed":
+            return args[0] if args else 0.0
+        if distribution == "uniform":
+            return random.uniform(*args)
+        if distribution == "exponential":
+            return random.expovariate(1 / args[0])
+        if distribution == "lognormal":
+            return random.lognormvariate(*args)
+        raise ValueError(f"Unknown latency distribution: {self.latency}")
+
+
+config = FakeSolverConfig()
+app = FastAPI(title="Fake VRoouty", version="1.0.0")
+
+
+@app.post(path="/distribute")
+async def distribute(request: Request) -> Response:
+    started = time.perf_counter()
+    param = RequestParam.model_validate_json(await request.body())
+
+    latency = config.sample_latency()
+    if random.random() < config.error_rate:
+        await asyncio.sleep(latency)
+        return Response(status_code=500)
+
+    result = solve(param=param, speed=config.speed)
+    await asyncio.sleep(max(0.0, latency - (time.perf_counter() - started)))
+
+    # computing_times는 실제 계산 시간 + 지연 시간을 비율대로 나눈 값 (ms)
+    elapsed = (time.perf_counter() - started) * 1000
+    total = sum(config.computing_split) or 1
+    loading, solving, routing = (
+        int(elapsed * ratio / total) for ratio in config.computing_split
+    )
+    result["summary"]["computing_times"] = {
+        "loading": loading,
+        "solving": solving,
+        "routing": routing,
+    }
+    return Response(content=orjson.dumps(result), media_type="application/json")
+
+
+@app.get(path="/config")
+async def get_config() -> dict:
+    return asdict(config)
+
+
+@app.put(path="/config")
+async def update_config(values: dict) -> dict:
+    for key, value in values.items():
+        if hasattr(config, key):
+            setattr(config, key, value)
+    config.sample_latency()
+    return asdict(config)
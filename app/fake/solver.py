@@ -0,0 +1,207 @@
+import heapq
+import time
+
+import numpy as np
+
+from app.models.vroouty import RequestParam
+from app.utils.geo import haversine
+
+# 기본 주행 속도 (m/s, 약 30km/h)
+DEFAULT_SPEED: float = 8.33
+
+# Stop 종류
+JOB, PICKUP, DELIVERY = 0, 1, 2
+STEP_TYPES = {JOB: "job", PICKUP: "pickup", DELIVERY: "delivery"}
+
+
+def _common(**fields) -> dict:
+    common = {
+        "service": 0,
+        "duration": 0,
+        "waiting_time": 0,
+        "violations": [],
+        "distance": 0,
+    }
+    common.update(fields)
+    return common
+
+
+def solve(param: RequestParam, speed: float = DEFAULT_SPEED) -> dict:
+    """
+    VRoouty 응답 형식의 Nearest Neighbour 경로 생성
+    - 현재 시각이 가장 이른 차량부터 가장 가까운 Stop을 하나씩 배정
+    - Shipment는 수거한 차량만 배송 가능
+    - `max_vehicle_work_time`을 넘기는 Stop은 배정하지 않음 (적재된 배송 제외)
+    """
+    started = time.perf_counter()
+
+    # Stop 목록 (Job, Shipment 수거, Shipment 배송)
+    stops: list[tuple[int, object, int]] = [(JOB, job, -1) for job in param.jobs]
+    for index, shipment in enumerate(param.shipments or []):
+        stops.append((PICKUP, shipment.pickup, index))
+        stops.append((DELIVERY, shipment.delivery, index))
+
+    n_stops = len(stops)
+    longitudes = np.array([stop[1].location[0] for stop in stops], dtype=float)
+    latitudes = np.array([stop[1].location[1] for stop in stops], dtype=float)
+    shipment_of = np.array([stop[2] for stop in stops], dtype=np.int64)
+    kinds = np.array([stop[0] for stop in stops], dtype=np.int64)
+
+    # 배정 가능 여부 (배송 Stop은 수거 차량에 한해 가능)
+    is_delivery = kinds == DELIVERY
+    available = ~is_delivery
+    carried_by = np.full(len(param.shipments or []), -1, dtype=np.int64)
+
+    max_work_time = (param.distribute_options or {}).get("max_vehicle_work_time")
+    vehicles = param.vehicles or []
+
+    routes_steps: list[list[dict]] = []
+    totals: list[dict] = []
+    positions: list[tuple[float, float]] = []
+    queue: list[tuple[float, int]] = []
+    for vehicle_index, vehicle in enumerate(vehicles):
+        routes_steps.append(
+            [
+                _common(
+                    type="start",
+                    arrival=0,
+                    setup=0,
+                    location=list(vehicle.start),
+                    location_index=n_stops + vehicle_index,
+                )
+            ]
+        )
+        totals.append({"time": 0.0, "duration": 0.0, "distance": 0.0})
+        positions.append(tuple(vehicle.start))
+        heapq.heappush(queue, (0.0, vehicle_index))
+
+    while queue:
+        _, vehicle_index = heapq.heappop(queue)
+        total = totals[vehicle_index]
+        carried = np.zeros(n_stops, dtype=bool)
+        carried[is_delivery] = carried_by[shipment_of[is_delivery]] == vehicle_index
+        candidates = np.flatnonzero(available | carried)
+        if not len(candidates):
+            continue
+
+        longitude, latitude = positions[vehicle_index]
+        distances = haversine(
+            longitude, latitude, longitudes[candidates], latitudes[candidates]
+        )
+        order = np.argsort(distances, kind="stable")
+
+        chosen = None
+        for candidate_order in order:
+            stop_index = candidates[candidate_order]
+            kind, job, _ = stops[stop_index]
+            travel = distances[candidate_order] / speed
+            finish = total["time"] + travel + job.setup + job.service
+            if max_work_time is None or kind == DELIVERY or finish <= max_work_time:
+                chosen = stop_index, distances[candidate_order], travel
+                break
+        if chosen is None:
+            continue
+
+        stop_index, distance, travel = chosen
+        kind, job, shipment_index = stops[stop_index]
+        total["duration"] += travel
+        total["distance"] += distance
+        arrival = total["time"] + travel
+        total["time"] = arrival + job.setup + job.service
+
+        available[stop_index] = False
+        if kind == PICKUP:
+            carried_by[shipment_index] = vehicle_index
+        elif kind == DELIVERY:
+            carried_by[shipment_index] = -2
+
+        routes_steps[vehicle_index].append(
+            _common(
+                type=STEP_TYPES[kind],
+                id=job.id,
+                arrival=int(arrival),
+                setup=job.setup,
+                service=job.service,
+                duration=int(total["duration"]),
+                distance=int(total["distance"]),
+                location=list(job.location),
+                location_index=int(stop_index),
+            )
+        )
+        positions[vehicle_index] = (
+            float(longitudes[stop_index]),
+            float(latitudes[stop_index]),
+        )
+        heapq.heappush(queue, (total["time"], vehicle_index))
+
+    # 종료 지점 및 경로 요약
+    routes = []
+    for vehicle_index, vehicle in enumerate(vehicles):
+        steps = routes_steps[vehicle_index]
+        total = totals[vehicle_index]
+        end = vehicle.end or positions[vehicle_index]
+        distance = float(haversine(*positions[vehicle_index], end[0], end[1]))
+        total["duration"] += distance / speed
+        total["distance"] += distance
+        total["time"] += distance / speed
+        steps.append(
+            _common(
+                type="end",
+                arrival=int(total["time"]),
+                setup=0,
+                duration=int(total["duration"]),
+                distance=int(total["distance"]),
+                location=list(end),
+                location_index=n_stops + len(vehicles) + vehicle_index,
+            )
+        )
+        if len(steps) <= 2:
+            continue
+        jobs = [step for step in steps if step["type"] not in ("start", "end")]
+        routes.append(
+            _common(
+                vehicle=vehicle.id,
+                steps=steps,
+                cost=int(total["duration"]),
+                setup=sum(step["setup"] for step in jobs),
+                service=sum(step["service"] for step in jobs),
+                duration=int(total["duration"]),
+                distance=int(total["distance"]),
+                priority=sum(
+                    stops[step["location_index"]][1].priority or 0 for step in jobs
+                ),
+                geometry=None,
+            )
+        )
+
+    # 배정되지 않은 Stop (배송은 수거가 배정되지 않은 Shipment)
+    unassigned = [
+        {
+            "id": stops[index][1].id,
+            "type": STEP_TYPES[stops[index][0]],
+            "description": "",
+            "location": list(stops[index][1].location),
+            "location_index": int(index),
+        }
+        for index in range(n_stops)
+        if available[index]
+        or (kinds[index] == DELIVERY and carried_by[shipment_of[index]] == -1)
+    ]
+
+    solving = int((time.perf_counter() - started) * 1000)
+    return {
+        "code": 0,
+        "summary": _common(
+            routes=len(routes),
+            unassigned=len(unassigned),
+            setup=sum(route["setup"] for route in routes),
+            service=sum(route["service"] for route in routes),
+            duration=sum(route["duration"] for route in routes),
+            distance=sum(route["distance"] for route in routes),
+            cost=sum(route["cost"] for route in routes),
+            priority=sum(route["priority"] for route in routes),
+            computing_times={"loading": 0, "solving": solving, "routing": 0},
+        ),
+        "unassigned": unassigned,
+        "routes": routes,
+    }
@@ -1,21 +1,26 @@
+from dataclasses import dataclass
+
 from pydantic import BaseModel, ConfigDict, Field, NonNegativeInt
 
 from app.constants.work import TaskType
 from app.models.coordinate import Coordinate
 
 
-class Task(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
-    work_id: str | None = Field(None)
-    type: TaskType = Field()
-    eta: NonNegativeInt = Field(default=0)
-    duration: NonNegativeInt = Field(default=0)
-    distance: NonNegativeInt = Field(default=0)
-    setup_time: NonNegativeInt = Field(default=0)
-    service_time: NonNegativeInt = Field(default=0)
-    assembly_id: str | None = Field(None)
-    location: Coordinate = Field()
+@dataclass(slots=True, kw_only=True)
+class Task:
+    """
+    차량 작업 하나 (응답 건수가 많아 `__slots__` 객체로 생성, 직렬화는 Pydantic이 처리)
+    """
+
+    work_id: str | None = None
+    type: TaskType
+    eta: NonNegativeInt = 0
+    duration: NonNegativeInt = 0
+    distance: NonNegativeInt = 0
+    setup_time: NonNegativeInt = 0
+    service_time: NonNegativeInt = 0
+    assembly_id: str | None = None
+    location: Coordinate
 
 
 class VehicleTasks(BaseModel):
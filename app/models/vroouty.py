@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field, RootModel
 
 from app.constants.work import StepType, TaskType
@@ -6,12 +8,18 @@ from app.schemas.common import CustomAttribute
 
 
 # VRoouty Request Param Schema
-class Job(BaseModel):
-    id: int = Field()
-    location: Coordinate = Field()
-    setup: int = Field()
-    service: int = Field()
-    priority: int | None = Field(default=None)
+@dataclass(slots=True, kw_only=True)
+class Job:
+    """
+    주문별로 요청당 한 번만 생성하여 재사용 (`__slots__` 객체, 직렬화는 Pydantic이 처리)
+    """
+
+    id: int
+    location: Coordinate
+    setup: int
+    service: int
+    priority: int | None = None
+    location_index: int | None = None
 
 
 class Shipment(BaseModel):
@@ -24,6 +32,8 @@ class Vehicle(BaseModel):
     profile: str | None = Field(default=None)
     start: Coordinate = Field()
     end: Coordinate | None = Field(default=None)
+    start_index: int | None = Field(default=None)
+    end_index: int | None = Field(default=None)
 
 
 class RequestParam(BaseModel):
@@ -31,6 +41,8 @@ class RequestParam(BaseModel):
     shipments: list[Shipment] | None = Field(default_factory=list)
     vehicles: list[Vehicle] | None = Field(default_factory=list)
     distribute_options: dict = Field()
+    # Profile별 거리/시간 Matrix (`custom_matrix` 사용 시 location_index 기준)
+    matrices: dict | None = Field(default=None)
 
 
 # VRoouty Response Param Schema
@@ -42,14 +54,24 @@ class CommonFields(BaseModel):
     distance: int = Field()
 
 
-class Steps(CommonFields, CustomAttribute):
-    id: int | None = Field(default=None)
-    type: StepType = Field()
-    arrival: int = Field()
-    setup: int = Field()
-    location: Coordinate = Field()
-    location_index: int = Field()
-    geometry: str = Field(default="")
+@dataclass(slots=True, kw_only=True)
+class Steps:
+    """
+    경로 단계 (경로마다 Job 수만큼 생성되므로 `__slots__` 객체로 파싱)
+    """
+
+    service: int
+    duration: int
+    waiting_time: int
+    violations: list
+    distance: int
+    id: int | None = None
+    type: StepType
+    arrival: int
+    setup: int
+    location: Coordinate
+    location_index: int
+    geometry: str = ""
 
 
 class Routes(CommonFields, CustomAttribute):
@@ -1,14 +1,49 @@
-from fastapi import APIRouter, Body, Request
+import asyncio
+from typing import Awaitable, Callable, Literal, TypeVar
 
-from app.constants.work import WorkStatus
+from fastapi import APIRouter, Body, Depends, HTTPException, Request
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from pydantic import BaseModel
+
+from app.constants.batch import BATCH_MAX_SCENARIOS
+from app.constants.profiling import PROFILE_ENABLED
+from app.constants.response import RESPONSE_FAST_PATH
 from app.controllers.jeju_onul_controller import JejuOnulController
 from app.models.vroouty import VRooutyResponse
-from app.schemas.request import JejuRequest
-from app.schemas.response import AfterResponse, BeforeResponse
+from app.schemas.request import JejuBatchRequest, JejuRequest
+from app.schemas.response import (
+    AfterResponse,
+    BatchAfterResponse,
+    BatchBeforeResponse,
+    BeforeResponse,
+)
+from app.utils.aiohttp import VRooutyClient, get_vroouty_client
+from app.utils.codec import ModelResponse
+from app.utils.metrics import MetricsRoute, metrics, stage_timer
+from app.utils.profiling import ProfileBuffer, collapsed_stacks, profile_buffer
+from app.utils.session import PlanSession, PlanSnapshot, diff_plan, plan_sessions
+from app.utils.stream import dump_model, stream_records
 
 
+T = TypeVar("T")
+
 tag: str = "v1"
-router = APIRouter(prefix=f"/{tag}", tags=[tag])
+router = APIRouter(prefix=f"/{tag}", tags=[tag], route_class=MetricsRoute)
+admin_router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def model_response(
+    result: BaseModel, headers: dict[str, str] | None = None
+) -> dict | Response:
+    """
+    Controller가 만든 응답 Model을 response_model 재검증 없이 바로 직렬화
+    (`RESPONSE_FAST_PATH`가 꺼져 있으면 FastAPI response_model 처리를 그대로 사용)
+    """
+    if not RESPONSE_FAST_PATH:
+        # 응답 Model은 검증 없이 생성되므로 dict로 반환하여 response_model 검증을 거침
+        return result.model_dump()
+    with stage_timer("serialization"):
+        return ModelResponse(result, headers=headers)
 
 
 @router.post(
@@ -17,10 +52,60 @@ router = APIRouter(prefix=f"/{tag}", tags=[tag])
     response_model=BeforeResponse,
     response_model_exclude_none=True,
 )
-async def jeju_onul_before_wave(request: JejuRequest = Body()) -> BeforeResponse:
-    controller = JejuOnulController(request=request)
-    responses: VRooutyResponse = await controller.process_wave_before_cut_off()
-    return await controller.make_before_wave_response(responses=responses)
+async def jeju_onul_before_wave(
+    request: JejuRequest = Body(),
+    client: VRooutyClient = Depends(get_vroouty_client),
+) -> BeforeResponse | Response:
+    with stage_timer("preprocess"):
+        controller = JejuOnulController(request=request, client=client)
+    with stage_timer("solve"):
+        responses: VRooutyResponse = await controller.process_wave_before_cut_off()
+    with stage_timer("assembly"):
+        result = await controller.make_before_wave_response(responses=responses)
+    return model_response(result)
+
+
+@router.post(
+    path="/before/stream",
+    description=(
+        "Cut Off 이전 경로 (차량별 결과를 요청이 끝나는 순서대로 NDJSON 또는 SSE로 전송, "
+        "마지막은 summary, 실패 시 error)"
+    ),
+)
+async def jeju_onul_before_wave_stream(
+    http_request: Request,
+    request: JejuRequest = Body(),
+    client: VRooutyClient = Depends(get_vroouty_client),
+) -> StreamingResponse:
+    with stage_timer("preprocess"):
+        controller = JejuOnulController(request=request, client=client)
+
+    async def records():
+        vehicles = 0
+        async for vehicle_tasks in controller.stream_wave_before_cut_off():
+            vehicles += 1
+            yield "vehicle_tasks", dump_model(vehicle_tasks)
+        yield "summary", {"vehicles": vehicles, "unassigned": []}
+
+    return stream_records(records=records(), accept=http_request.headers.get("Accept"))
+
+
+async def solve_after_wave(controller: JejuOnulController) -> AfterResponse:
+    with stage_timer("solve"):
+        to_pickup_result, to_delivery_result = (
+            await controller.process_waves_after_cut_off()
+        )
+    # 수거 경로 재할당의 VRoouty 호출 시간도 포함
+    with stage_timer("assembly"):
+        pickup_response = await controller.make_pickup_response(
+            response=to_pickup_result
+        )
+        delivery_response = await controller.make_delivery_response(
+            response=to_delivery_result
+        )
+        return await controller.make_combine_after_response(
+            before_tasks=pickup_response, after_tasks=delivery_response
+        )
 
 
 @router.post(
@@ -29,23 +114,215 @@ async def jeju_onul_before_wave(request: JejuRequest = Body()) -> BeforeResponse
     response_model=AfterResponse,
     response_model_exclude_none=True,
 )
-async def jeju_onul_after_wave(request: JejuRequest = Body()) -> AfterResponse:
-    controller = JejuOnulController(request=request)
-    to_pickup_result = await controller.process_wave_after_cut_off(
-        job_status_condition=lambda status: status == WorkStatus.WAITING.value,
-        vehicle_start_location=lambda vehicle: vehicle.current_location,
-        prefix="pickup",
-    )
-    assembly_location = next(iter(controller.request.assemblies)).location
-    to_delivery_result = await controller.process_wave_after_cut_off(
-        job_status_condition=lambda status: status != WorkStatus.DONE.value,
-        vehicle_start_location=lambda vehicle: assembly_location,
-        prefix="delivery",
+async def jeju_onul_after_wave(
+    request: JejuRequest = Body(),
+    client: VRooutyClient = Depends(get_vroouty_client),
+) -> AfterResponse | Response:
+    with stage_timer("preprocess"):
+        controller = JejuOnulController(request=request, client=client)
+    return model_response(await solve_after_wave(controller=controller))
+
+
+@router.post(
+    path="/sessions/{session_id}/after",
+    description="Cut Off 이후 경로 (Session의 이전 경로 대비 영향받은 차량만 재계산)",
+    response_model=AfterResponse,
+    response_model_exclude_none=True,
+)
+async def jeju_onul_after_wave_session(
+    session_id: str,
+    response: Response,
+    request: JejuRequest = Body(),
+    client: VRooutyClient = Depends(get_vroouty_client),
+) -> AfterResponse | Response:
+    headers: dict[str, str] = {}
+    async with plan_sessions.lock(session_id=session_id):
+        # Controller 처리 중 주문 상태가 바뀌므로 처리 전에 상태 저장
+        snapshot = PlanSnapshot(request=request)
+        session = plan_sessions.get(session_id=session_id)
+        changes = (
+            diff_plan(session=session, request=request, snapshot=snapshot)
+            if session is not None
+            else None
+        )
+
+        if changes is not None and not changes:
+            plan_sessions.unchanged += 1
+            headers["X-Plan-Update"] = "unchanged"
+            response.headers.update(headers)
+            return model_response(session.response, headers=headers)
+
+        with stage_timer("preprocess"):
+            controller = JejuOnulController(request=request, client=client)
+        if changes is None:
+            plan_sessions.full += 1
+            headers["X-Plan-Update"] = "full"
+            result = await solve_after_wave(controller=controller)
+        else:
+            plan_sessions.incremental += 1
+            headers["X-Plan-Update"] = "incremental"
+            headers["X-Plan-Vehicles"] = str(len(changes.vehicle_ids))
+            with stage_timer("solve"):
+                result = await controller.reoptimize_after_cut_off(
+                    previous=session.response,
+                    pickup_assignment=changes.pickup_assignment,
+                    delivery_assignment=changes.delivery_assignment,
+                    pickup_vehicle_ids=changes.pickup_vehicle_ids,
+                    delivery_vehicle_ids=changes.delivery_vehicle_ids,
+                )
+
+        plan_sessions.set(
+            session_id=session_id,
+            session=PlanSession(snapshot=snapshot, response=result),
+        )
+    response.headers.update(headers)
+    return model_response(result, headers=headers)
+
+
+async def run_scenarios(
+    batch: JejuBatchRequest, solve: Callable[[JejuRequest], Awaitable[T]]
+) -> tuple[dict[str, T], dict[str, str]]:
+    """
+    시나리오를 동시에 처리 (VRoouty 호출 수는 Client의 전체 동시 호출 제한을 따름)
+    권역 Index, 거리 Matrix, 결과 Cache는 시나리오 간에 공유
+    """
+    if len(batch.scenarios) > BATCH_MAX_SCENARIOS:
+        raise HTTPException(
+            413, detail=f"Too many scenarios (max {BATCH_MAX_SCENARIOS})"
+        )
+
+    # 시나리오별 실패는 errors에 기록 (취소(CancelledError)만 전파)
+    async def run(request: JejuRequest) -> tuple[T | None, str | None]:
+        try:
+            return await solve(request), None
+        except HTTPException as exception:
+            return None, str(exception.detail)
+        except Exception as exception:
+            return None, str(exception)
+
+    outcomes = await asyncio.gather(
+        *(run(request) for request in batch.scenarios.values())
     )
-    pickup_response = await controller.make_pickup_response(response=to_pickup_result)
-    delivery_response = await controller.make_delivery_response(
-        response=to_delivery_result
+    results, errors = {}, {}
+    for scenario_id, (result, error) in zip(batch.scenarios, outcomes):
+        if error is None:
+            results[scenario_id] = result
+        else:
+            errors[scenario_id] = error
+    return results, errors
+
+
+@router.post(
+    path="/before:batch",
+    description="Cut Off 이전 경로 (여러 시나리오, 시나리오 ID별 결과)",
+    response_model=BatchBeforeResponse,
+    response_model_exclude_none=True,
+)
+async def jeju_onul_before_wave_batch(
+    batch: JejuBatchRequest = Body(),
+    client: VRooutyClient = Depends(get_vroouty_client),
+) -> BatchBeforeResponse | Response:
+    async def solve(request: JejuRequest) -> BeforeResponse:
+        with stage_timer("preprocess"):
+            controller = JejuOnulController(request=request, client=client)
+        with stage_timer("solve"):
+            responses = await controller.process_wave_before_cut_off()
+        with stage_timer("assembly"):
+            return await controller.make_before_wave_response(responses=responses)
+
+    results, errors = await run_scenarios(batch=batch, solve=solve)
+    return model_response(
+        BatchBeforeResponse.model_construct(results=results, errors=errors)
     )
-    return await controller.make_combine_after_response(
-        before_tasks=pickup_response, after_tasks=delivery_response
+
+
+@router.post(
+    path="/after:batch",
+    description="Cut Off 이후 경로 (여러 시나리오, 시나리오 ID별 결과)",
+    response_model=BatchAfterResponse,
+    response_model_exclude_none=True,
+)
+async def jeju_onul_after_wave_batch(
+    batch: JejuBatchRequest = Body(),
+    client: VRooutyClient = Depends(get_vroouty_client),
+) -> BatchAfterResponse | Response:
+    async def solve(request: JejuRequest) -> AfterResponse:
+        with stage_timer("preprocess"):
+            controller = JejuOnulController(request=request, client=client)
+        return await solve_after_wave(controller=controller)
+
+    results, errors = await run_scenarios(batch=batch, solve=solve)
+    return model_response(
+        BatchAfterResponse.model_construct(results=results, errors=errors)
     )
+
+
+@router.delete(path="/sessions/{session_id}", description="Plan Session 삭제")
+async def delete_plan_session(session_id: str) -> dict:
+    return {"deleted": plan_sessions.delete(session_id=session_id)}
+
+
+@admin_router.get(path="/cache", description="VRoouty 결과 Cache 현황")
+async def solver_cache_stats(request: Request) -> dict:
+    client: VRooutyClient = request.app.state.vroouty_client
+    if client.cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **client.cache.stats()}
+
+
+@admin_router.get(
+    path="/solver", description="VRoouty Client 현황 (Cache, Matrix, 중복 호출 병합)"
+)
+async def solver_client_stats(request: Request) -> dict:
+    client: VRooutyClient = request.app.state.vroouty_client
+    return client.stats()
+
+
+@admin_router.get(path="/sessions", description="Plan Session 현황")
+async def plan_session_stats() -> dict:
+    return plan_sessions.stats()
+
+
+@admin_router.get(
+    path="/metrics",
+    description="Prometheus 형식 Metric (단계별 처리 시간, VRoouty 호출 및 계산 시간)",
+)
+async def prometheus_metrics() -> Response:
+    return Response(metrics.render(), media_type=metrics.content_type)
+
+
+@admin_router.get(path="/profiles", description="최근 요청 Profiling 목록")
+async def profile_list() -> dict:
+    return {
+        "enabled": PROFILE_ENABLED,
+        "profiles": [record.summary() for record in profile_buffer.records()],
+    }
+
+
+@admin_router.get(
+    path="/profiles/stats",
+    description="Profiling 결과 집계 (pstats, Flamegraph용 Collapsed Stack, Binary)",
+)
+async def profile_stats(
+    format: Literal["pstats", "collapsed", "raw"] = "pstats",
+    path: str | None = None,
+    limit: int = 30,
+) -> Response:
+    stats = profile_buffer.aggregate(path=path)
+    if stats is None:
+        raise HTTPException(404, detail="No profiles collected")
+    if format == "collapsed":
+        return PlainTextResponse(collapsed_stacks(stats=stats))
+    if format == "raw":
+        return Response(
+            ProfileBuffer.dump(stats=stats),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": 'attachment; filename="profile.prof"'},
+        )
+    return PlainTextResponse(ProfileBuffer.render(stats=stats, limit=limit))
+
+
+@admin_router.delete(path="/profiles", description="Profiling 결과 초기화")
+async def profile_clear() -> dict:
+    profile_buffer.clear()
+    return {"cleared": True}
@@ -5,6 +5,7 @@ from pydantic import (
     ConfigDict,
     Field,
     ValidationInfo,
+    field_validator,
     model_validator,
 )
 from app.constants.work import WorkStatus
@@ -13,9 +14,15 @@ from app.models.coordinate import Coordinate
 
 class Status(BaseModel):
     type: WorkStatus = Field(default=WorkStatus.WAITING)
-    vehicle_id: int | None = Field(default=None)
+    vehicle_id: int | str | None = Field(default=None)
     location: Coordinate | None = Field(default=None)
 
+    @field_validator("vehicle_id")
+    @classmethod
+    def vehicle_id_validator(cls, value: int | str | None) -> str | None:
+        # 차량 id(`Vehicle.id`)와 비교하므로 문자열로 통일
+        return None if value is None else str(value)
+
 
 class WorkPoint(BaseModel):
     location: Coordinate
@@ -50,7 +57,7 @@ class Work(BaseModel):
     pickup: WorkPoint
     delivery: WorkPoint
     amount: list[int] | None = Field(default=None)
-    status: Status | None = Field(default=Status)
+    status: Status | None = Field(default_factory=Status)
     exception: bool | None = Field(default=False)
     fix_vehicle_id: str | None = Field(default=None)
 
@@ -80,4 +87,10 @@ class JejuRequest(BaseModel):
     works: list[Work]
     vehicles: list[Vehicle]
     assemblies: list[Assembly]
-    boundaries: list[Boundary]
+    boundaries: list[Boundary] = Field(default_factory=list)
+    boundary_set_id: str | None = Field(default=None)
+
+
+class JejuBatchRequest(BaseModel):
+    # 시나리오 ID별 요청
+    scenarios: dict[str, JejuRequest]
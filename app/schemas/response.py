@@ -13,3 +13,13 @@ class AfterResponse(CustomAttribute):
     before_tasks: list[VehicleTasks] = Field(default_factory=list)
     after_tasks: list[VehicleTasks] = Field(default_factory=list)
     swaps: list[VehicleSwaps] = Field(default_factory=list)
+
+
+class BatchBeforeResponse(CustomAttribute):
+    results: dict[str, BeforeResponse] = Field(default_factory=dict)
+    errors: dict[str, str] = Field(default_factory=dict)
+
+
+class BatchAfterResponse(CustomAttribute):
+    results: dict[str, AfterResponse] = Field(default_factory=dict)
+    errors: dict[str, str] = Field(default_factory=dict)
@@ -1,24 +1,369 @@
-import os
-import json
+import asyncio
+import copy
+
 import aiohttp
+from fastapi import HTTPException, Request
 
+from app.constants.client import (
+    VROOUTY_BREAKER_RECOVERY,
+    VROOUTY_BREAKER_THRESHOLD,
+    VROOUTY_CONNECT_TIMEOUT,
+    VROOUTY_CONNECTION_LIMIT,
+    VROOUTY_CONNECTION_LIMIT_PER_HOST,
+    VROOUTY_DEADLINE,
+    VROOUTY_DNS_CACHE_TTL,
+    VROOUTY_GLOBAL_CONCURRENCY,
+    VROOUTY_HEDGE,
+    VROOUTY_HEDGE_PERCENTILE,
+    VROOUTY_KEEPALIVE_TIMEOUT,
+    VROOUTY_MAX_RETRIES,
+    VROOUTY_RETRY_BACKOFF_BASE,
+    VROOUTY_RETRY_BACKOFF_MAX,
+    VROOUTY_RETRY_BUDGET_RATIO,
+    VROOUTY_SINGLEFLIGHT,
+    VROOUTY_TOTAL_TIMEOUT,
+    VROOUTY_URL,
+)
 from app.models.vroouty import RequestParam, VRooutyResponse
+from app.utils.cache import CanonicalRequest, SolverCache
+from app.utils.codec import decode_response, encode_request
+from app.utils.matrix import MatrixEngine
+from app.utils.metrics import (
+    SOLVER_COMPUTING_SECONDS,
+    SOLVER_JOBS,
+    SOLVER_REQUEST_SECONDS,
+    SOLVER_SHIPMENTS,
+    SOLVER_SOLVES,
+    SOLVER_VEHICLES,
+)
+from app.utils.resilience import (
+    CircuitBreaker,
+    LatencyTracker,
+    RetryBudget,
+    jittered_backoff,
+)
+from app.utils.singleflight import SingleFlight
+
+BASE_URL = VROOUTY_URL
+
+
+class ClientCounters:
+    """
+    Client 호출 집계 (without_cache 사본과 공유하여 `stats`에 모두 반영)
+    """
+
+    __slots__ = ("in_flight", "retries", "hedges", "rejected")
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.retries = 0
+        self.hedges = 0
+        self.rejected = 0
+
+
+class VRooutyClient:
+    """
+    VRoouty 호출용 Client
+    App 수명 동안 하나의 Session(Connection Pool)을 유지하여 재사용
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        limit: int = VROOUTY_CONNECTION_LIMIT,
+        limit_per_host: int = VROOUTY_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = VROOUTY_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache: int = VROOUTY_DNS_CACHE_TTL,
+        total_timeout: float = VROOUTY_TOTAL_TIMEOUT,
+        connect_timeout: float = VROOUTY_CONNECT_TIMEOUT,
+        global_concurrency: int = VROOUTY_GLOBAL_CONCURRENCY,
+        cache: SolverCache | None = None,
+        matrix: MatrixEngine | None = None,
+        singleflight: bool = VROOUTY_SINGLEFLIGHT,
+        deadline: float = VROOUTY_DEADLINE,
+        max_retries: int = VROOUTY_MAX_RETRIES,
+        retry_budget_ratio: float = VROOUTY_RETRY_BUDGET_RATIO,
+        backoff_base: float = VROOUTY_RETRY_BACKOFF_BASE,
+        backoff_max: float = VROOUTY_RETRY_BACKOFF_MAX,
+        hedge: bool = VROOUTY_HEDGE,
+        hedge_percentile: float = VROOUTY_HEDGE_PERCENTILE,
+        breaker_threshold: int = VROOUTY_BREAKER_THRESHOLD,
+        breaker_recovery: float = VROOUTY_BREAKER_RECOVERY,
+    ) -> None:
+        self.base_url = base_url
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout, connect=connect_timeout
+        )
+        # 모든 요청이 공유하는 동시 호출 제한 및 호출 집계 (without_cache 사본도 공유)
+        self.limiter = asyncio.Semaphore(max(1, global_concurrency))
+        self.global_concurrency = global_concurrency
+        self.counters = ClientCounters()
+        self.cache = cache
+        self.matrix = matrix
+        self.singleflight: SingleFlight | None = (
+            SingleFlight() if singleflight else None
+        )
+        self._session: aiohttp.ClientSession | None = None
+
+        # Tail Latency 대응 (제한 시간, 재시도, Hedging, Circuit Breaker)
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.retry_budget = RetryBudget(ratio=retry_budget_ratio)
+        self.breaker = CircuitBreaker(
+            threshold=breaker_threshold, recovery_time=breaker_recovery
+        )
+        self.latency = LatencyTracker()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            raise RuntimeError("VRooutyClient is not started")
+        return self._session
+
+    async def start(self) -> None:
+        """
+        Connection Pool 생성 (App 시작 시 호출)
+        """
+        if self._session is not None and not self._session.closed:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=True,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers={"Content-Type": "application/json"},
+        )
+
+    async def close(self) -> None:
+        """
+        Connection Pool 정리 (App 종료 시 호출)
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "VRooutyClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
 
-BASE_URL = os.environ["VROOUTY_URL"]
+    def without_cache(self) -> "VRooutyClient":
+        """
+        Cache를 사용하지 않는 Client
+        Connection Pool, 동시 호출 제한, Resilience 상태 및 호출 집계는 원본과 공유
+        """
+        client = copy.copy(self)
+        client.cache = None
+        return client
+
+    async def request(self, param: RequestParam) -> VRooutyResponse | None:
+        if self.cache is None and self.singleflight is None:
+            if self.matrix is not None:
+                param = self.matrix.attach(param=param)
+            return await self.post(param=param)
+
+        canonical = CanonicalRequest(param=param)
+        if self.cache is not None:
+            if body := await self.cache.get(key=canonical.key):
+                return canonical.load_response(body=body)
+
+        if self.singleflight is None:
+            response, _ = await self.solve(param=param, canonical=canonical)
+            return response
+
+        # 같은 요청이 진행 중이면 해당 결과를 공유
+        if (future := self.singleflight.join(key=canonical.key)) is not None:
+            try:
+                body = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # 먼저 요청한 쪽이 취소된 경우 직접 다시 요청
+                return await self.request(param=param)
+            return canonical.load_response(body=body) if body else None
+
+        self.singleflight.lead(key=canonical.key)
+        try:
+            response, body = await self.solve(param=param, canonical=canonical)
+        except BaseException as exception:
+            self.singleflight.finish(key=canonical.key, exception=exception)
+            raise
+        self.singleflight.finish(key=canonical.key, result=body)
+        return response
+
+    async def solve(
+        self, param: RequestParam, canonical: CanonicalRequest
+    ) -> tuple[VRooutyResponse | None, bytes | None]:
+        """
+        VRoouty 호출 후 결과 Cache 저장
+        (응답, 정규화된 id로 직렬화한 응답) 반환
+        """
+        if self.matrix is not None:
+            param = self.matrix.attach(param=param)
+        response = await self.post(param=param)
+        if not response:
+            return None, None
+
+        body = canonical.dump_response(response=response)
+        if self.cache is not None:
+            await self.cache.set(key=canonical.key, value=body)
+        return response, body
+
+    def stats(self) -> dict:
+        return {
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "matrix": self.matrix.stats() if self.matrix is not None else None,
+            "singleflight": (
+                self.singleflight.stats() if self.singleflight is not None else None
+            ),
+            "concurrency": {
+                "limit": self.global_concurrency,
+                "in_flight": self.counters.in_flight,
+            },
+            "resilience": {
+                "circuit": self.breaker.state,
+                "consecutive_failures": self.breaker.failures,
+                "rejected": self.counters.rejected,
+                "retries": self.counters.retries,
+                "retry_budget": self.retry_budget.tokens,
+                "hedges": self.counters.hedges,
+                "p95_latency": self.latency.percentile(95),
+            },
+        }
+
+    async def post(self, param: RequestParam) -> VRooutyResponse | None:
+        """
+        VRoouty 호출 (제한 시간 내 재시도 및 Hedging)
+        5xx, 429, 연결 오류, 시간 초과는 재시도하고 그 외 실패는 None 반환
+        """
+        if not self.breaker.allow():
+            self.counters.rejected += 1
+            SOLVER_SOLVES.inc(outcome="circuit_open")
+            raise HTTPException(503, detail="VRoouty is unavailable")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline
+        data = encode_request(param=param)
+        self.retry_budget.deposit()
+        SOLVER_JOBS.inc(len(param.jobs))
+        SOLVER_SHIPMENTS.inc(len(param.shipments or ()))
+        SOLVER_VEHICLES.inc(len(param.vehicles or ()))
+
+        attempt = 0
+        while True:
+            try:
+                async with asyncio.timeout_at(deadline):
+                    status, body = await self.send(data=data)
+            except (TimeoutError, aiohttp.ClientError):
+                status, body = None, None
+
+            if status == 200:
+                self.breaker.record_success()
+                SOLVER_SOLVES.inc(outcome="success")
+                response = decode_response(body=body)
+                for phase, value in response.summary.computing_times:
+                    SOLVER_COMPUTING_SECONDS.observe(value / 1000, phase=phase)
+                return response
+            if status is not None and status < 500 and status != 429:
+                self.breaker.record_success()
+                SOLVER_SOLVES.inc(outcome="rejected")
+                return None
+
+            self.breaker.record_failure()
+            attempt += 1
+            backoff = jittered_backoff(
+                attempt=attempt, base=self.backoff_base, maximum=self.backoff_max
+            )
+            if (
+                attempt > self.max_retries
+                or loop.time() + backoff >= deadline
+                or not self.breaker.allow()
+                or not self.retry_budget.withdraw()
+            ):
+                SOLVER_SOLVES.inc(outcome="failure")
+                return None
+            self.counters.retries += 1
+            await asyncio.sleep(backoff)
+
+    async def send(self, data: bytes) -> tuple[int, bytes]:
+        """
+        요청 전송, Hedging 사용 시 최근 지연 시간 백분위수가 지나도 응답이 없으면
+        같은 요청을 한 번 더 보내고 먼저 성공한 응답 사용
+        """
+        delay = self.latency.percentile(self.hedge_percentile) if self.hedge else None
+        if delay is None:
+            return await self.send_once(data=data)
+
+        pending = {asyncio.ensure_future(self.send_once(data=data))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done and self.retry_budget.withdraw():
+                self.counters.hedges += 1
+                pending.add(asyncio.ensure_future(self.send_once(data=data)))
+
+            while True:
+                for task in done:
+                    if task.exception() is None and task.result()[0] == 200:
+                        return task.result()
+                if not pending:
+                    return task.result()
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def send_once(self, data: bytes) -> tuple[int, bytes]:
+        loop = asyncio.get_running_loop()
+        async with self.limiter:
+            self.counters.in_flight += 1
+            started = loop.time()
+            try:
+                async with self.session.post(self.base_url, data=data) as response:
+                    status = response.status
+                    body = await response.read()
+            finally:
+                self.counters.in_flight -= 1
+
+        elapsed = loop.time() - started
+        SOLVER_REQUEST_SECONDS.observe(elapsed, status=str(status))
+        if status == 200:
+            self.latency.record(elapsed)
+        return status, body
 
 
 async def VRooutyRequest(
     param: RequestParam,
 ) -> VRooutyResponse | None:
-    async with aiohttp.ClientSession() as session:
-        response = await session.post(
-            BASE_URL,
-            json=json.loads(param.model_dump_json()),
-            headers={"Content-Type": "application/json"},
-        )
-        status = response.status
-        response = await response.json()
+    """
+    단발성 VRoouty 호출 (App 외부 Script 용도)
+    """
+    async with VRooutyClient() as client:
+        return await client.request(param=param)
+
 
-        if status != 200:
-            return None
-        return VRooutyResponse(**response)
+def get_vroouty_client(request: Request) -> VRooutyClient:
+    """
+    App 수명 동안 유지되는 VRooutyClient 주입 (FastAPI Dependency)
+    `X-Cache-Bypass: 1` Header가 있으면 결과 Cache를 사용하지 않음
+    """
+    client: VRooutyClient = request.app.state.vroouty_client
+    if request.headers.get("X-Cache-Bypass") == "1":
+        return client.without_cache()
+    return client
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import orjson
+from shapely.geometry import Polygon
+
+from app.constants.boudaries import BOUNDARY_LOCATION
+from app.constants.boundary import (
+    BOUNDARY_CACHE_SIZE,
+    BOUNDARY_FILES,
+    DEFAULT_BOUNDARY_SET_ID,
+)
+from app.schemas.request import Boundary
+from app.utils.polygon import BoundaryIndex
+
+
+def boundaries_hash(boundaries: list[Boundary]) -> str:
+    """
+    권역 목록의 Content Hash (ID와 좌표가 같으면 같은 값)
+    """
+    payload = orjson.dumps([[b.id, b.polygon] for b in boundaries])
+    return hashlib.sha1(payload).hexdigest()
+
+
+class BoundaryRegistry:
+    """
+    컴파일된 권역 Set(BoundaryIndex) 저장소
+    - Set ID로 등록된 권역 : 서버 수명 동안 유지
+    - 요청에 포함된 권역 : Content Hash 기준 LRU 캐싱
+    """
+
+    def __init__(self, cache_size: int = BOUNDARY_CACHE_SIZE) -> None:
+        self.cache_size = cache_size
+        self._sets: dict[str, BoundaryIndex] = {}
+        self._cache: OrderedDict[str, BoundaryIndex] = OrderedDict()
+
+    def __contains__(self, boundary_set_id: str) -> bool:
+        return boundary_set_id in self._sets
+
+    def register(
+        self, boundary_set_id: str, polygons: dict[str, list[list[float]]]
+    ) -> BoundaryIndex:
+        """
+        Set ID로 권역 등록 (동일 ID는 덮어씀)
+        """
+        index = BoundaryIndex(
+            polygons={
+                group_id: Polygon(polygon) for group_id, polygon in polygons.items()
+            }
+        )
+        self._sets[boundary_set_id] = index
+        return index
+
+    def register_file(self, path: str) -> BoundaryIndex:
+        """
+        JSON 파일로부터 권역 등록
+        파일 형식 : {"<group_id>": [[lng, lat], ...]} 또는 [{"id": ..., "polygon": ...}]
+        """
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            data = {boundary["id"]: boundary["polygon"] for boundary in data}
+        boundary_set_id = os.path.splitext(os.path.basename(path))[0]
+        return self.register(boundary_set_id=boundary_set_id, polygons=data)
+
+    def get(self, boundary_set_id: str) -> BoundaryIndex:
+        return self._sets[boundary_set_id]
+
+    def compile(self, boundaries: list[Boundary]) -> BoundaryIndex:
+        """
+        요청에 포함된 권역 목록을 컴파일 (같은 내용은 캐시 재사용)
+        """
+        key = boundaries_hash(boundaries)
+        if index := self._cache.get(key):
+            self._cache.move_to_end(key)
+            return index
+
+        index = BoundaryIndex(polygons={b.id: Polygon(b.polygon) for b in boundaries})
+        self._cache[key] = index
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return index
+
+    def resolve(
+        self, boundary_set_id: str | None, boundaries: list[Boundary]
+    ) -> BoundaryIndex:
+        """
+        요청 기준 권역 Index 반환
+        권역 목록이 있으면 우선 사용, 없으면 Set ID(미지정 시 기본 Set) 사용
+        """
+        if boundaries:
+            return self.compile(boundaries=boundaries)
+        return self.get(boundary_set_id or DEFAULT_BOUNDARY_SET_ID)
+
+
+boundary_registry = BoundaryRegistry()
+boundary_registry.register(
+    boundary_set_id=DEFAULT_BOUNDARY_SET_ID, polygons=BOUNDARY_LOCATION
+)
+for _path in BOUNDARY_FILES:
+    boundary_registry.register_file(path=_path)
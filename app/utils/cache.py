@@ -0,0 +1,171 @@
+import asyncio
+import hashlib
+import sqlite3
+import time
+from collections import OrderedDict
+
+import orjson
+
+from app.constants.client import (
+    VROOUTY_CACHE_PATH,
+    VROOUTY_CACHE_SIZE,
+    VROOUTY_CACHE_TTL,
+)
+from app.models.vroouty import RequestParam, VRooutyResponse
+
+
+class CanonicalRequest:
+    """
+    IdHandler 번호를 등장 순서(0, 1, 2, ...)로 정규화한 RequestParam
+    같은 문제라면 id 번호와 관계없이 같은 key를 가짐
+    """
+
+    __slots__ = ("key", "to_canonical", "to_original")
+
+    def __init__(self, param: RequestParam) -> None:
+        payload = param.model_dump(mode="json")
+        self.to_canonical: dict[int, int] = {}
+
+        def canonical_id(id: int) -> int:
+            return self.to_canonical.setdefault(id, len(self.to_canonical))
+
+        for job in payload["jobs"]:
+            job["id"] = canonical_id(job["id"])
+        for shipment in payload["shipments"] or []:
+            shipment["pickup"]["id"] = canonical_id(shipment["pickup"]["id"])
+            shipment["delivery"]["id"] = canonical_id(shipment["delivery"]["id"])
+        for vehicle in payload["vehicles"] or []:
+            vehicle["id"] = canonical_id(vehicle["id"])
+
+        self.to_original: dict[int, int] = {
+            canonical: original for original, canonical in self.to_canonical.items()
+        }
+        self.key: str = hashlib.sha256(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+
+    @staticmethod
+    def _remap(payload: dict, mapping: dict[int, int]) -> dict:
+        for route in payload["routes"]:
+            route["vehicle"] = mapping.get(route["vehicle"], route["vehicle"])
+            for step in route["steps"]:
+                if step.get("id") is not None:
+                    step["id"] = mapping.get(step["id"], step["id"])
+        for unassigned in payload["unassigned"]:
+            unassigned["id"] = mapping.get(unassigned["id"], unassigned["id"])
+        return payload
+
+    def dump_response(self, response: VRooutyResponse) -> bytes:
+        """
+        응답의 id를 정규화하여 직렬화 (Cache 저장용)
+        """
+        payload = self._remap(response.model_dump(mode="json"), self.to_canonical)
+        return orjson.dumps(payload)
+
+    def load_response(self, body: bytes) -> VRooutyResponse:
+        """
+        Cache된 응답의 id를 요청자의 id로 복원
+        """
+        payload = self._remap(orjson.loads(body), self.to_original)
+        return VRooutyResponse.model_validate(payload)
+
+
+class SolverCache:
+    """
+    VRoouty 결과 Cache
+    - 메모리 : 최대 항목 수와 유지 시간(TTL) 기준 LRU
+    - 디스크 (선택) : sqlite, 같은 Host의 uvicorn worker 간 공유
+    """
+
+    def __init__(
+        self,
+        max_size: int = VROOUTY_CACHE_SIZE,
+        ttl: float = VROOUTY_CACHE_TTL,
+        path: str | None = VROOUTY_CACHE_PATH,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        self._memory: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.path:
+            with self._connect() as connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS solver_cache "
+                    "(key TEXT PRIMARY KEY, value BLOB, expires_at REAL)"
+                )
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5)
+
+    def _disk_get(self, key: str, now: float) -> tuple[bytes, float] | None:
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT value, expires_at FROM solver_cache "
+                "WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+
+    def _disk_set(self, key: str, value: bytes, expires_at: float) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO solver_cache VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+            connection.execute(
+                "DELETE FROM solver_cache WHERE expires_at <= ?", (time.time(),)
+            )
+
+    def _memory_set(self, key: str, value: bytes, expires_at: float) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    async def get(self, key: str) -> bytes | None:
+        now = time.time()
+        if entry := self._memory.get(key):
+            expires_at, value = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._memory[key]
+
+        if self.path:
+            if row := await asyncio.to_thread(self._disk_get, key, now):
+                value, expires_at = row
+                self._memory_set(key, value, expires_at)
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: bytes) -> None:
+        expires_at = time.time() + self.ttl
+        self._memory_set(key, value, expires_at)
+        if self.path:
+            await asyncio.to_thread(self._disk_set, key, value, expires_at)
+
+    def clear(self) -> None:
+        self._memory.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._memory),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "disk": bool(self.path),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,41 @@
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from app.models.vroouty import RequestParam, VRooutyResponse
+
+
+def encode_request(param: RequestParam) -> bytes:
+    """
+    RequestParam을 JSON bytes로 직렬화
+    (pydantic-core에서 바로 bytes를 생성하여 dict 변환 및 재인코딩을 생략)
+    값이 없는 선택 항목(Matrix, location_index 등)은 제외
+    """
+    return param.__pydantic_serializer__.to_json(param, exclude_none=True)
+
+
+def decode_response(body: bytes) -> VRooutyResponse:
+    """
+    VRoouty 응답 원문(bytes)을 한 번에 파싱 및 검증
+    """
+    return VRooutyResponse.model_validate_json(body)
+
+
+def encode_response(model: BaseModel) -> bytes:
+    """
+    응답 Model을 JSON bytes로 직렬화
+    (`response_model_exclude_none=True`인 response_model 출력과 동일한 형식)
+    """
+    return model.__pydantic_serializer__.to_json(
+        model, by_alias=True, exclude_none=True
+    )
+
+
+class ModelResponse(Response):
+    """
+    응답 Model을 재검증 및 dict 변환 없이 한 번에 직렬화하는 JSON 응답
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return encode_response(content)
@@ -0,0 +1,31 @@
+import asyncio
+from typing import Awaitable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_with_limit(coroutines: Iterable[Awaitable[T]], limit: int) -> list[T]:
+    """
+    최대 `limit`개씩 동시에 실행하는 asyncio.gather (결과 순서는 입력 순서 유지)
+    하나라도 실패하면 나머지를 취소하고 종료를 기다린 뒤 처음 예외를 그대로 전달
+    (실패한 Wave가 Solver 호출 자리를 계속 차지하지 않도록)
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(coroutine: Awaitable[T]) -> T:
+        try:
+            async with semaphore:
+                return await coroutine
+        finally:
+            # 시작 전에 취소된 Coroutine 정리 (never awaited 경고 방지)
+            if asyncio.iscoroutine(coroutine):
+                coroutine.close()
+
+    tasks = [asyncio.ensure_future(run(coroutine)) for coroutine in coroutines]
+    try:
+        return await asyncio.gather(*tasks)
+    except Exception:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -0,0 +1,287 @@
+import asyncio
+from typing import Awaitable, Callable
+
+import numpy as np
+
+from app.models.vroouty import (
+    ComputingTimes,
+    RequestParam,
+    Summary,
+    VRooutyResponse,
+)
+from app.utils.concurrency import gather_with_limit
+from app.utils.geo import haversine
+
+Solve = Callable[[RequestParam], Awaitable[VRooutyResponse | None]]
+
+# 경계 Job 판별 기준 (가장 가까운 중심까지 거리 / 두 번째로 가까운 중심까지 거리)
+BOUNDARY_MARGIN: float = 0.7
+
+# 보정 1회에 다른 구역으로 옮길 수 있는 Job 비율 (구역 Job 수 대비)
+REPAIR_MOVE_RATIO: float = 0.25
+
+
+def kmeans_labels(coords: np.ndarray, k: int, iterations: int = 20) -> np.ndarray:
+    """
+    좌표 군집화 (k-means, 결과 재현을 위해 초기 중심은 최원점 방식으로 결정)
+    """
+    k = max(1, min(k, len(coords)))
+    centers = [coords.mean(axis=0)]
+    distance = np.full(len(coords), np.inf)
+    for _ in range(k):
+        distance = np.minimum(distance, ((coords - centers[-1]) ** 2).sum(axis=1))
+        centers.append(coords[int(np.argmax(distance))])
+    centers = np.array(centers[1:])
+
+    labels = np.zeros(len(coords), dtype=np.intp)
+    for iteration in range(iterations):
+        squared = ((coords[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        new_labels = squared.argmin(axis=1)
+        if iteration and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for cluster in range(k):
+            if (members := labels == cluster).any():
+                centers[cluster] = coords[members].mean(axis=0)
+    return labels
+
+
+class Partition:
+    """
+    구역 하나의 Job / Vehicle 목록 (원래 요청 내 위치)
+    """
+
+    __slots__ = ("jobs", "vehicles", "center")
+
+    def __init__(self, jobs: np.ndarray, center: np.ndarray) -> None:
+        self.jobs = jobs
+        self.vehicles: list[int] = []
+        self.center = center
+
+    def param(self, param: RequestParam) -> RequestParam:
+        return RequestParam(
+            jobs=[param.jobs[index] for index in self.jobs],
+            shipments=[],
+            vehicles=[param.vehicles[index] for index in self.vehicles],
+            distribute_options=param.distribute_options,
+        )
+
+
+def build_partitions(
+    param: RequestParam, labels: np.ndarray, max_partitions: int
+) -> list[Partition]:
+    """
+    Label별 구역 생성 후 차량 배정
+    - 구역 수가 차량 수 또는 `max_partitions`보다 많으면 작은 구역부터 가까운 구역에 병합
+    - 차량은 Job 수에 비례하여 배정 (최대 잉여 방식), 출발지가 가까운 구역 우선
+    """
+    coords = np.array([job.location for job in param.jobs], dtype=float)
+    groups = {label: np.flatnonzero(labels == label) for label in np.unique(labels)}
+    partitions = [
+        Partition(jobs=jobs, center=coords[jobs].mean(axis=0))
+        for jobs in groups.values()
+    ]
+
+    limit = max(1, min(max_partitions, len(param.vehicles)))
+    while len(partitions) > limit:
+        partitions.sort(key=lambda partition: len(partition.jobs))
+        smallest = partitions.pop(0)
+        nearest = min(
+            partitions,
+            key=lambda partition: float(
+                ((partition.center - smallest.center) ** 2).sum()
+            ),
+        )
+        nearest.jobs = np.concatenate([nearest.jobs, smallest.jobs])
+        nearest.center = coords[nearest.jobs].mean(axis=0)
+
+    # 구역별 차량 수 (최소 1대)
+    sizes = np.array([len(partition.jobs) for partition in partitions], dtype=float)
+    spare = len(param.vehicles) - len(partitions)
+    quotas = np.ones(len(partitions), dtype=np.intp)
+    if spare > 0:
+        shares = sizes / sizes.sum() * spare
+        quotas += np.floor(shares).astype(np.intp)
+        remainder = len(param.vehicles) - quotas.sum()
+        order = np.argsort(-(shares - np.floor(shares)), kind="stable")
+        quotas[order[:remainder]] += 1
+
+    # 출발지와 구역 중심이 가까운 순서로 배정
+    starts = np.array([vehicle.start for vehicle in param.vehicles], dtype=float)
+    centers = np.array([partition.center for partition in partitions])
+    distances = haversine(
+        starts[:, None, 0],
+        starts[:, None, 1],
+        centers[None, :, 0],
+        centers[None, :, 1],
+    )
+    assigned = np.zeros(len(param.vehicles), dtype=bool)
+    for flat in np.argsort(distances, axis=None, kind="stable"):
+        vehicle, partition = divmod(int(flat), len(partitions))
+        if assigned[vehicle] or quotas[partition] == 0:
+            continue
+        partitions[partition].vehicles.append(vehicle)
+        quotas[partition] -= 1
+        assigned[vehicle] = True
+    for partition in partitions:
+        partition.vehicles.sort()
+    return partitions
+
+
+def makespan(response: VRooutyResponse | None) -> int:
+    """
+    가장 늦게 끝나는 경로의 종료 시각 (미배정 Job이 있으면 최대값)
+    """
+    if response is None or response.unassigned:
+        return np.iinfo(np.int64).max
+    return max((route.steps[-1].arrival for route in response.routes), default=0)
+
+
+def stitch(responses: list[VRooutyResponse]) -> VRooutyResponse:
+    """
+    구역별 결과를 하나의 VRoouty 결과로 합침
+    계산 시간은 병렬로 수행되었으므로 구역 중 최대값 사용
+    """
+    summaries = [response.summary for response in responses]
+    return VRooutyResponse(
+        code=max(response.code for response in responses),
+        summary=Summary(
+            **{
+                field: sum(getattr(summary, field) for summary in summaries)
+                for field in (
+                    "service",
+                    "duration",
+                    "waiting_time",
+                    "distance",
+                    "routes",
+                    "unassigned",
+                    "setup",
+                    "cost",
+                    "priority",
+                )
+            },
+            violations=[
+                violation for summary in summaries for violation in summary.violations
+            ],
+            computing_times=ComputingTimes(
+                **{
+                    phase: max(
+                        getattr(summary.computing_times, phase)
+                        for summary in summaries
+                    )
+                    for phase in ("loading", "solving", "routing")
+                }
+            ),
+        ),
+        unassigned=[
+            unassigned for response in responses for unassigned in response.unassigned
+        ],
+        routes=[route for response in responses for route in response.routes],
+    )
+
+
+async def repair(
+    param: RequestParam,
+    partitions: list[Partition],
+    responses: list[VRooutyResponse],
+    solve: Solve,
+) -> bool:
+    """
+    경계 보정 : 가장 늦게 끝나는 구역의 경계 Job을 이웃 구역으로 옮겨 두 구역을 다시 요청
+    두 구역의 종료 시각이 모두 기존 최대값보다 빨라질 때만 반영
+    """
+    if len(partitions) < 2:
+        return False
+
+    coords = np.array([job.location for job in param.jobs], dtype=float)
+    centers = np.array([partition.center for partition in partitions])
+    spans = [makespan(response) for response in responses]
+    worst = int(np.argmax(spans))
+    jobs = partitions[worst].jobs
+
+    # 경계 Job (두 번째로 가까운 중심과의 거리 차이가 작은 Job)과 이웃 구역
+    distances = haversine(
+        coords[jobs, None, 0],
+        coords[jobs, None, 1],
+        centers[None, :, 0],
+        centers[None, :, 1],
+    )
+    own = distances[:, worst].copy()
+    distances[:, worst] = np.inf
+    neighbours = distances.argmin(axis=1)
+    ratio = own / np.maximum(distances.min(axis=1), 1.0)
+    boundary = ratio >= BOUNDARY_MARGIN
+    if not boundary.any():
+        return False
+
+    candidates = np.unique(neighbours[boundary])
+    target = int(candidates[np.argmin([spans[index] for index in candidates])])
+    moving = np.flatnonzero(boundary & (neighbours == target))
+    moving = moving[np.argsort(-ratio[moving], kind="stable")]
+    moving = moving[: max(1, int(len(jobs) * REPAIR_MOVE_RATIO))]
+    if len(moving) == len(jobs):
+        return False
+
+    source = Partition(jobs=np.delete(jobs, moving), center=partitions[worst].center)
+    source.vehicles = partitions[worst].vehicles
+    destination = Partition(
+        jobs=np.concatenate([partitions[target].jobs, jobs[moving]]),
+        center=partitions[target].center,
+    )
+    destination.vehicles = partitions[target].vehicles
+
+    source_result, destination_result = await asyncio.gather(
+        solve(source.param(param=param)), solve(destination.param(param=param))
+    )
+    if max(makespan(source_result), makespan(destination_result)) >= spans[worst]:
+        return False
+
+    partitions[worst], partitions[target] = source, destination
+    responses[worst], responses[target] = source_result, destination_result
+    return True
+
+
+async def solve_decomposed(
+    param: RequestParam,
+    solve: Solve,
+    n_partitions: int,
+    labels: np.ndarray | None = None,
+    repair_rounds: int = 0,
+    concurrency: int = 8,
+) -> VRooutyResponse | None:
+    """
+    Job을 구역으로 나누어 구역별로 동시에 요청한 뒤 결과를 합침
+    labels : Job별 구역 (없으면 좌표 군집화)
+    Shipment가 있거나 구역을 나눌 수 없으면 전체를 한 번에 요청
+    """
+    vehicles = param.vehicles or []
+    if param.shipments or len(vehicles) < 2 or len(param.jobs) < 2 or n_partitions < 2:
+        return await solve(param)
+
+    if labels is None:
+        coords = np.array([job.location for job in param.jobs], dtype=float)
+        labels = kmeans_labels(coords=coords, k=n_partitions)
+    partitions = build_partitions(
+        param=param, labels=labels, max_partitions=n_partitions
+    )
+    if len(partitions) < 2:
+        return await solve(param)
+
+    responses = await gather_with_limit(
+        [solve(partition.param(param=param)) for partition in partitions],
+        limit=concurrency,
+    )
+    if not all(responses):
+        return None
+
+    for _ in range(repair_rounds):
+        if not await repair(
+            param=param, partitions=partitions, responses=responses, solve=solve
+        ):
+            break
+
+    # 원래 차량 순서대로 경로 정렬
+    stitched = stitch(responses=responses)
+    vehicle_order = {vehicle.id: index for index, vehicle in enumerate(vehicles)}
+    stitched.routes.sort(key=lambda route: vehicle_order.get(route.vehicle, 0))
+    return stitched
@@ -0,0 +1,25 @@
+import numpy as np
+
+# 지구 반지름 (m)
+EARTH_RADIUS: float = 6_371_000.0
+
+
+def haversine(
+    longitude1: np.ndarray,
+    latitude1: np.ndarray,
+    longitude2: np.ndarray,
+    latitude2: np.ndarray,
+) -> np.ndarray:
+    """
+    두 좌표(배열) 사이의 대원 거리 (m), NumPy Broadcasting 지원
+    """
+    longitude1, latitude1, longitude2, latitude2 = map(
+        np.radians, (longitude1, latitude1, longitude2, latitude2)
+    )
+    a = (
+        np.sin((latitude2 - latitude1) / 2) ** 2
+        + np.cos(latitude1)
+        * np.cos(latitude2)
+        * np.sin((longitude2 - longitude1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
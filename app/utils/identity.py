@@ -1,5 +1,5 @@
-from enum import StrEnum
-from typing import Literal
+import sys
+from typing import Iterable, Literal
 
 ROLE = Literal[
     "pickup",
@@ -8,26 +8,34 @@ ROLE = Literal[
     "shipment_delivery",
     "shipment_assembly",
     "vehicle",
+    "aggregate",
 ]
 
 
 class IdHandler:
     """
     Pickup, Delivery, Vehicle Mapping용 Identity 부여
+    Controller(요청) 단위로 생성되며, 요청이 끝나면 함께 해제됨
     """
 
-    _unique_id: int = 0
-    _index_to_id: dict[tuple[str, str], int] = {}
-    _id_to_index: dict[int, tuple[str, str]] = {}
+    __slots__ = ("_id_to_index", "_index_to_id")
 
-    def get_id(self, index: dict) -> int:
+    def __init__(self) -> None:
+        # id는 0부터 순차 부여되므로 list 위치가 곧 id
+        self._id_to_index: list[tuple[str, str]] = []
+        self._index_to_id: dict[tuple[str, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self._id_to_index)
+
+    def get_id(self, index: tuple[str, str]) -> int:
         """
         return id to use index
         index : (status, works_id)
         """
         return self._index_to_id[index]
 
-    def get_index(self, id: int) -> dict:
+    def get_index(self, id: int) -> tuple[str, str]:
         """
         return index to use id
         index : (status, works_id)
@@ -36,11 +44,31 @@ class IdHandler:
 
     def set(self, role: ROLE, id: str) -> int:
         """
-        ROLE : "pickup", "delivery", "shipment_pickup", "shipment_delivery", "shipment_assembly", "vehicle",
+        ROLE : "pickup", "delivery", "shipment_pickup", "shipment_delivery", "shipment_assembly", "vehicle", "aggregate"
         """
         key = (role, id)
-        if key not in self._index_to_id:
-            self._id_to_index[self._unique_id] = key
-            self._index_to_id[key] = self._unique_id
-            self._unique_id += 1
-        return self._index_to_id[key]
+        unique_id = self._index_to_id.get(key)
+        if unique_id is None:
+            unique_id = len(self._id_to_index)
+            key = (sys.intern(role), id)
+            self._id_to_index.append(key)
+            self._index_to_id[key] = unique_id
+        return unique_id
+
+    def set_many(self, role: ROLE, ids: Iterable[str]) -> list[int]:
+        """
+        동일 ROLE의 id 목록을 한 번에 등록하고, 입력 순서대로 부여된 id 반환
+        """
+        role = sys.intern(role)
+        index_to_id = self._index_to_id
+        id_to_index = self._id_to_index
+        result = []
+        for id in ids:
+            key = (role, id)
+            unique_id = index_to_id.get(key)
+            if unique_id is None:
+                unique_id = len(id_to_index)
+                id_to_index.append(key)
+                index_to_id[key] = unique_id
+            result.append(unique_id)
+        return result
@@ -0,0 +1,13 @@
+import numpy as np
+
+
+def duplicated_location_mask(coords: np.ndarray) -> np.ndarray:
+    """
+    (N, 2) 좌표 배열에서 2회 이상 등장하는 좌표 여부(bool 배열) 반환
+    """
+    if not len(coords):
+        return np.zeros(0, dtype=bool)
+    _, inverse, counts = np.unique(
+        coords, axis=0, return_inverse=True, return_counts=True
+    )
+    return counts[inverse.reshape(-1)] >= 2
@@ -0,0 +1,193 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import replace
+
+import numpy as np
+
+from app.constants.matrix import (
+    MATRIX_CACHE_SIZE,
+    MATRIX_DETOUR_FACTOR,
+    MATRIX_MAX_LOCATIONS,
+    MATRIX_SPEED,
+)
+from app.models.vroouty import RequestParam
+from app.utils.geo import haversine
+
+Location = tuple[float, float]
+
+
+class LocationMatrix:
+    """
+    지점 목록과 지점 간 거리(m) / 시간(초) Matrix
+    """
+
+    __slots__ = ("locations", "index", "distances", "durations")
+
+    def __init__(
+        self, locations: list[Location], distances: np.ndarray, durations: np.ndarray
+    ) -> None:
+        self.locations = locations
+        self.index: dict[Location, int] = {
+            location: row for row, location in enumerate(locations)
+        }
+        self.distances = distances
+        self.durations = durations
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def covers(self, locations: list[Location]) -> bool:
+        index = self.index
+        return all(location in index for location in locations)
+
+    def sub(self, locations: list[Location]) -> "LocationMatrix":
+        """
+        일부 지점에 대한 Matrix (지점 순서는 입력 순서)
+        """
+        rows = np.fromiter(
+            (self.index[location] for location in locations),
+            dtype=np.intp,
+            count=len(locations),
+        )
+        selector = np.ix_(rows, rows)
+        return LocationMatrix(
+            locations=locations,
+            distances=self.distances[selector],
+            durations=self.durations[selector],
+        )
+
+
+class MatrixEngine:
+    """
+    직선 거리(Haversine) / 평균 속도 기반 거리·시간 Matrix 계산
+    같은 지점 목록 또는 이를 포함하는 Matrix가 Cache에 있으면 잘라서 재사용
+    (Cut Off 이전 경로, 릴레이, 재할당, 수거/배송 경로 및 요청 간 공유)
+    """
+
+    def __init__(
+        self,
+        speed: float = MATRIX_SPEED,
+        detour_factor: float = MATRIX_DETOUR_FACTOR,
+        max_size: int = MATRIX_CACHE_SIZE,
+        max_locations: int = MATRIX_MAX_LOCATIONS,
+    ) -> None:
+        self.speed = speed
+        self.detour_factor = detour_factor
+        self.max_size = max_size
+        self.max_locations = max_locations
+        self._cache: OrderedDict[str, LocationMatrix] = OrderedDict()
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def locations_key(locations: list[Location]) -> str:
+        return hashlib.sha256(
+            np.array(sorted(locations), dtype=float).tobytes()
+        ).hexdigest()
+
+    def compute(self, locations: list[Location]) -> LocationMatrix:
+        coords = np.array(locations, dtype=float).reshape(-1, 2)
+        longitudes, latitudes = coords[:, 0], coords[:, 1]
+        distances = (
+            haversine(
+                longitudes[:, None], latitudes[:, None], longitudes, latitudes
+            )
+            * self.detour_factor
+        )
+        return LocationMatrix(
+            locations=locations,
+            distances=np.rint(distances).astype(np.int64),
+            durations=np.rint(distances / self.speed).astype(np.int64),
+        )
+
+    def matrix(self, locations: list[Location]) -> LocationMatrix:
+        """
+        지점 목록(중복 없음)에 대한 Matrix
+        """
+        key = self.locations_key(locations)
+        if (cached := self._cache.get(key)) is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached.sub(locations)
+
+        for cached in reversed(self._cache.values()):
+            if len(cached) > len(locations) and cached.covers(locations):
+                self.partial_hits += 1
+                return cached.sub(locations)
+
+        self.misses += 1
+        matrix = self.compute(locations)
+        self._cache[key] = matrix
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return matrix
+
+    def attach(self, param: RequestParam) -> RequestParam:
+        """
+        요청에 Matrix와 각 Job / Vehicle의 location_index를 채운 사본 반환
+        지점 수가 `max_locations`를 넘으면 그대로 반환
+        """
+        index: dict[Location, int] = {}
+
+        def location_index(location) -> int:
+            return index.setdefault(tuple(location), len(index))
+
+        vehicles = [
+            vehicle.model_copy(
+                update={
+                    "start_index": location_index(vehicle.start),
+                    "end_index": (
+                        location_index(vehicle.end)
+                        if vehicle.end is not None
+                        else None
+                    ),
+                }
+            )
+            for vehicle in param.vehicles or []
+        ]
+        # Job은 요청 내에서 공유되므로 수정하지 않고 사본 생성
+        jobs = [
+            replace(job, location_index=location_index(job.location))
+            for job in param.jobs
+        ]
+        shipments = [
+            shipment.model_copy(
+                update={
+                    step: replace(
+                        getattr(shipment, step),
+                        location_index=location_index(
+                            getattr(shipment, step).location
+                        ),
+                    )
+                    for step in ("pickup", "delivery")
+                }
+            )
+            for shipment in param.shipments or []
+        ]
+        if not index or len(index) > self.max_locations:
+            return param
+
+        matrix = self.matrix(locations=list(index))
+        profile_matrix = {
+            "durations": matrix.durations.tolist(),
+            "distances": matrix.distances.tolist(),
+        }
+        profiles = {vehicle.profile or "car" for vehicle in vehicles}
+        return param.model_copy(
+            update={
+                "jobs": jobs,
+                "shipments": shipments,
+                "vehicles": vehicles,
+                "matrices": {profile: profile_matrix for profile in profiles},
+            }
+        )
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "partial_hits": self.partial_hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,225 @@
+import asyncio
+import bisect
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+# Prometheus 기본 Bucket에 VRoouty 호출 시간을 고려한 구간 추가 (초)
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300,
+)  # fmt: skip
+
+
+def _format_labels(labelnames: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not labelnames:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name, str(value).replace("\\", "\\\\").replace('"', '\\"')
+        )
+        for name, value in zip(labelnames, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """
+    누적 값 (Prometheus Counter)
+    """
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = tuple(labels[name] for name in self.labelnames)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self._values.items()):
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """
+    값 분포 (Prometheus Histogram)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # 구간별 개수 (마지막은 +Inf), 합계
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(labels[name] for name in self.labelnames)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                labels = _format_labels(
+                    (*self.labelnames, "le"), (*key, _format_value(bound))
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(self._sums[key])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Metric 목록과 Prometheus Text 형식 출력
+    """
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram] = {}
+
+    def counter(
+        self, name: str, help: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        return self._metrics.setdefault(name, Counter(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._metrics.setdefault(
+            name, Histogram(name, help, labelnames, buckets)
+        )
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+STAGE_SECONDS = metrics.histogram(
+    "jeju_stage_seconds",
+    "Endpoint 단계별 처리 시간 (parse, preprocess, solve, assembly, serialization)",
+    ("endpoint", "stage"),
+)
+SOLVER_REQUEST_SECONDS = metrics.histogram(
+    "vroouty_request_seconds",
+    "VRoouty HTTP 호출 1건의 응답 시간",
+    ("status",),
+)
+SOLVER_COMPUTING_SECONDS = metrics.histogram(
+    "vroouty_computing_seconds",
+    "VRoouty가 응답에 보고한 계산 시간 (summary.computing_times)",
+    ("phase",),
+)
+SOLVER_SOLVES = metrics.counter("vroouty_solves_total", "VRoouty 호출 수 (결과별)", ("outcome",))
+SOLVER_JOBS = metrics.counter("vroouty_jobs_total", "VRoouty 호출에 포함된 Job 수")
+SOLVER_SHIPMENTS = metrics.counter(
+    "vroouty_shipments_total", "VRoouty 호출에 포함된 Shipment 수"
+)
+SOLVER_VEHICLES = metrics.counter(
+    "vroouty_vehicles_total", "VRoouty 호출에 포함된 Vehicle 수"
+)
+
+# 현재 요청의 Endpoint 이름 (MetricsRoute가 설정)
+current_endpoint: ContextVar[str] = ContextVar("current_endpoint", default="unknown")
+# 현재 요청의 시작, Endpoint 진입/반환, 응답 생성 시각
+_marks: ContextVar[list[float]] = ContextVar("metrics_marks")
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """
+    현재 Endpoint의 단계별 처리 시간 기록
+    """
+    with STAGE_SECONDS.time(endpoint=current_endpoint.get(), stage=stage):
+        yield
+
+
+class MetricsRoute(APIRoute):
+    """
+    Body 파싱(Endpoint 진입 전)과 직렬화(Endpoint 반환 후) 시간을 기록하는 Route
+    """
+
+    def get_route_handler(self) -> Callable:
+        endpoint = self.dependant.call
+        if not asyncio.iscoroutinefunction(endpoint):
+            return super().get_route_handler()
+
+        async def timed_endpoint(**values):
+            _marks.get().append(time.perf_counter())
+            result = await endpoint(**values)
+            # Endpoint가 직접 Response를 만든 경우 직렬화 시간은 Endpoint에서 기록
+            if not isinstance(result, Response):
+                _marks.get().append(time.perf_counter())
+            return result
+
+        # FastAPI는 실행 시점에 `dependant.call`을 호출하므로 그대로 교체
+        self.dependant.call = timed_endpoint
+        handler = super().get_route_handler()
+        endpoint_name = self.path_format
+
+        async def route_handler(request: Request) -> Response:
+            marks = [time.perf_counter()]
+            _marks.set(marks)
+            current_endpoint.set(endpoint_name)
+            response = await handler(request)
+            marks.append(time.perf_counter())
+            if len(marks) >= 3:
+                STAGE_SECONDS.observe(
+                    marks[1] - marks[0], endpoint=endpoint_name, stage="parse"
+                )
+            if len(marks) == 4:
+                STAGE_SECONDS.observe(
+                    marks[3] - marks[2], endpoint=endpoint_name, stage="serialization"
+                )
+            return response
+
+        return route_handler
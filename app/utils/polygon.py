@@ -1,3 +1,6 @@
+import numpy as np
+import shapely
+from shapely import STRtree
 from shapely.geometry import Point, Polygon
 
 from app.schemas.request import Coordinate
@@ -10,3 +13,43 @@ def assign_group_id(location: list[float], polygons: dict[str, Polygon]) -> int
         if polygon.contains(point):
             return polygon_id
     return None
+
+
+class BoundaryIndex:
+    """
+    권역 Polygon에 대한 공간 Index
+    Prepared Polygon과 STRtree로 다수 좌표의 권역을 한 번에 판별
+    """
+
+    def __init__(self, polygons: dict[str, Polygon]) -> None:
+        # 마지막 원소(None)는 어느 권역에도 속하지 않는 좌표용
+        self.ids = np.array([*polygons.keys(), None], dtype=object)
+        self.polygons = np.array(list(polygons.values()), dtype=object)
+        shapely.prepare(self.polygons)
+        self.tree = STRtree(self.polygons)
+
+    def __len__(self) -> int:
+        return len(self.polygons)
+
+    def assign(self, longitudes: np.ndarray, latitudes: np.ndarray) -> np.ndarray:
+        """
+        좌표 배열에 대한 권역 ID 배열 반환 (권역 밖은 None)
+        여러 권역에 속하는 경우 `assign_group_id`와 동일하게 먼저 등록된 권역 우선
+        """
+        longitudes = np.asarray(longitudes, dtype=float)
+        latitudes = np.asarray(latitudes, dtype=float)
+
+        # STRtree로 Bounding Box 후보를 찾은 뒤, Prepared Polygon으로 포함 여부 판별
+        point_index, polygon_index = self.tree.query(
+            shapely.points(longitudes, latitudes)
+        )
+        contained = shapely.contains_xy(
+            self.polygons[polygon_index],
+            longitudes[point_index],
+            latitudes[point_index],
+        )
+
+        matched = np.full(len(longitudes), len(self.polygons), dtype=np.intp)
+        np.minimum.at(matched, point_index[contained], polygon_index[contained])
+        return self.ids[matched]
+
@@ -0,0 +1,224 @@
+import asyncio
+import cProfile
+import io
+import itertools
+import marshal
+import os
+import pstats
+import random
+import time
+from collections import deque
+
+from fastapi import Request
+
+from app.constants.profiling import (
+    PROFILE_BUFFER_SIZE,
+    PROFILE_HEADER,
+    PROFILE_SAMPLE_RATE,
+)
+
+# Project Root (이 경로 아래의 Frame만 남김)
+PROJECT_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+FuncKey = tuple[str, int, str]
+
+
+def project_stats(profiler: cProfile.Profile) -> pstats.Stats:
+    """
+    Project Frame만 남긴 Stats (파일 경로는 Project Root 기준 상대 경로)
+    """
+    stats = pstats.Stats(profiler)
+    filtered = pstats.Stats()
+
+    def trim(func: FuncKey) -> FuncKey | None:
+        filename, lineno, funcname = func
+        # Project 안의 가상환경(site-packages)은 제외
+        if not filename.startswith(PROJECT_DIR) or "site-packages" in filename:
+            return None
+        return os.path.relpath(filename, PROJECT_DIR), lineno, funcname
+
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        if (key := trim(func)) is None:
+            continue
+        filtered.stats[key] = (
+            cc,
+            nc,
+            tt,
+            ct,
+            {
+                caller_key: value
+                for caller, value in callers.items()
+                if (caller_key := trim(caller)) is not None
+            },
+        )
+    filtered.get_top_level_stats()
+    return filtered
+
+
+def collapsed_stacks(stats: pstats.Stats) -> str:
+    """
+    Flamegraph용 Collapsed Stack (`a;b;c <마이크로초>`)
+    cProfile은 호출 관계만 기록하므로, 누적 시간이 가장 큰 호출자를 따라 올라가 Stack을 구성
+    """
+    def label(func: FuncKey) -> str:
+        filename, lineno, funcname = func
+        return f"{filename}:{lineno}({funcname})"
+
+    lines = []
+    for func, (_, _, tt, _, _) in stats.stats.items():
+        weight = round(tt * 1_000_000)
+        if weight <= 0:
+            continue
+        stack = [func]
+        while True:
+            callers = stats.stats[stack[-1]][4]
+            callers = {
+                caller: value
+                for caller, value in callers.items()
+                if caller in stats.stats and caller not in stack
+            }
+            if not callers:
+                break
+            stack.append(max(callers, key=lambda caller: callers[caller][3]))
+        lines.append(f"{';'.join(label(frame) for frame in reversed(stack))} {weight}")
+    return "\n".join(sorted(lines))
+
+
+class ProfileRecord:
+    """
+    요청 하나의 Profiling 결과
+    """
+
+    __slots__ = ("id", "method", "path", "status", "started_at", "duration", "stats")
+
+    def __init__(
+        self,
+        id: int,
+        method: str,
+        path: str,
+        status: int,
+        started_at: float,
+        duration: float,
+        stats: pstats.Stats,
+    ) -> None:
+        self.id = id
+        self.method = method
+        self.path = path
+        self.status = status
+        self.started_at = started_at
+        self.duration = duration
+        self.stats = stats
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "status": self.status,
+            "started_at": self.started_at,
+            "duration": self.duration,
+        }
+
+
+class ProfileBuffer:
+    """
+    최근 Profiling 결과를 보관하는 Ring Buffer
+    """
+
+    def __init__(self, max_size: int = PROFILE_BUFFER_SIZE) -> None:
+        self._records: deque[ProfileRecord] = deque(maxlen=max_size)
+        self._ids = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def add(self, record: ProfileRecord) -> None:
+        self._records.append(record)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    def records(self, path: str | None = None) -> list[ProfileRecord]:
+        return [
+            record for record in self._records if path is None or record.path == path
+        ]
+
+    def aggregate(self, path: str | None = None) -> pstats.Stats | None:
+        """
+        보관 중인 결과를 하나의 Stats로 합침 (path 지정 시 해당 경로만)
+        """
+        records = self.records(path=path)
+        if not records:
+            return None
+        stats = pstats.Stats()
+        for record in records:
+            stats.add(record.stats)
+        return stats
+
+    @staticmethod
+    def render(stats: pstats.Stats, limit: int = 30) -> str:
+        """
+        pstats 출력 (자체 실행 시간 순)
+        """
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(limit)
+        return stream.getvalue()
+
+    @staticmethod
+    def dump(stats: pstats.Stats) -> bytes:
+        """
+        `pstats.Stats(파일)`, snakeviz 등에서 읽을 수 있는 Binary 형식
+        """
+        return marshal.dumps(stats.stats)
+
+
+profile_buffer = ProfileBuffer()
+
+# 하나의 Thread에서는 Profiler를 동시에 하나만 켤 수 있으므로 동시에 한 요청만 Profiling
+_profile_lock = asyncio.Lock()
+_sampler = random.Random()
+
+
+def should_profile(request: Request) -> bool:
+    if request.headers.get(PROFILE_HEADER) == "1":
+        return True
+    return PROFILE_SAMPLE_RATE > 0 and _sampler.random() < PROFILE_SAMPLE_RATE
+
+
+async def profile_request(request: Request, call_next):
+    """
+    요청 단위 CPU Profiling Middleware (`PROFILE_ENABLED`일 때만 등록)
+    Event Loop 단위로 측정되므로 같은 시간에 처리된 다른 요청의 Frame도 일부 포함될 수 있음
+    """
+    if not should_profile(request) or _profile_lock.locked():
+        return await call_next(request)
+
+    async with _profile_lock:
+        profiler = cProfile.Profile()
+        started_at = time.time()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            response = await call_next(request)
+        finally:
+            profiler.disable()
+        duration = time.perf_counter() - started
+
+    record = ProfileRecord(
+        id=profile_buffer.next_id(),
+        method=request.method,
+        path=request.url.path,
+        status=response.status_code,
+        started_at=started_at,
+        duration=duration,
+        stats=project_stats(profiler),
+    )
+    profile_buffer.add(record)
+    response.headers["X-Profile-Id"] = str(record.id)
+    return response
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+def assign_fields(model: BaseModel, fields: dict) -> None:
+    """
+    검증 없이 Model 필드 일괄 할당 (요청 전처리처럼 주문 수만큼 반복하는 경로용)
+    `BaseModel.__setattr__`의 필드별 확인 과정을 생략 (50k 주문 기준 약 1.1s -> 0.2s)
+
+    Pydantic 2.7 내부 구조(`__dict__`, `__pydantic_fields_set__`)에 직접 기록하므로
+    Pydantic 버전을 올릴 때 확인 필요
+    `validate_assignment`를 사용하는 Model은 일반 할당으로 처리
+    """
+    if model.model_config.get("validate_assignment"):
+        for name, value in fields.items():
+            setattr(model, name, value)
+        return
+    model.__dict__.update(fields)
+    model.__pydantic_fields_set__.update(fields)
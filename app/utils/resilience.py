@@ -0,0 +1,113 @@
+import random
+import time
+from collections import deque
+from enum import StrEnum
+
+
+class LatencyTracker:
+    """
+    최근 성공 호출의 지연 시간 (Hedging 기준값 계산용)
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20) -> None:
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        self._samples.append(latency)
+
+    def percentile(self, q: float) -> float | None:
+        """
+        q 백분위수 (표본이 부족하면 None)
+        """
+        if len(self._samples) < self.min_samples:
+            return None
+        samples = sorted(self._samples)
+        index = min(len(samples) - 1, int(len(samples) * q / 100))
+        return samples[index]
+
+
+class RetryBudget:
+    """
+    재시도 예산
+    요청마다 `ratio`만큼 적립하고 재시도(및 Hedging)마다 1씩 사용
+    장애 시 재시도가 요청 수의 `ratio` 비율을 넘지 않도록 제한
+    """
+
+    def __init__(self, ratio: float, reserve: float = 10) -> None:
+        self.ratio = ratio
+        self.reserve = reserve
+        self.tokens = reserve
+
+    def deposit(self) -> None:
+        self.tokens = min(self.reserve, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+def jittered_backoff(attempt: int, base: float, maximum: float) -> float:
+    """
+    Full Jitter 지수 Backoff 대기 시간
+    """
+    return random.uniform(0, min(maximum, base * (2**attempt)))
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 `threshold`회 이상이면 `recovery_time` 동안 호출 차단
+    이후 한 건만 시험 호출(HALF_OPEN)하여 성공 시 복구
+    (시험 호출이 결과 없이 `recovery_time`을 넘기면 다른 호출로 다시 시험)
+    """
+
+    def __init__(self, threshold: int, recovery_time: float) -> None:
+        self.threshold = threshold
+        self.recovery_time = recovery_time
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._probe_started: float | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        if self.opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self.opened_at < self.recovery_time:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN:
+            now = time.monotonic()
+            if (
+                self._probe_started is None
+                or now - self._probe_started >= self.recovery_time
+            ):
+                self._probe_started = now
+                return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_started = None
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
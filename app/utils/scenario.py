@@ -0,0 +1,173 @@
+import random
+
+import numpy as np
+
+from app.constants.boundary import DEFAULT_BOUNDARY_SET_ID
+from app.constants.vehicles import DELIVERY_DRIVERS
+from app.constants.work import WorkStatus
+from app.schemas.request import JejuRequest
+from app.utils.boundary import boundary_registry
+from app.utils.common import (
+    get_random_4_number,
+    get_random_jeju_coordinates,
+    get_random_korean_string,
+)
+
+# 기본 집결지 (오등동센터)
+DEFAULT_ASSEMBLY: dict = {
+    "id": "오등동센터",
+    "location": [126.527605494059, 33.4630226882414],
+    "capacity": 0,
+}
+
+# 기본 주문 상태 비율
+DEFAULT_STATUS_MIX: dict[str, float] = {
+    WorkStatus.WAITING: 0.7,
+    WorkStatus.SHIPPED: 0.2,
+    WorkStatus.DONE: 0.1,
+}
+
+# 좌표 생성 최대 반복 횟수 (권역이 좁아 좌표가 모이지 않는 경우 중단)
+MAX_SAMPLE_ROUNDS: int = 100
+
+
+def sample_jeju_locations(
+    n: int, group_ids: set[str] | None = None, boundary_set_id: str | None = None
+) -> list[list[float]]:
+    """
+    권역 안의 랜덤 좌표 n개 생성 ([longitude, latitude])
+    group_ids가 주어지면 해당 권역 안의 좌표만 생성
+    권역 Set에 없는 권역이 있거나 `MAX_SAMPLE_ROUNDS`번 안에 채우지 못하면 ValueError
+    """
+    index = boundary_registry.get(boundary_set_id or DEFAULT_BOUNDARY_SET_ID)
+    if group_ids is not None and (unknown := set(group_ids) - set(index.ids[:-1])):
+        raise ValueError(f"Unknown group ids: {sorted(unknown)}")
+
+    locations: list[list[float]] = []
+    rounds = 0
+    while len(locations) < n:
+        if rounds == MAX_SAMPLE_ROUNDS:
+            raise ValueError(
+                f"Sampled {len(locations)} of {n} locations "
+                f"in {MAX_SAMPLE_ROUNDS} rounds (group ids: {group_ids})"
+            )
+        rounds += 1
+        # 권역 밖 좌표를 고려하여 넉넉하게 생성 후 걸러냄
+        candidates = np.array(
+            [get_random_jeju_coordinates() for _ in range((n - len(locations)) * 2)]
+        )
+        latitudes, longitudes = candidates[:, 0], candidates[:, 1]
+        assigned = index.assign(longitudes=longitudes, latitudes=latitudes)
+        for longitude, latitude, group_id in zip(longitudes, latitudes, assigned):
+            if group_id is not None and (group_ids is None or group_id in group_ids):
+                locations.append([float(longitude), float(latitude)])
+    return locations[:n]
+
+
+def generate_jeju_request(
+    n_works: int,
+    n_vehicles: int = len(DELIVERY_DRIVERS),
+    seed: int | None = None,
+    duplicate_ratio: float = 0.2,
+    status_mix: dict[str, float] | None = None,
+    exception_ratio: float = 0.0,
+    boundary_set_id: str | None = None,
+) -> JejuRequest:
+    """
+    벤치마크/부하 테스트용 JejuRequest 생성
+    - seed : 같은 seed는 같은 요청 생성 (전역 random 상태는 호출 전으로 복원)
+    - duplicate_ratio : 수거/배송지가 다른 주문과 겹치는 주문 비율 (아파트 단지, 시장 등)
+    - status_mix : 주문 상태 비율 (예: {"waiting": 0.7, "shipped": 0.2, "done": 0.1})
+    - exception_ratio : 차량이 지정된(exception) 주문 비율
+    적재(shipped) 주문은 지정 차량 또는 수거지 권역 담당 차량에 실린 것으로 생성
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        # 차량 (기본 기사 권역을 순환 배정)
+        drivers = list(DELIVERY_DRIVERS.items())
+        vehicles = []
+        for index in range(n_vehicles):
+            name, groups = drivers[index % len(drivers)]
+            vehicle_id = name if index < len(drivers) else f"{name}{index}"
+            vehicles.append(
+                {
+                    "id": vehicle_id,
+                    "profile": "car",
+                    "current_location": sample_jeju_locations(
+                        1, boundary_set_id=boundary_set_id
+                    )[0],
+                    "include": groups["include"],
+                    "exclude": groups["exclude"],
+                }
+            )
+
+        # 수거지는 차량 담당 권역 안에서만 생성 (담당 차량이 없는 권역 제외)
+        include_groups = {
+            group_id for vehicle in vehicles for group_id in vehicle["include"]
+        }
+        n_hotspots = max(1, int(n_works * duplicate_ratio / 5))
+        pickup_hotspots = sample_jeju_locations(
+            n_hotspots, group_ids=include_groups, boundary_set_id=boundary_set_id
+        )
+        delivery_hotspots = sample_jeju_locations(
+            n_hotspots, boundary_set_id=boundary_set_id
+        )
+        pickups = sample_jeju_locations(
+            n_works, group_ids=include_groups, boundary_set_id=boundary_set_id
+        )
+        deliveries = sample_jeju_locations(n_works, boundary_set_id=boundary_set_id)
+
+        status_mix = status_mix or DEFAULT_STATUS_MIX
+        statuses = random.choices(
+            list(status_mix), weights=list(status_mix.values()), k=n_works
+        )
+
+        works = []
+        for index in range(n_works):
+            pickup, delivery = pickups[index], deliveries[index]
+            if random.random() < duplicate_ratio:
+                pickup = random.choice(pickup_hotspots)
+            if random.random() < duplicate_ratio:
+                delivery = random.choice(delivery_hotspots)
+
+            work = {
+                "id": f"{get_random_4_number()}-{get_random_korean_string(3)}-{index}",
+                "pickup": {"location": pickup},
+                "delivery": {"location": delivery},
+                "status": {"type": statuses[index]},
+                "exception": False,
+            }
+            if random.random() < exception_ratio:
+                work["exception"] = True
+                work["fix_vehicle_id"] = random.choice(vehicles)["id"]
+            works.append(work)
+
+        # 적재 주문의 차량 (같은 권역을 여러 차량이 담당하면 뒤 차량, Controller 배정과 동일)
+        group_owners = {
+            group_id: vehicle["id"]
+            for vehicle in vehicles
+            for group_id in vehicle["include"]
+        }
+        index = boundary_registry.get(boundary_set_id or DEFAULT_BOUNDARY_SET_ID)
+        pickup_coords = np.array(
+            [work["pickup"]["location"] for work in works], dtype=float
+        ).reshape(-1, 2)
+        pickup_groups = index.assign(
+            longitudes=pickup_coords[:, 0], latitudes=pickup_coords[:, 1]
+        )
+        for work, group_id in zip(works, pickup_groups):
+            if work["status"]["type"] == WorkStatus.SHIPPED:
+                work["status"]["vehicle_id"] = (
+                    work.get("fix_vehicle_id") or group_owners[group_id]
+                )
+
+        return JejuRequest(
+            current_time="2024-01-18T08:00:00+09:00",
+            works=works,
+            vehicles=vehicles,
+            assemblies=[DEFAULT_ASSEMBLY],
+            boundary_set_id=boundary_set_id or DEFAULT_BOUNDARY_SET_ID,
+        )
+    finally:
+        random.setstate(state)
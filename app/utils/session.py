@@ -0,0 +1,317 @@
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import numpy as np
+
+from app.constants.session import (
+    PLAN_SESSION_MAX_AFFECTED_RATIO,
+    PLAN_SESSION_SIZE,
+    PLAN_SESSION_TTL,
+)
+from app.constants.work import TaskType, WorkStatus
+from app.schemas.request import JejuRequest, Work
+from app.schemas.response import AfterResponse
+from app.utils.boundary import boundaries_hash
+
+
+def work_signature(work: Work) -> tuple:
+    return (
+        work.status.type,
+        work.status.vehicle_id,
+        tuple(work.pickup.location),
+        tuple(work.delivery.location),
+        work.exception,
+        work.fix_vehicle_id,
+    )
+
+
+class PlanSnapshot:
+    """
+    경로 계산에 사용된 요청의 주문/차량 상태
+    (Controller 처리 중 상태가 바뀌므로 처리 전에 생성)
+    """
+
+    __slots__ = ("works", "vehicles", "assemblies", "boundaries")
+
+    def __init__(self, request: JejuRequest) -> None:
+        self.works: dict[str, tuple] = {
+            work.id: work_signature(work) for work in request.works
+        }
+        self.vehicles: dict[str, tuple] = {
+            vehicle.id: (vehicle.profile, tuple(vehicle.current_location))
+            for vehicle in request.vehicles
+        }
+        self.assemblies = tuple(
+            (assembly.id, tuple(assembly.location)) for assembly in request.assemblies
+        )
+        self.boundaries = (
+            request.boundary_set_id,
+            boundaries_hash(request.boundaries) if request.boundaries else None,
+        )
+
+
+class PlanSession:
+    """
+    Session별 마지막 Cut Off 이후 경로
+    """
+
+    __slots__ = (
+        "snapshot",
+        "response",
+        "pickup_assignment",
+        "delivery_assignment",
+        "updated_at",
+    )
+
+    def __init__(self, snapshot: PlanSnapshot, response: AfterResponse) -> None:
+        self.snapshot = snapshot
+        self.response = response
+        self.updated_at = time.monotonic()
+
+        # 주문별 담당 차량 (수거 / 배송)
+        self.pickup_assignment: dict[str, str] = {
+            task.work_id: vehicle_tasks.vehicle_id
+            for vehicle_tasks in response.before_tasks
+            for task in vehicle_tasks.tasks
+            if task.type == TaskType.PICKUP
+        }
+        self.delivery_assignment: dict[str, str] = {
+            task.work_id: vehicle_tasks.vehicle_id
+            for vehicle_tasks in response.after_tasks
+            for task in vehicle_tasks.tasks
+            if task.work_id
+        }
+
+
+class PlanChanges:
+    """
+    이전 경로 대비 변경 사항 (다시 요청할 차량과 주문별 담당 차량)
+    """
+
+    __slots__ = (
+        "pickup_vehicle_ids",
+        "delivery_vehicle_ids",
+        "pickup_assignment",
+        "delivery_assignment",
+    )
+
+    def __init__(self, session: PlanSession) -> None:
+        self.pickup_vehicle_ids: set[str] = set()
+        self.delivery_vehicle_ids: set[str] = set()
+        self.pickup_assignment = dict(session.pickup_assignment)
+        self.delivery_assignment = dict(session.delivery_assignment)
+
+    def __bool__(self) -> bool:
+        return bool(self.pickup_vehicle_ids or self.delivery_vehicle_ids)
+
+    @property
+    def vehicle_ids(self) -> set[str]:
+        return self.pickup_vehicle_ids | self.delivery_vehicle_ids
+
+
+def diff_plan(
+    session: PlanSession,
+    request: JejuRequest,
+    snapshot: PlanSnapshot,
+    max_affected_ratio: float = PLAN_SESSION_MAX_AFFECTED_RATIO,
+) -> PlanChanges | None:
+    """
+    이전 경로와 요청을 비교하여 다시 요청할 차량 판별
+    - 주문 상태/위치 변경, 주문 추가/삭제 : 해당 주문의 수거/배송 담당 차량
+    - 적재(SHIPPED) 차량 변경 : 이전/이후 적재 차량의 수거 경로 (재할당 대상)
+    - 차량 위치 이동 : 해당 차량의 수거 경로 (배송 경로는 집결지에서 출발)
+    - 신규 주문 : 가장 가까운 차량 (수거는 현재 위치, 배송은 기존 배송지 기준)
+    - 이전 경로에서 배정되지 않은 주문 : 신규 주문과 같이 가장 가까운 차량
+    집결지, 권역, 차량 구성이 바뀌었거나 영향받은 차량이 많으면 None (전체 재계산)
+    """
+    previous = session.snapshot
+    if (
+        previous.assemblies != snapshot.assemblies
+        or previous.boundaries != snapshot.boundaries
+        or previous.vehicles.keys() != snapshot.vehicles.keys()
+    ):
+        return None
+
+    changes = PlanChanges(session=session)
+    vehicle_ids = list(snapshot.vehicles)
+    vehicle_locations = np.array(
+        [location for _, location in snapshot.vehicles.values()], dtype=float
+    )
+    delivery_points = [
+        (tuple(task.location), vehicle_tasks.vehicle_id)
+        for vehicle_tasks in session.response.after_tasks
+        for task in vehicle_tasks.tasks
+        if task.work_id
+    ]
+    delivery_locations = np.array(
+        [location for location, _ in delivery_points], dtype=float
+    ).reshape(-1, 2)
+
+    def nearest_pickup_vehicle(work: Work) -> str:
+        distance = ((vehicle_locations - work.pickup.location) ** 2).sum(axis=1)
+        return vehicle_ids[int(distance.argmin())]
+
+    def nearest_delivery_vehicle(work: Work) -> str:
+        if not delivery_points:
+            return nearest_pickup_vehicle(work)
+        distance = ((delivery_locations - work.delivery.location) ** 2).sum(axis=1)
+        return delivery_points[int(distance.argmin())][1]
+
+    def shipped_vehicle(signature: tuple | None) -> str | None:
+        if signature is None or signature[0] != WorkStatus.SHIPPED:
+            return None
+        vehicle_id = str(signature[1])
+        return vehicle_id if vehicle_id in snapshot.vehicles else None
+
+    def release(work_id: str, pickup: bool, delivery: bool) -> None:
+        if pickup and (vehicle_id := changes.pickup_assignment.pop(work_id, None)):
+            changes.pickup_vehicle_ids.add(vehicle_id)
+        if delivery and (vehicle_id := changes.delivery_assignment.pop(work_id, None)):
+            changes.delivery_vehicle_ids.add(vehicle_id)
+
+    # 차량 이동 및 Profile 변경
+    for vehicle_id, (profile, location) in snapshot.vehicles.items():
+        previous_profile, previous_location = previous.vehicles[vehicle_id]
+        if profile != previous_profile:
+            changes.pickup_vehicle_ids.add(vehicle_id)
+            changes.delivery_vehicle_ids.add(vehicle_id)
+        elif location != previous_location:
+            changes.pickup_vehicle_ids.add(vehicle_id)
+
+    # 삭제된 주문
+    for work_id in previous.works.keys() - snapshot.works.keys():
+        release(work_id=work_id, pickup=True, delivery=True)
+        if vehicle_id := shipped_vehicle(previous.works[work_id]):
+            changes.pickup_vehicle_ids.add(vehicle_id)
+
+    # 추가 또는 변경된 주문
+    for work in request.works:
+        signature = snapshot.works[work.id]
+        old = previous.works.get(work.id)
+        if signature == old:
+            continue
+
+        status = signature[0]
+        pickup_changed = (
+            old is None or old[:3] != signature[:3] or old[4:] != signature[4:]
+        )
+        delivery_changed = (
+            old is None
+            or old[3] != signature[3]
+            or (status == WorkStatus.DONE) != (old[0] == WorkStatus.DONE)
+        )
+        release(work_id=work.id, pickup=pickup_changed, delivery=delivery_changed)
+        for state in (old, signature):
+            if vehicle_id := shipped_vehicle(state):
+                changes.pickup_vehicle_ids.add(vehicle_id)
+
+        if pickup_changed and status == WorkStatus.WAITING:
+            vehicle_id = nearest_pickup_vehicle(work)
+            changes.pickup_assignment[work.id] = vehicle_id
+            changes.pickup_vehicle_ids.add(vehicle_id)
+        if delivery_changed and status != WorkStatus.DONE:
+            vehicle_id = nearest_delivery_vehicle(work)
+            changes.delivery_assignment[work.id] = vehicle_id
+            changes.delivery_vehicle_ids.add(vehicle_id)
+
+    # 이전 경로에서 빠진 수거 대기 / 미완료 주문 (변경이 없어도 매번 다시 배정)
+    for work in request.works:
+        status = snapshot.works[work.id][0]
+        if status == WorkStatus.WAITING and work.id not in changes.pickup_assignment:
+            vehicle_id = nearest_pickup_vehicle(work)
+            changes.pickup_assignment[work.id] = vehicle_id
+            changes.pickup_vehicle_ids.add(vehicle_id)
+        if status != WorkStatus.DONE and work.id not in changes.delivery_assignment:
+            vehicle_id = nearest_delivery_vehicle(work)
+            changes.delivery_assignment[work.id] = vehicle_id
+            changes.delivery_vehicle_ids.add(vehicle_id)
+
+    if len(changes.vehicle_ids) > max_affected_ratio * len(vehicle_ids):
+        return None
+    return changes
+
+
+class SessionLock:
+    """
+    Session별 Lock과 사용 중인 요청 수 (Lock을 가진 요청 + 대기 중인 요청)
+    """
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class PlanSessionStore:
+    """
+    Plan Session 보관소 (최대 개수와 유지 시간(TTL) 기준 LRU)
+    같은 Session의 요청은 순서대로 처리
+    Lock은 사용 중인 요청이 있는 동안만 보관 (Session 저장/삭제와 무관)
+    """
+
+    def __init__(
+        self, max_size: int = PLAN_SESSION_SIZE, ttl: float = PLAN_SESSION_TTL
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._sessions: OrderedDict[str, PlanSession] = OrderedDict()
+        self._locks: dict[str, SessionLock] = {}
+        self.full = 0
+        self.incremental = 0
+        self.unchanged = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @asynccontextmanager
+    async def lock(self, session_id: str) -> AsyncIterator[None]:
+        """
+        Session 단위 Lock (마지막 사용 요청이 끝나면 제거)
+        """
+        entry = self._locks.get(session_id)
+        if entry is None:
+            entry = self._locks[session_id] = SessionLock()
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if not entry.users:
+                del self._locks[session_id]
+
+    def get(self, session_id: str) -> PlanSession | None:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        if time.monotonic() - session.updated_at > self.ttl:
+            self.delete(session_id=session_id)
+            return None
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def set(self, session_id: str, session: PlanSession) -> None:
+        self._sessions[session_id] = session
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self.max_size:
+            self._sessions.popitem(last=False)
+
+    def delete(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._sessions),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "full": self.full,
+            "incremental": self.incremental,
+            "unchanged": self.unchanged,
+        }
+
+
+plan_sessions = PlanSessionStore()
@@ -0,0 +1,55 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    같은 key의 호출이 진행 중이면 새로 호출하지 않고 진행 중인 결과를 기다림
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future] = {}
+        self.leaders = 0
+        self.collapsed = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def join(self, key: str) -> asyncio.Future | None:
+        """
+        진행 중인 호출의 Future 반환 (없으면 None)
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.collapsed += 1
+        return future
+
+    def lead(self, key: str) -> asyncio.Future:
+        """
+        새 호출 등록, 호출이 끝나면 반드시 `finish` 호출
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.leaders += 1
+        return future
+
+    def finish(
+        self, key: str, result=None, exception: BaseException | None = None
+    ) -> None:
+        future = self._calls.pop(key, None)
+        if future is None or future.done():
+            return
+        if isinstance(exception, asyncio.CancelledError):
+            future.cancel()
+        elif exception is not None:
+            future.set_exception(exception)
+            # 기다리는 호출이 없어도 "exception was never retrieved" 경고가 나지 않도록 처리
+            future.exception()
+        else:
+            future.set_result(result)
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "collapsed": self.collapsed,
+        }
@@ -0,0 +1,58 @@
+from typing import AsyncIterator
+
+import orjson
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def encode_record(record_type: str, payload: dict, sse: bool) -> bytes:
+    """
+    Stream 레코드 하나를 NDJSON 한 줄 또는 Server-Sent Event로 직렬화
+    """
+    if sse:
+        data = orjson.dumps(payload)
+        return b"event: %s\ndata: %s\n\n" % (record_type.encode(), data)
+    return orjson.dumps({"type": record_type, **payload}) + b"\n"
+
+
+def dump_model(model: BaseModel) -> dict:
+    return model.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+def stream_records(
+    records: AsyncIterator[tuple[str, dict]], accept: str | None
+) -> StreamingResponse:
+    """
+    (레코드 종류, 내용) 목록을 Stream 응답으로 변환
+    `Accept: text/event-stream`이면 SSE, 아니면 NDJSON
+    처리 중 오류(HTTPException 외 예외는 500)는 응답 상태를 바꿀 수 없으므로
+    마지막 error 레코드로 전달 후 종료
+    """
+    sse = SSE_MEDIA_TYPE in (accept or "")
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            async for record_type, payload in records:
+                yield encode_record(record_type=record_type, payload=payload, sse=sse)
+        except HTTPException as exception:
+            yield encode_record(
+                record_type="error",
+                payload={"status": exception.status_code, "detail": exception.detail},
+                sse=sse,
+            )
+        except Exception as exception:
+            yield encode_record(
+                record_type="error",
+                payload={"status": 500, "detail": str(exception)},
+                sse=sse,
+            )
+
+    return StreamingResponse(
+        body(),
+        media_type=SSE_MEDIA_TYPE if sse else NDJSON_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
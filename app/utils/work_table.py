@@ -0,0 +1,217 @@
+from itertools import chain
+from typing import Callable, Iterable, Literal
+
+import numpy as np
+
+from app.constants.work import WorkStatus
+from app.schemas.request import Vehicle, Work
+
+# 상태 Code (`WorkTable.status` 값은 이 목록의 위치)
+STATUSES: tuple[WorkStatus, ...] = tuple(WorkStatus)
+STATUS_CODES: dict[WorkStatus, int] = {
+    status: code for code, status in enumerate(STATUSES)
+}
+
+
+class WorkTable:
+    """
+    요청 주문의 열(Column) 단위 NumPy 표현 (요청당 한 번 생성)
+    - 행 위치는 `request.works` 순서와 같음
+    - 권역 / 차량은 Code(목록 위치)로 저장하며 없으면 -1
+    - 권역 및 작업 시간은 전처리에서 `set_points`로 할당
+    - 상태 변경은 `set_status`로만 수행 (주문 Model과 함께 갱신)
+    선택 함수는 주문 위치 배열을 반환하며, 위치 배열을 받으면 해당 주문만 확인 (순서 유지)
+    """
+
+    __slots__ = (
+        "works",
+        "index",
+        "vehicle_ids",
+        "group_ids",
+        "pickup_coords",
+        "delivery_coords",
+        "status",
+        "pickup_group",
+        "delivery_group",
+        "vehicle",
+        "fix_vehicle",
+        "exception",
+        "pickup_setup",
+        "pickup_service",
+        "delivery_setup",
+        "delivery_service",
+    )
+
+    def __init__(self, works: list[Work], vehicles: list[Vehicle]) -> None:
+        self.works = works
+        self.index: dict[str, int] = {
+            work.id: index for index, work in enumerate(works)
+        }
+        self.vehicle_ids: list[str] = [vehicle.id for vehicle in vehicles]
+        vehicle_codes = {
+            vehicle_id: code for code, vehicle_id in enumerate(self.vehicle_ids)
+        }
+
+        def column(values: Iterable, dtype) -> np.ndarray:
+            return np.fromiter(values, dtype=dtype, count=len(works))
+
+        # 좌표는 (N, 2) 배열 (Tuple 목록 변환보다 빠르도록 값을 펼쳐서 생성)
+        self.pickup_coords = np.fromiter(
+            chain.from_iterable(work.pickup.location for work in works),
+            dtype=float,
+            count=len(works) * 2,
+        ).reshape(-1, 2)
+        self.delivery_coords = np.fromiter(
+            chain.from_iterable(work.delivery.location for work in works),
+            dtype=float,
+            count=len(works) * 2,
+        ).reshape(-1, 2)
+        self.status = column(
+            (STATUS_CODES[work.status.type] for work in works), np.int8
+        )
+        self.vehicle = column(
+            (vehicle_codes.get(work.status.vehicle_id, -1) for work in works), np.intp
+        )
+        self.fix_vehicle = column(
+            (vehicle_codes.get(work.fix_vehicle_id, -1) for work in works), np.intp
+        )
+        self.exception = column((bool(work.exception) for work in works), bool)
+
+        # 권역 Code (권역 id -> Code) 및 수거/배송지 권역, 작업 시간(초)
+        self.group_ids: dict[str, int] = {}
+        self.pickup_group = np.full(len(works), -1, dtype=np.intp)
+        self.delivery_group = np.full(len(works), -1, dtype=np.intp)
+        self.pickup_setup = np.zeros(len(works), dtype=np.int64)
+        self.pickup_service = np.zeros(len(works), dtype=np.int64)
+        self.delivery_setup = np.zeros(len(works), dtype=np.int64)
+        self.delivery_service = np.zeros(len(works), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.works)
+
+    def _positions(self, indices: np.ndarray | None) -> np.ndarray:
+        if indices is None:
+            return np.arange(len(self.works))
+        return np.asarray(indices, dtype=np.intp)
+
+    def set_points(
+        self,
+        role: Literal["pickup", "delivery"],
+        group_ids: np.ndarray,
+        setup: np.ndarray,
+        service: np.ndarray,
+    ) -> None:
+        """
+        수거/배송지의 권역(id 배열, 없으면 None)과 작업 시간(초) 할당
+        """
+        codes = np.full(len(group_ids), -1, dtype=np.intp)
+        assigned = np.not_equal(group_ids, None)
+        if assigned.any():
+            names, inverse = np.unique(
+                group_ids[assigned].astype(str), return_inverse=True
+            )
+            lookup = np.array(
+                [
+                    self.group_ids.setdefault(name, len(self.group_ids))
+                    for name in names.tolist()
+                ],
+                dtype=np.intp,
+            )
+            codes[assigned] = lookup[inverse.reshape(-1)]
+
+        if role == "pickup":
+            self.pickup_group, self.pickup_setup, self.pickup_service = (
+                codes,
+                setup,
+                service,
+            )
+        else:
+            self.delivery_group, self.delivery_setup, self.delivery_service = (
+                codes,
+                setup,
+                service,
+            )
+
+    def group_codes(self, group_ids: Iterable[str | None]) -> np.ndarray:
+        """
+        권역 id 목록의 Code 배열 (주문에 없는 권역은 제외)
+        """
+        return np.array(
+            [
+                self.group_ids[group_id]
+                for group_id in group_ids
+                if group_id in self.group_ids
+            ],
+            dtype=np.intp,
+        )
+
+    def with_status(
+        self,
+        condition: Callable[[WorkStatus], bool] | Iterable[WorkStatus],
+        indices: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        상태가 조건에 맞는 주문 위치
+        condition : 상태 목록 또는 상태별 조건 함수 (주문별이 아닌 상태별로 한 번씩 판별)
+        """
+        if callable(condition):
+            statuses = [status for status in STATUSES if condition(status)]
+        else:
+            statuses = list(condition)
+        codes = [STATUS_CODES[status] for status in statuses]
+
+        indices = self._positions(indices)
+        return indices[np.isin(self.status[indices], codes)]
+
+    def in_groups(
+        self,
+        role: Literal["pickup", "delivery"],
+        group_ids: Iterable[str],
+        indices: np.ndarray,
+    ) -> np.ndarray:
+        """
+        주문의 수거/배송지 권역이 목록에 포함되는지 여부 (indices 순서의 bool 배열)
+        """
+        groups = self.pickup_group if role == "pickup" else self.delivery_group
+        return np.isin(groups[indices], self.group_codes(group_ids=group_ids))
+
+    def split_by_vehicle(
+        self, indices: np.ndarray, vehicles: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """
+        주문 위치를 차량별로 나눔 (vehicles : indices별 차량 Code, -1은 제외)
+        """
+        order = np.argsort(vehicles, kind="stable")
+        bounds = np.searchsorted(vehicles[order], np.arange(len(self.vehicle_ids) + 1))
+        return {
+            vehicle_id: indices[order[bounds[code] : bounds[code + 1]]]
+            for code, vehicle_id in enumerate(self.vehicle_ids)
+        }
+
+    def owners(self, vehicles: list[Vehicle]) -> np.ndarray:
+        """
+        주문별 담당 차량 Code (예외 주문은 지정 차량, 나머지는 수거지 권역 담당 차량)
+        같은 권역을 여러 차량이 담당하면 뒤 차량 우선, 담당 차량이 없으면 -1
+        """
+        # 마지막 원소(-1)는 권역이 없는 주문용
+        group_owner = np.full(len(self.group_ids) + 1, -1, dtype=np.intp)
+        for code, vehicle in enumerate(vehicles):
+            group_owner[self.group_codes(group_ids=vehicle.include)] = code
+        return np.where(
+            self.exception, self.fix_vehicle, group_owner[self.pickup_group]
+        )
+
+    def shipped_by_vehicle(self) -> dict[str, np.ndarray]:
+        """
+        차량별 적재(SHIPPED) 주문 위치
+        """
+        shipped = self.with_status(condition=[WorkStatus.SHIPPED])
+        return self.split_by_vehicle(indices=shipped, vehicles=self.vehicle[shipped])
+
+    def set_status(self, work_ids: Iterable[str], status: WorkStatus) -> None:
+        code = STATUS_CODES[status]
+        for work_id in work_ids:
+            index = self.index.get(work_id)
+            if index is not None:
+                self.works[index].status.type = status
+                self.status[index] = code
@@ -0,0 +1,123 @@
+"""
+VRoouty 요청/응답 직렬화 경로 비교
+
+    python -m benchmarks.bench_codec
+
+- legacy : json.loads(model_dump_json()) -> json.dumps -> json.loads -> VRooutyResponse(**)
+- orjson : orjson.loads -> VRooutyResponse.model_validate
+- fast   : model_dump_json bytes -> VRooutyResponse.model_validate_json
+"""
+
+import json
+import timeit
+
+import orjson
+
+from app.models.vroouty import Job, RequestParam, Vehicle, VRooutyResponse
+from app.utils.codec import decode_response, encode_request
+
+BASE_LOCATION = (126.5312, 33.4996)
+
+
+def make_request_param(n_jobs: int) -> RequestParam:
+    return RequestParam(
+        jobs=[
+            Job(
+                id=i,
+                location=(BASE_LOCATION[0] + i * 1e-5, BASE_LOCATION[1] + i * 1e-5),
+                setup=180,
+                service=10,
+            )
+            for i in range(n_jobs)
+        ],
+        shipments=[],
+        vehicles=[Vehicle(id=n_jobs, profile="car", start=BASE_LOCATION)],
+        distribute_options={"custom_matrix": {"enabled": True}},
+    )
+
+
+def make_response_body(n_jobs: int) -> bytes:
+    def common(**kwargs) -> dict:
+        fields = {
+            "service": 0,
+            "duration": 0,
+            "waiting_time": 0,
+            "violations": [],
+            "distance": 0,
+        }
+        fields.update(kwargs)
+        return fields
+
+    def step(step_type: str, index: int, **kwargs) -> dict:
+        return common(
+            type=step_type,
+            arrival=index * 60,
+            setup=0,
+            location=list(BASE_LOCATION),
+            location_index=index,
+            **kwargs,
+        )
+
+    steps = [step("start", 0)]
+    steps.extend(step("job", i + 1, id=i) for i in range(n_jobs))
+    steps.append(step("end", n_jobs + 1))
+    return orjson.dumps(
+        {
+            "code": 0,
+            "summary": common(
+                routes=1,
+                unassigned=0,
+                setup=0,
+                cost=0,
+                priority=0,
+                computing_times={"loading": 0, "solving": 0, "routing": 0},
+            ),
+            "unassigned": [],
+            "routes": [
+                common(
+                    vehicle=n_jobs,
+                    steps=steps,
+                    cost=0,
+                    setup=0,
+                    priority=0,
+                    geometry=None,
+                )
+            ],
+        }
+    )
+
+
+def legacy_path(param: RequestParam, body: bytes) -> tuple[bytes, VRooutyResponse]:
+    payload = json.dumps(json.loads(param.model_dump_json())).encode()
+    response = json.loads(body)
+    return payload, VRooutyResponse(**response)
+
+
+def orjson_path(param: RequestParam, body: bytes) -> tuple[bytes, VRooutyResponse]:
+    payload = orjson.dumps(param.model_dump(mode="json"))
+    return payload, VRooutyResponse.model_validate(orjson.loads(body))
+
+
+def fast_path(param: RequestParam, body: bytes) -> tuple[bytes, VRooutyResponse]:
+    return encode_request(param=param), decode_response(body=body)
+
+
+def main() -> None:
+    for n_jobs in (10, 10_000):
+        param = make_request_param(n_jobs)
+        body = make_response_body(n_jobs)
+        number = 200 if n_jobs <= 100 else 5
+        print(f"[{n_jobs} jobs]")
+        for name, func in (
+            ("legacy", legacy_path),
+            ("orjson", orjson_path),
+            ("fast", fast_path),
+        ):
+            elapsed = min(
+                timeit.repeat(lambda: func(param, body), number=number, repeat=3)
+            )
+            print(f"  {name:<8}{elapsed / number * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
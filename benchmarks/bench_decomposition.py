@@ -0,0 +1,99 @@
+"""
+Cut Off 이후 경로 : 전체 요청 vs 구역 분할 요청 비교
+
+    python -m benchmarks.bench_decomposition --sizes 1000,3000 --partitions 2,4,8
+
+시나리오 생성기로 만든 요청의 배송 경로(Cut Off 이후 배송 단계)를
+`app.fake.solver.solve`로 풀어 소요 시간, 총 이동 거리, 최종 종료 시각(makespan),
+미배정 Job 수를 비교 (구역은 Thread에서 동시에 계산)
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+# Solver 호출 없이 Controller 단계만 사용
+os.environ.setdefault("VROOUTY_URL", "http://localhost:8000/distribute")
+
+from app.constants.work import WorkStatus
+from app.controllers.jeju_onul_controller import JejuOnulController
+from app.fake.solver import solve as fake_solve
+from app.models.vroouty import RequestParam, VRooutyResponse
+from app.utils.decomposition import makespan, solve_decomposed
+from app.utils.scenario import generate_jeju_request
+
+
+async def solve(param: RequestParam) -> VRooutyResponse:
+    return VRooutyResponse.model_validate(await asyncio.to_thread(fake_solve, param))
+
+
+async def run(param: RequestParam, n_partitions: int, repair_rounds: int) -> dict:
+    started = time.perf_counter()
+    if n_partitions < 2:
+        response = await solve(param)
+    else:
+        response = await solve_decomposed(
+            param=param,
+            solve=solve,
+            n_partitions=n_partitions,
+            repair_rounds=repair_rounds,
+        )
+    elapsed = time.perf_counter() - started
+    return {
+        "seconds": elapsed,
+        "distance": response.summary.distance,
+        "makespan": makespan(response) if not response.unassigned else None,
+        "unassigned": len(response.unassigned),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,3000")
+    parser.add_argument("--vehicles", type=int, default=12)
+    parser.add_argument("--partitions", default="2,4,8")
+    parser.add_argument("--repair-rounds", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'works':>6} {'mode':>14} {'seconds':>8} {'distance(km)':>13}"
+        f" {'makespan(h)':>12} {'unassigned':>10}"
+    )
+    for n_works in (int(size) for size in args.sizes.split(",")):
+        request = generate_jeju_request(
+            n_works=n_works, n_vehicles=args.vehicles, seed=args.seed
+        )
+        controller = JejuOnulController(request=request, client=None)
+        assembly_location = request.assemblies[0].location
+        param = controller.build_wave_after_cut_off_param(
+            job_status_condition=lambda status: status != WorkStatus.DONE.value,
+            vehicle_start_location=lambda vehicle: assembly_location,
+            prefix="delivery",
+        )
+
+        modes = [("monolithic", 1, 0)]
+        for n_partitions in (int(value) for value in args.partitions.split(",")):
+            modes.append((f"k={n_partitions}", n_partitions, 0))
+            if args.repair_rounds:
+                modes.append(
+                    (f"k={n_partitions}+repair", n_partitions, args.repair_rounds)
+                )
+
+        for name, n_partitions, repair_rounds in modes:
+            result = asyncio.run(run(param, n_partitions, repair_rounds))
+            makespan_hours = (
+                f"{result['makespan'] / 3600:12.2f}"
+                if result["makespan"] is not None
+                else f"{'-':>12}"
+            )
+            print(
+                f"{n_works:>6} {name:>14} {result['seconds']:8.2f}"
+                f" {result['distance'] / 1000:13.1f} {makespan_hours}"
+                f" {result['unassigned']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
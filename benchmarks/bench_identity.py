@@ -0,0 +1,56 @@
+"""
+요청 단위 IdHandler의 메모리 사용량 확인
+
+    python -m benchmarks.bench_identity
+
+요청마다 IdHandler를 생성하여 works를 등록한 뒤 버리는 과정을 반복하고,
+구간별 RSS가 증가하지 않는지 출력
+"""
+
+import resource
+import sys
+
+from app.utils.identity import IdHandler
+
+N_REQUESTS = 100_000
+N_WORKS = 50
+N_VEHICLES = 6
+REPORT_EVERY = 10_000
+
+
+def current_rss_kb() -> int:
+    """
+    현재 RSS (KB), /proc 미지원 환경에서는 최대 RSS로 대체
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def simulate_request(seq: int) -> None:
+    id_handler = IdHandler()
+    work_ids = [f"{seq}-{i}" for i in range(N_WORKS)]
+    id_handler.set_many("pickup", work_ids)
+    id_handler.set_many("delivery", work_ids)
+    id_handler.set_many("vehicle", [f"vehicle-{i}" for i in range(N_VEHICLES)])
+
+
+def main() -> None:
+    baseline = None
+    for seq in range(1, N_REQUESTS + 1):
+        simulate_request(seq)
+        if seq % REPORT_EVERY == 0:
+            rss = current_rss_kb()
+            baseline = baseline or rss
+            print(f"{seq:>8} requests  rss={rss:>8} KB  delta={rss - baseline:>6} KB")
+
+    growth = current_rss_kb() - baseline
+    print(f"RSS growth after warm-up: {growth} KB")
+    sys.exit(0 if growth < 1024 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Controller 단계별 메모리 할당 측정 (tracemalloc)
+
+    python -m benchmarks.bench_memory --works 50000
+
+단계별로 새로 남은 할당 Block 수 / 크기와 단계 중 최대 메모리(peak)를 출력
+요청 하나를 처리하는 것처럼 앞 단계 결과는 끝까지 유지
+Solver 응답은 `bench_stages`의 단순 응답 원문을 미리 만든 뒤 Client와 같은 방식으로 파싱
+"""
+
+import argparse
+import asyncio
+import os
+import tracemalloc
+from contextlib import contextmanager
+
+os.environ.setdefault("VROOUTY_URL", "http://localhost:8000/distribute")
+
+from app.controllers.jeju_onul_controller import JejuOnulController
+from app.models.vroouty import VRooutyResponses
+from app.utils.codec import decode_response, encode_response
+from app.utils.scenario import generate_jeju_request
+from benchmarks.bench_stages import round_robin_response
+
+
+@contextmanager
+def traced(stage: str):
+    blocks = sum(
+        stat.count for stat in tracemalloc.take_snapshot().statistics("filename")
+    )
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    yield
+    current, peak = tracemalloc.get_traced_memory()
+    blocks = (
+        sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        - blocks
+    )
+    print(
+        f"{stage:<28} {blocks:>10,} {(current - size) / 2**20:>10.1f} "
+        f"{(peak - size) / 2**20:>10.1f}"
+    )
+
+
+def solver_bodies(request) -> dict:
+    """
+    단계별 요청에 대한 Solver 응답 원문 (측정 전에 별도 Controller로 생성, id 부여 순서는 동일)
+    """
+    controller = JejuOnulController(request=request, client=None)
+    assembly_location = request.assemblies[0].location
+    before_params = controller.build_wave_before_cut_off_params(
+        vehicle_to_works=controller.assign_vehicle_works()
+    )
+    pickup_param = controller.build_wave_after_cut_off_param(
+        job_status_condition=lambda status: status == "waiting",
+        vehicle_start_location=lambda vehicle: vehicle.current_location,
+        prefix="pickup",
+    )
+    delivery_param = controller.build_wave_after_cut_off_param(
+        job_status_condition=lambda status: status != "done",
+        vehicle_start_location=lambda vehicle: assembly_location,
+        prefix="delivery",
+    )
+    return {
+        "before": {
+            vehicle.id: round_robin_response(param).model_dump_json()
+            for vehicle, param in before_params
+        },
+        "pickup": round_robin_response(pickup_param).model_dump_json(),
+        "delivery": round_robin_response(delivery_param).model_dump_json(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--works", type=int, default=50_000)
+    parser.add_argument("--vehicles", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    request = generate_jeju_request(
+        n_works=args.works, n_vehicles=args.vehicles, seed=args.seed
+    )
+    assembly_location = request.assemblies[0].location
+    bodies = solver_bodies(request=request)
+
+    tracemalloc.start()
+    print(f"{'stage':<28} {'blocks':>10} {'MiB':>10} {'peak MiB':>10}")
+    with traced("preprocessing"):
+        controller = JejuOnulController(request=request, client=None)
+
+    with traced("before_job_building"):
+        vehicle_to_works = controller.assign_vehicle_works()
+        before_params = controller.build_wave_before_cut_off_params(
+            vehicle_to_works=vehicle_to_works
+        )
+        relay_params = [
+            controller.build_relay_request_param(
+                vehicle=vehicle, work_indices=vehicle_to_works[vehicle.id]
+            )
+            for vehicle, _ in before_params
+        ]
+
+    with traced("after_job_building"):
+        pickup_param = controller.build_wave_after_cut_off_param(
+            job_status_condition=lambda status: status == "waiting",
+            vehicle_start_location=lambda vehicle: vehicle.current_location,
+            prefix="pickup",
+        )
+        delivery_param = controller.build_wave_after_cut_off_param(
+            job_status_condition=lambda status: status != "done",
+            vehicle_start_location=lambda vehicle: assembly_location,
+            prefix="delivery",
+        )
+
+    with traced("response_decoding"):
+        before_responses = VRooutyResponses(
+            root={
+                vehicle_id: decode_response(body)
+                for vehicle_id, body in bodies["before"].items()
+            }
+        )
+        pickup_response = decode_response(bodies["pickup"])
+        delivery_response = decode_response(bodies["delivery"])
+
+    async def assemble():
+        before = await controller.make_before_wave_response(responses=before_responses)
+        after = await controller.make_combine_after_response(
+            before_tasks=await controller.make_delivery_response(
+                response=pickup_response
+            ),
+            after_tasks=await controller.make_delivery_response(
+                response=delivery_response
+            ),
+        )
+        return before, after
+
+    with traced("response_assembly"):
+        before_response, after_response = asyncio.run(assemble())
+
+    with traced("serialization"):
+        encode_response(before_response)
+        encode_response(after_response)
+
+    current, _ = tracemalloc.get_traced_memory()
+    print(f"{'total (MiB)':<28} {'':>10} {current / 2**20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+권역 지정 방식 비교 (`assign_group_id` 반복 vs `BoundaryIndex.assign` 일괄)
+
+    python -m benchmarks.bench_polygon
+
+`BOUNDARY_LOCATION` 권역에 대해 works 수(1k, 10k, 100k)별로
+수거지/배송지 좌표 2건씩의 권역 지정 시간을 측정
+"""
+
+import time
+
+import numpy as np
+from shapely.geometry import Polygon
+
+from app.constants.boudaries import BOUNDARY_LOCATION
+from app.utils.polygon import BoundaryIndex, assign_group_id
+
+SEED = 0
+
+
+def main() -> None:
+    polygons = {
+        group_id: Polygon(polygon) for group_id, polygon in BOUNDARY_LOCATION.items()
+    }
+    rng = np.random.default_rng(SEED)
+
+    for n_works in (1_000, 10_000, 100_000):
+        # 수거지와 배송지 좌표
+        longitudes = rng.uniform(126.1, 126.95, size=n_works * 2)
+        latitudes = rng.uniform(33.15, 33.6, size=n_works * 2)
+
+        started = time.perf_counter()
+        expected = [
+            assign_group_id(location=[longitude, latitude], polygons=polygons)
+            for longitude, latitude in zip(longitudes, latitudes)
+        ]
+        loop_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        result = BoundaryIndex(polygons=polygons).assign(
+            longitudes=longitudes, latitudes=latitudes
+        )
+        batch_elapsed = time.perf_counter() - started
+
+        assert list(result) == expected
+        print(
+            f"{n_works:>7} works  loop={loop_elapsed * 1000:9.1f} ms  "
+            f"batch={batch_elapsed * 1000:8.1f} ms  "
+            f"x{loop_elapsed / batch_elapsed:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
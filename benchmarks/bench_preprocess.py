@@ -0,0 +1,88 @@
+"""
+Works 전처리(권역 지정, 중복 좌표 판별, 작업 시간 할당) Scaling 측정
+
+    python -m benchmarks.bench_preprocess
+
+- legacy : 중복 좌표를 list로 만들고 works마다 `in` 검사 (기존 방식, 10k까지만)
+- current: `JejuOnulController` 전처리 전체
+works 당 소요 시간이 일정하면 선형
+"""
+
+import os
+import random
+import time
+
+# Solver 호출 없이 전처리만 측정
+os.environ.setdefault("VROOUTY_URL", "http://localhost:8000/distribute")
+
+from app.controllers.jeju_onul_controller import JejuOnulController
+from app.schemas.request import JejuRequest
+
+SEED = 0
+DUPLICATE_RATIO = 0.3
+LEGACY_MAX_WORKS = 10_000
+
+
+def make_request(n_works: int) -> JejuRequest:
+    rng = random.Random(SEED)
+    # 중복 좌표 후보 (아파트 단지, 시장 등)
+    hotspots = [
+        [rng.uniform(126.2, 126.9), rng.uniform(33.2, 33.55)]
+        for _ in range(max(1, n_works // 50))
+    ]
+
+    def location() -> list[float]:
+        if rng.random() < DUPLICATE_RATIO:
+            return rng.choice(hotspots)
+        return [rng.uniform(126.2, 126.9), rng.uniform(33.2, 33.55)]
+
+    return JejuRequest(
+        current_time="2024-06-01T09:00:00",
+        works=[
+            {
+                "id": str(i),
+                "pickup": {"location": location()},
+                "delivery": {"location": location()},
+            }
+            for i in range(n_works)
+        ],
+        vehicles=[],
+        assemblies=[],
+    )
+
+
+def legacy_duplicated(locations: list[tuple[float, float]]) -> list[bool]:
+    counts: dict[tuple[float, float], int] = {}
+    for location in locations:
+        counts[location] = counts.get(location, 0) + 1
+    duplicated = [location for location, count in counts.items() if count >= 2]
+    return [location in duplicated for location in locations]
+
+
+def main() -> None:
+    for n_works in (1_000, 10_000, 100_000):
+        request = make_request(n_works)
+
+        started = time.perf_counter()
+        JejuOnulController(request=request, client=None)
+        elapsed = time.perf_counter() - started
+        line = (
+            f"{n_works:>7} works  current={elapsed * 1000:9.1f} ms "
+            f"({elapsed / n_works * 1e6:5.1f} us/work)"
+        )
+
+        if n_works <= LEGACY_MAX_WORKS:
+            locations = [tuple(work.pickup.location) for work in request.works]
+            started = time.perf_counter()
+            legacy_duplicated(locations)
+            legacy_duplicated([tuple(work.delivery.location) for work in request.works])
+            elapsed = time.perf_counter() - started
+            line += (
+                f"  legacy(dup only)={elapsed * 1000:9.1f} ms "
+                f"({elapsed / n_works * 1e6:7.1f} us/work)"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+응답 직렬화 경로 비교
+
+    python -m benchmarks.bench_response --sizes 1000,10000,50000
+
+- legacy : 응답 Model 생성 시 검증 -> response_model 재검증 및 dict 변환 -> JSONResponse
+- fast   : 검증 없이 생성한 응답 Model -> ModelResponse (pydantic-core에서 한 번에 직렬화)
+
+두 경로의 JSON 출력이 동일한지 확인한 뒤 시간을 측정
+Solver 응답은 `bench_stages`의 단순 응답으로 대체
+
+측정 전 `app/schemas/response.example.json`으로 만든 /before, /after 응답을
+FastAPI response_model 경로(응답 dict를 검증 후 직렬화)와 ModelResponse로 각각 반환하여
+Body가 동일한지 확인
+"""
+
+import argparse
+import asyncio
+import os
+import timeit
+from pathlib import Path
+
+os.environ.setdefault("VROOUTY_URL", "http://localhost:8000/distribute")
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.testclient import TestClient
+from fastapi.utils import create_response_field
+from pydantic import BaseModel
+
+from app.controllers.jeju_onul_controller import JejuOnulController
+from app.models.vroouty import VRooutyResponse, VRooutyResponses
+from app.schemas.request import JejuRequest
+from app.schemas.response import AfterResponse, BeforeResponse
+from app.utils.codec import ModelResponse
+from app.utils.scenario import generate_jeju_request
+from benchmarks.bench_stages import round_robin_response
+
+EXAMPLE_PATH = Path("app/schemas/response.example.json")
+
+
+def build_responses(
+    n_works: int, n_vehicles: int, seed: int
+) -> tuple[BeforeResponse, AfterResponse]:
+    request = generate_jeju_request(n_works=n_works, n_vehicles=n_vehicles, seed=seed)
+    controller = JejuOnulController(request=request, client=None)
+    assembly_location = request.assemblies[0].location
+
+    before_params = controller.build_wave_before_cut_off_params(
+        vehicle_to_works=controller.assign_vehicle_works()
+    )
+    pickup_param = controller.build_wave_after_cut_off_param(
+        job_status_condition=lambda status: status == "waiting",
+        vehicle_start_location=lambda vehicle: vehicle.current_location,
+        prefix="pickup",
+    )
+    delivery_param = controller.build_wave_after_cut_off_param(
+        job_status_condition=lambda status: status != "done",
+        vehicle_start_location=lambda vehicle: assembly_location,
+        prefix="delivery",
+    )
+
+    async def assemble() -> tuple[BeforeResponse, AfterResponse]:
+        before = await controller.make_before_wave_response(
+            responses=VRooutyResponses(
+                root={
+                    vehicle.id: round_robin_response(param)
+                    for vehicle, param in before_params
+                }
+            )
+        )
+        after = await controller.make_combine_after_response(
+            before_tasks=await controller.make_delivery_response(
+                response=round_robin_response(pickup_param)
+            ),
+            after_tasks=await controller.make_delivery_response(
+                response=round_robin_response(delivery_param)
+            ),
+        )
+        return before, after
+
+    return asyncio.run(assemble())
+
+
+def example_responses() -> tuple[BeforeResponse, AfterResponse]:
+    """
+    예시 Solver 응답(차량별)으로 만든 /before, /after 응답
+    예시의 Job / Vehicle id(0 ~ 3)는 Wave 요청과 같은 순서로 부여
+    """
+    examples = VRooutyResponses.model_validate_json(EXAMPLE_PATH.read_bytes())
+    vehicle_ids = list(examples.root)
+    request = JejuRequest(
+        current_time="2024-06-01T09:00:00",
+        works=[
+            {
+                "id": f"work-{index}",
+                "pickup": {"location": route.steps[1].location},
+                "delivery": {"location": route.steps[-1].location},
+            }
+            for index, response in enumerate(examples.root.values())
+            for route in response.routes
+        ],
+        vehicles=[
+            {
+                "id": vehicle_id,
+                "current_location": response.routes[0].steps[0].location,
+                "include": [],
+                "exclude": [],
+            }
+            for vehicle_id, response in examples.root.items()
+        ],
+        assemblies=[{"id": "assembly", "location": [126.5, 33.5]}],
+    )
+    controller = JejuOnulController(request=request, client=None)
+    for work, vehicle_id in zip(request.works, vehicle_ids):
+        controller.id_handler.set("pickup", work.id)
+        controller.id_handler.set("vehicle", vehicle_id)
+
+    async def assemble() -> tuple[BeforeResponse, AfterResponse]:
+        before = await controller.make_before_wave_response(responses=examples)
+        routes = [
+            route for response in examples.root.values() for route in response.routes
+        ]
+        after = await controller.make_combine_after_response(
+            before_tasks=await controller.make_delivery_response(
+                response=VRooutyResponse.model_construct(routes=routes)
+            ),
+            after_tasks=[],
+        )
+        return before, after
+
+    return asyncio.run(assemble())
+
+
+def check_routes(models: list[BaseModel]) -> None:
+    """
+    FastAPI response_model 경로와 ModelResponse 경로의 응답 Body 비교
+    response_model 경로는 응답 dict를 반환하여 필드 검증까지 거치도록 함
+    """
+    app = FastAPI()
+    for index, model in enumerate(models):
+        app.add_api_route(
+            f"/model/{index}",
+            lambda model=model: model.model_dump(),
+            methods=["POST"],
+            response_model=type(model),
+            response_model_exclude_none=True,
+        )
+        app.add_api_route(
+            f"/fast/{index}", lambda model=model: ModelResponse(model), methods=["POST"]
+        )
+
+    with TestClient(app) as client:
+        for index, model in enumerate(models):
+            expected = client.post(f"/model/{index}")
+            actual = client.post(f"/fast/{index}")
+            assert expected.status_code == actual.status_code == 200
+            assert expected.content == actual.content, (
+                f"{type(model).__name__} 응답 불일치"
+            )
+
+
+def legacy(model: BaseModel) -> bytes:
+    """
+    기존 경로 : 생성 시 검증 + FastAPI response_model 처리
+    """
+    field = create_response_field(name="Response", type_=type(model))
+    validated = type(model).model_validate(model.model_dump())
+    content = asyncio.run(
+        serialize_response(field=field, response_content=validated, exclude_none=True)
+    )
+    return JSONResponse(content).body
+
+
+def fast(model: BaseModel) -> bytes:
+    return ModelResponse(model).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--vehicles", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    check_routes(models=list(example_responses()))
+
+    print(f"{'works':>8} {'response':>8} {'tasks':>8} {'legacy':>10} {'fast':>10}")
+    for n_works in (int(size) for size in args.sizes.split(",")):
+        before, after = build_responses(
+            n_works=n_works, n_vehicles=args.vehicles, seed=args.seed
+        )
+        check_routes(models=[before, after])
+        for name, model, vehicle_tasks in (
+            ("before", before, before.vehicle_tasks),
+            ("after", after, after.before_tasks + after.after_tasks),
+        ):
+            assert legacy(model) == fast(model), f"{name} 응답 불일치"
+            n_tasks = sum(len(tasks.tasks) for tasks in vehicle_tasks)
+            timings = {
+                path: min(
+                    timeit.repeat(lambda: func(model), number=1, repeat=args.repeat)
+                )
+                for path, func in (("legacy", legacy), ("fast", fast))
+            }
+            print(
+                f"{n_works:>8} {name:>8} {n_tasks:>8} "
+                f"{timings['legacy'] * 1000:>8.1f}ms {timings['fast'] * 1000:>8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Controller 단계별 벤치마크
+
+    python -m benchmarks.bench_stages --sizes 100,1000,10000,100000 --output bench.jsonl
+
+시나리오 생성기로 만든 요청에 대해 단계별 소요 시간을 측정하고
+JSON Lines 형식으로 출력 (릴리즈 간 성능 비교용)
+Solver 응답은 Job을 차량에 순서대로 나눠 담은 단순 응답으로 대체 (Solver 시간 제외)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+# Solver 호출 없이 Controller 단계만 측정
+os.environ.setdefault("VROOUTY_URL", "http://localhost:8000/distribute")
+
+import numpy as np
+
+from app.controllers.jeju_onul_controller import JejuOnulController
+from app.models.vroouty import RequestParam, VRooutyResponse, VRooutyResponses
+from app.utils.boundary import boundary_registry
+from app.utils.scenario import generate_jeju_request
+
+STAGES = (
+    "boundary_assignment",
+    "preprocessing",
+    "before_job_building",
+    "after_job_building",
+    "make_before_wave_response",
+    "make_combine_after_response",
+    "serialization",
+)
+
+
+def round_robin_response(param: RequestParam) -> VRooutyResponse:
+    """
+    Job을 차량에 순서대로 나눠 담은 VRoouty 형식 응답
+    """
+    vehicles = param.vehicles or []
+    jobs = list(param.jobs)
+    for shipment in param.shipments or []:
+        jobs.extend([shipment.pickup, shipment.delivery])
+
+    def common(**fields) -> dict:
+        return {
+            "service": 0,
+            "duration": 0,
+            "waiting_time": 0,
+            "violations": [],
+            "distance": 0,
+            **fields,
+        }
+
+    routes = []
+    for vehicle_index, vehicle in enumerate(vehicles):
+        end = vehicle.end or vehicle.start
+        steps = [
+            common(type="start", arrival=0, setup=0, location=vehicle.start, location_index=0)
+        ]
+        for order, job in enumerate(jobs[vehicle_index :: len(vehicles)], start=1):
+            steps.append(
+                common(
+                    type="job",
+                    id=job.id,
+                    arrival=order * 60,
+                    setup=job.setup,
+                    service=job.service,
+                    location=job.location,
+                    location_index=order,
+                )
+            )
+        steps.append(
+            common(
+                type="end",
+                arrival=len(steps) * 60,
+                setup=0,
+                location=end,
+                location_index=len(steps),
+            )
+        )
+        routes.append(
+            common(
+                vehicle=vehicle.id,
+                steps=steps,
+                cost=0,
+                setup=0,
+                priority=0,
+                geometry=None,
+            )
+        )
+
+    return VRooutyResponse.model_validate(
+        {
+            "code": 0,
+            "summary": common(
+                routes=len(routes),
+                unassigned=0,
+                setup=0,
+                cost=0,
+                priority=0,
+                computing_times={"loading": 0, "solving": 0, "routing": 0},
+            ),
+            "unassigned": [],
+            "routes": routes,
+        }
+    )
+
+
+def timed(results: dict[str, float], stage: str, func, *args, **kwargs):
+    started = time.perf_counter()
+    value = func(*args, **kwargs)
+    if asyncio.iscoroutine(value):
+        value = asyncio.run(value)
+    results[stage] = min(results.get(stage, float("inf")), time.perf_counter() - started)
+    return value
+
+
+def run_once(n_works: int, n_vehicles: int, seed: int, results: dict[str, float]) -> None:
+    request = generate_jeju_request(n_works=n_works, n_vehicles=n_vehicles, seed=seed)
+
+    # 권역 지정 (수거지 + 배송지)
+    index = boundary_registry.resolve(
+        boundary_set_id=request.boundary_set_id, boundaries=request.boundaries
+    )
+    coords = np.array(
+        [work.pickup.location for work in request.works]
+        + [work.delivery.location for work in request.works],
+        dtype=float,
+    )
+    timed(results, "boundary_assignment", index.assign, coords[:, 0], coords[:, 1])
+
+    controller = timed(
+        results, "preprocessing", JejuOnulController, request=request, client=None
+    )
+
+    # Job 생성
+    before_params = timed(
+        results,
+        "before_job_building",
+        lambda: controller.build_wave_before_cut_off_params(
+            vehicle_to_works=controller.assign_vehicle_works()
+        ),
+    )
+    assembly_location = request.assemblies[0].location
+    pickup_param, delivery_param = timed(
+        results,
+        "after_job_building",
+        lambda: (
+            controller.build_wave_after_cut_off_param(
+                job_status_condition=lambda status: status == "waiting",
+                vehicle_start_location=lambda vehicle: vehicle.current_location,
+                prefix="pickup",
+            ),
+            controller.build_wave_after_cut_off_param(
+                job_status_condition=lambda status: status != "done",
+                vehicle_start_location=lambda vehicle: assembly_location,
+                prefix="delivery",
+            ),
+        ),
+    )
+
+    # 응답 조합
+    before_responses = VRooutyResponses(
+        root={
+            vehicle.id: round_robin_response(param) for vehicle, param in before_params
+        }
+    )
+    before_response = timed(
+        results,
+        "make_before_wave_response",
+        controller.make_before_wave_response,
+        responses=before_responses,
+    )
+
+    async def combine():
+        pickup_tasks = await controller.make_delivery_response(
+            response=round_robin_response(pickup_param)
+        )
+        delivery_tasks = await controller.make_delivery_response(
+            response=round_robin_response(delivery_param)
+        )
+        return await controller.make_combine_after_response(
+            before_tasks=pickup_tasks, after_tasks=delivery_tasks
+        )
+
+    after_response = timed(results, "make_combine_after_response", combine)
+
+    # 직렬화
+    timed(
+        results,
+        "serialization",
+        lambda: (
+            before_response.model_dump_json(by_alias=True, exclude_none=True),
+            after_response.model_dump_json(by_alias=True, exclude_none=True),
+        ),
+    )
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100,1000,10000,100000")
+    parser.add_argument("--vehicles", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="JSON Lines 출력 파일 (기본 stdout)")
+    args = parser.parse_args()
+
+    meta = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+    output = open(args.output, "a") if args.output else sys.stdout
+    try:
+        for n_works in (int(size) for size in args.sizes.split(",")):
+            results: dict[str, float] = {}
+            repeat = args.repeat if n_works <= 10_000 else 1
+            for _ in range(repeat):
+                run_once(n_works, args.vehicles, args.seed, results)
+            for stage in STAGES:
+                record = {
+                    **meta,
+                    "works": n_works,
+                    "vehicles": args.vehicles,
+                    "stage": stage,
+                    "seconds": round(results[stage], 6),
+                }
+                output.write(json.dumps(record) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
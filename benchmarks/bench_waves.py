@@ -0,0 +1,105 @@
+"""
+Cut Off 이후 수거/배송 경로 요청 : 순차 vs 동시(pipelined) 비교
+
+    python -m benchmarks.bench_waves --sizes 200,1000,3000 --latency 0.2
+
+같은 요청을 두 방식으로 처리하여 /after 응답(JSON)이 동일한지 확인한 뒤 소요 시간 비교
+Solver는 `app.fake.solver.solve`를 Thread에서 실행하고, 호출마다 `latency`초 지연을 더함
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+# Solver 호출은 Fake Solver로 대체
+os.environ.setdefault("VROOUTY_URL", "http://localhost:8000/distribute")
+
+from app.controllers.jeju_onul_controller import JejuOnulController
+from app.fake.solver import solve as fake_solve
+from app.models.vroouty import RequestParam, VRooutyResponse
+from app.utils.codec import encode_response
+from app.utils.scenario import generate_jeju_request
+
+STATUS_MIX = {"waiting": 0.6, "shipped": 0.3, "done": 0.1}
+
+
+class FakeClient:
+    """
+    `VRooutyClient.request` 대체 (Fake Solver + 고정 지연)
+    """
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.calls = 0
+
+    async def request(self, param: RequestParam) -> VRooutyResponse:
+        self.calls += 1
+        response, _ = await asyncio.gather(
+            asyncio.to_thread(fake_solve, param), asyncio.sleep(self.latency)
+        )
+        return VRooutyResponse.model_validate(response)
+
+
+async def after_wave(
+    n_works: int, n_vehicles: int, seed: int, latency: float, pipelined: bool
+) -> tuple[bytes, float, int]:
+    """
+    /after 처리와 같은 순서로 응답 생성 (응답 JSON, 소요 시간, Solver 호출 수)
+    """
+    request = generate_jeju_request(
+        n_works=n_works, n_vehicles=n_vehicles, seed=seed, status_mix=STATUS_MIX
+    )
+    client = FakeClient(latency=latency)
+    controller = JejuOnulController(request=request, client=client)
+
+    started = time.perf_counter()
+    to_pickup_result, to_delivery_result = (
+        await controller.process_waves_after_cut_off(pipelined=pipelined)
+    )
+    elapsed = time.perf_counter() - started
+
+    response = await controller.make_combine_after_response(
+        before_tasks=await controller.make_pickup_response(response=to_pickup_result),
+        after_tasks=await controller.make_delivery_response(
+            response=to_delivery_result
+        ),
+    )
+    return encode_response(response), elapsed, client.calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="200,1000,3000")
+    parser.add_argument("--vehicles", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'works':>8} {'calls':>6} {'sequential':>12} {'pipelined':>12}")
+    for n_works in (int(size) for size in args.sizes.split(",")):
+        results = {
+            pipelined: asyncio.run(
+                after_wave(
+                    n_works=n_works,
+                    n_vehicles=args.vehicles,
+                    seed=args.seed,
+                    latency=args.latency,
+                    pipelined=pipelined,
+                )
+            )
+            for pipelined in (False, True)
+        }
+        (sequential, sequential_seconds, calls), (pipelined, pipelined_seconds, _) = (
+            results[False],
+            results[True],
+        )
+        assert sequential == pipelined, f"{n_works} works : /after 응답 불일치"
+        print(
+            f"{n_works:>8} {calls:>6} {sequential_seconds * 1000:>10.1f}ms "
+            f"{pipelined_seconds * 1000:>10.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,33 @@
-import cProfile
-import io
-import os
-import pstats
-from fastapi import FastAPI, Request
-from app.router import router
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from app.constants.client import VROOUTY_CACHE_SIZE
+from app.constants.matrix import MATRIX_ENABLED
+from app.constants.profiling import PROFILE_ENABLED
+from app.router import admin_router, router
+from app.utils.aiohttp import VRooutyClient
+from app.utils.cache import SolverCache
+from app.utils.matrix import MatrixEngine
+from app.utils.profiling import profile_request
 
-app = FastAPI(title="Jeju VRoouty Simulator", version="1.0.0")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # VRoouty Connection Pool은 App 수명 동안 유지
+    app.state.vroouty_client = VRooutyClient(
+        cache=SolverCache() if VROOUTY_CACHE_SIZE > 0 else None,
+        matrix=MatrixEngine() if MATRIX_ENABLED else None,
+    )
+    await app.state.vroouty_client.start()
+    yield
+    await app.state.vroouty_client.close()
 
-app.include_router(router=router)
-
-
-# @app.middleware("http")
-# async def profile(request: Request, call_next):
-#     profiler = cProfile.Profile()
-#     profiler.enable()
 
-#     response = await call_next(request)
+app = FastAPI(title="Jeju VRoouty Simulator", version="1.0.0", lifespan=lifespan)
 
-#     profiler.disable()
-#     stream = io.StringIO()
-#     stats = pstats.Stats(profiler, stream=stream)
 
-#     current_dir = os.path.dirname(os.path.abspath(__file__))
-#     project_dir = os.path.basename(current_dir)
-
-#     def filter_and_trim_stats(stats, limit=10):
-#         filtered_stats = pstats.Stats()
-#         for func, (cc, nc, tt, ct, callers) in stats.stats.items():
-#             filename, lineno, funcname = func
-#             if current_dir in filename:
-#                 trimmed_filename = filename.split(project_dir, 1)[-1]
-#                 trimmed_func = (trimmed_filename, lineno, funcname)
-#                 filtered_stats.stats[trimmed_func] = (cc, nc, tt, ct, callers)
-#         return filtered_stats.sort_stats(pstats.SortKey.TIME).print_stats(limit)
-
-#     stats.sort_stats(pstats.SortKey.TIME)
-#     filter_and_trim_stats(stats, limit=10)
+app.include_router(router=router)
+app.include_router(router=admin_router)
 
-#     print(stream.getvalue())
-#     return response
+# 요청 단위 CPU Profiling (`X-Profile: 1` Header 또는 Sampling, 결과는 /admin/profiles)
+if PROFILE_ENABLED:
+    app.middleware("http")(profile_request)